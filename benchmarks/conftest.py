@@ -0,0 +1,276 @@
+"""오프라인 벤치마크 스위트 공통 fixture
+
+네트워크 없이 로컬 HTTP 서버가 Velog 트렌딩 페이지와 유튜브 Atom 피드 fixture를 제공하고,
+각 벤치마크의 전체 시간, 단계별 시간(utils.metrics), 피크 메모리(tracemalloc)를 기록합니다.
+
+환경 변수:
+    BENCH_THRESHOLDS  회귀 기준 파일 (기본값: benchmarks/thresholds.json)
+    BENCH_TOLERANCE   기준값에 곱할 배수 (기본값: 1.0, 느린 머신에서는 2.0 등)
+    BENCH_REPORT      결과를 JSON으로 저장할 경로 (없으면 저장하지 않음)
+"""
+import gc
+import hashlib
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from fixtures import velog_config, youtube_config
+from utils.metrics import METRICS
+
+DEFAULT_THRESHOLDS = os.path.join(BENCH_DIR, 'thresholds.json')
+
+
+class FixtureServer:
+    """경로별 응답 본문을 등록해 두고 돌려주는 로컬 HTTP 서버 (GET/POST, ETag/304 지원)"""
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+        self.bodies = []
+        self.failures = {}
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def do_GET(self):
+                server.requests.append(self.path)
+                route = server.routes.get(self.path) or server.routes.get(self.path.split('?', 1)[0])
+                failure = server.failures.get(self.path)
+                if failure and failure[0] > 0:
+                    failure[0] -= 1
+                    self.send_response(failure[1])
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+                if route is None:
+                    self.send_response(404)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                body, content_type, etag = route
+                if self.headers.get('If-None-Match') == etag:
+                    self.send_response(304)
+                    self.send_header('ETag', etag)
+                    self.send_header('Content-Length', '0')
+                    self.end_headers()
+                    return
+
+                self.send_response(200)
+                self.send_header('Content-Type', content_type)
+                self.send_header('Content-Length', str(len(body)))
+                self.send_header('ETag', etag)
+                self.end_headers()
+                self.wfile.write(body)
+
+            def do_POST(self):
+                # GraphQL 같은 POST 요청도 같은 경로 표로 응답 (요청 본문은 기록만 함)
+                length = int(self.headers.get('Content-Length') or 0)
+                server.bodies.append(self.rfile.read(length))
+                self.do_GET()
+
+            def log_message(self, format, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.httpd.daemon_threads = True
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self.thread.start()
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f'http://{host}:{port}'
+
+    def url(self, path):
+        return self.base_url + path
+
+    def add(self, path, body, content_type='text/html; charset=utf-8'):
+        """경로(쿼리 포함 가능)에 응답 등록"""
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        self.routes[path] = (body, content_type, etag)
+
+    def fail(self, path, times, status=503):
+        """경로의 다음 times번 요청에 오류 상태 코드로 응답"""
+        self.failures[path] = [times, status]
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+class BenchRecorder:
+    """벤치마크 결과를 모으고 회귀 기준과 비교"""
+
+    def __init__(self, thresholds, tolerance):
+        self.thresholds = thresholds
+        self.tolerance = tolerance
+        self.results = {}
+
+    @contextmanager
+    def measure(self, name):
+        """
+        블록 실행의 전체 시간, 단계별 시간, 피크 메모리 측정
+
+        tracemalloc을 켠 상태에서 재므로 시간에는 추적 비용이 포함됩니다.
+        기준값(thresholds.json)도 같은 조건에서 잰 값입니다.
+
+        Yields:
+            dict: 결과 딕셔너리 (블록 안에서 항목 수 등을 추가할 수 있음)
+        """
+        result = {}
+        METRICS.reset()
+        gc.collect()
+        tracemalloc.start()
+        started = time.perf_counter()
+        try:
+            yield result
+        finally:
+            elapsed = time.perf_counter() - started
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+        stages = {}
+        snapshot = METRICS.snapshot()
+        for data in snapshot['feeds'].values():
+            for stage_name, stats in data['stages'].items():
+                stages[stage_name] = round(stages.get(stage_name, 0.0) + stats['seconds'], 6)
+        counters = {}
+        for data in snapshot['feeds'].values():
+            for counter_name, value in data['counters'].items():
+                counters[counter_name] = counters.get(counter_name, 0) + value
+
+        result.update({
+            'seconds': round(elapsed, 6),
+            'peak_mb': round(peak / 1024 / 1024, 3),
+            'stages': stages,
+            'counters': counters
+        })
+        self.results[name] = result
+        self.check(name, result)
+
+    def check(self, name, result):
+        """기준을 넘은 항목이 있으면 테스트 실패"""
+        limits = self.thresholds.get(name)
+        if not limits:
+            return
+        problems = []
+        for key in ('seconds', 'peak_mb'):
+            if key in limits and result[key] > limits[key] * self.tolerance:
+                problems.append(f"{key} {result[key]} > {limits[key] * self.tolerance:g}")
+        for stage_name, limit in limits.get('stages', {}).items():
+            value = result['stages'].get(stage_name, 0.0)
+            if value > limit * self.tolerance:
+                problems.append(f"stage {stage_name} {value} > {limit * self.tolerance:g}")
+        if problems:
+            pytest.fail(f"성능 회귀 [{name}]: " + ', '.join(problems))
+
+
+def _load_thresholds():
+    path = os.environ.get('BENCH_THRESHOLDS', DEFAULT_THRESHOLDS)
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+_recorder = BenchRecorder(_load_thresholds(), float(os.environ.get('BENCH_TOLERANCE', '1.0')))
+
+
+@pytest.fixture(scope='session')
+def fixture_server():
+    """Velog/유튜브 fixture를 제공하는 로컬 HTTP 서버"""
+    server = FixtureServer()
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def bench():
+    """결과 기록기 (bench.measure(name))"""
+    return _recorder
+
+
+@pytest.fixture
+def workdir(tmp_path, monkeypatch):
+    """docs/와 state/를 임시 디렉토리에 쓰도록 작업 디렉토리 변경"""
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.fixture
+def youtube_feeds(fixture_server, workdir, monkeypatch):
+    """
+    youtube_feeds(sizes): 채널 크기별 피드 설정 (fixture 서버 등록 포함)
+
+    youtube_channel.load_config도 같은 설정을 돌려주도록 바꾸므로 바로 main()을 실행할 수 있습니다.
+    돌려받은 설정을 고치면 다음 실행에 그대로 반영됩니다.
+    """
+    from crawlers import youtube_channel
+
+    def configure(sizes):
+        config = youtube_config(fixture_server, sizes)
+        monkeypatch.setattr(youtube_channel, 'load_config', lambda: config)
+        return config
+    return configure
+
+
+@pytest.fixture
+def velog_feed(fixture_server, workdir, monkeypatch):
+    """velog_feed(size, sources): 트렌딩 fixture를 등록하고 velog_trending.load_config를 바꾼 피드 설정"""
+    from crawlers import velog_trending
+
+    def configure(size, sources):
+        config = velog_config(fixture_server, size, sources)
+        monkeypatch.setattr(velog_trending, 'load_config', lambda: config)
+        return config
+    return configure
+
+
+@pytest.fixture(scope='session')
+def browser_pool():
+    """공유 BrowserPool (Chromium을 띄울 수 없으면 브라우저 벤치마크는 건너뜀)"""
+    from utils.browser_pool import BrowserPool
+
+    pool = BrowserPool()
+
+    async def probe(page):
+        await page.set_content('<p>ok</p>')
+
+    try:
+        pool.run(probe, timeout=60)
+    except Exception as e:
+        pool.close()
+        pytest.skip(f"Chromium을 실행할 수 없습니다: {str(e).splitlines()[0]}")
+    yield pool
+    pool.close()
+
+
+def pytest_terminal_summary(terminalreporter):
+    """벤치마크 결과 표 출력 (BENCH_REPORT가 있으면 JSON 저장)"""
+    if not _recorder.results:
+        return
+    terminalreporter.section('benchmarks')
+    for name, result in _recorder.results.items():
+        stages = ', '.join(f"{stage_name} {seconds * 1000:.1f}ms" for stage_name, seconds in result['stages'].items())
+        terminalreporter.write_line(
+            f"{name:36} {result['seconds'] * 1000:10.1f}ms  peak {result['peak_mb']:8.2f}MB  {stages}"
+        )
+
+    report_path = os.environ.get('BENCH_REPORT')
+    if report_path:
+        with open(report_path, 'w', encoding='utf-8') as f:
+            json.dump(_recorder.results, f, ensure_ascii=False, indent=2)
+        terminalreporter.write_line(f"결과 저장: {report_path}")
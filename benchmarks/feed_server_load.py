@@ -0,0 +1,161 @@
+"""피드 서버 부하 테스트
+
+utils.feed_server와 `python -m http.server`를 각각 새 프로세스로 띄우고, 여러 연결에서
+같은 피드를 계속 요청해 초당 요청 수와 응답 바이트를 비교합니다.
+
+사용법:
+    python benchmarks/feed_server_load.py --file velog-trending.xml --connections 8 --seconds 3
+"""
+import os
+import sys
+import time
+import socket
+import argparse
+import threading
+import subprocess
+import http.client
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 요청 종류 → 추가 헤더 (conditional의 If-None-Match는 첫 응답의 ETag로 채움)
+SCENARIOS = {
+    'identity': {},
+    'gzip': {'Accept-Encoding': 'gzip'},
+    'br': {'Accept-Encoding': 'br, gzip'},
+    'conditional': {'Accept-Encoding': 'gzip', 'If-None-Match': None},
+}
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def start_server(kind, root, port):
+    """
+    서버 프로세스 시작 (연결을 받을 때까지 대기)
+
+    Args:
+        kind: 'feed_server' 또는 'http.server'
+        root: 제공할 디렉토리
+        port: 포트
+
+    Returns:
+        subprocess.Popen
+    """
+    if kind == 'feed_server':
+        args = ['-m', 'utils.feed_server', '--root', root, '--port', str(port), '--quiet']
+    else:
+        args = ['-m', 'http.server', str(port), '--bind', '127.0.0.1', '--directory', root]
+    process = subprocess.Popen([sys.executable, *args], cwd=ROOT, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    deadline = time.monotonic() + 10
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('127.0.0.1', port), timeout=0.2).close()
+            return process
+        except OSError:
+            time.sleep(0.05)
+    process.kill()
+    raise RuntimeError(f"{kind} 서버가 시작되지 않았습니다")
+
+
+def request(connection, path, headers):
+    connection.request('GET', path, headers=headers)
+    response = connection.getresponse()
+    body = response.read()
+    return response, body
+
+
+def run_load(port, path, headers, connections, seconds):
+    """
+    연결마다 스레드 하나로 seconds초 동안 계속 요청
+
+    서버가 연결을 닫으면(HTTP/1.0) 새로 연결해 이어서 요청합니다.
+
+    Returns:
+        dict: {requests, bytes, errors, statuses, rps}
+    """
+    totals = {'requests': 0, 'bytes': 0, 'errors': 0, 'statuses': set()}
+    lock = threading.Lock()
+    stop_at = time.perf_counter() + seconds
+
+    def worker():
+        connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+        done = size = errors = 0
+        statuses = set()
+        while time.perf_counter() < stop_at:
+            try:
+                response, body = request(connection, path, headers)
+                done += 1
+                size += len(body)
+                statuses.add(response.status)
+                if response.will_close:
+                    connection.close()
+            except (OSError, http.client.HTTPException):
+                errors += 1
+                connection.close()
+        connection.close()
+        with lock:
+            totals['requests'] += done
+            totals['bytes'] += size
+            totals['errors'] += errors
+            totals['statuses'] |= statuses
+
+    started = time.perf_counter()
+    threads = [threading.Thread(target=worker) for _ in range(connections)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+
+    totals['rps'] = totals['requests'] / elapsed
+    return totals
+
+
+def main():
+    parser = argparse.ArgumentParser(description='피드 서버 부하 테스트 (초당 요청 수)')
+    parser.add_argument('--root', default='docs', help='제공할 디렉토리 (기본값: docs)')
+    parser.add_argument('--file', default='velog-trending.xml', help='요청할 파일 (기본값: velog-trending.xml)')
+    parser.add_argument('--connections', type=int, default=8, help='동시 연결 수')
+    parser.add_argument('--seconds', type=float, default=3.0, help='시나리오별 측정 시간(초)')
+    parser.add_argument('--servers', nargs='+', default=['feed_server', 'http.server'],
+                        choices=['feed_server', 'http.server'], help='비교할 서버')
+    args = parser.parse_args()
+
+    path = '/' + args.file
+    if not os.path.exists(os.path.join(ROOT, args.root, args.file)):
+        parser.error(f"{args.root}/{args.file} 파일이 없습니다 (먼저 make run)")
+
+    for kind in args.servers:
+        port = free_port()
+        process = start_server(kind, args.root, port)
+        print(f"🌐 {kind} ({args.connections}개 연결, 시나리오별 {args.seconds:g}초)")
+        try:
+            for name, scenario in SCENARIOS.items():
+                headers = dict(scenario)
+                if 'If-None-Match' in headers:
+                    connection = http.client.HTTPConnection('127.0.0.1', port, timeout=5)
+                    response, _ = request(connection, path, {'Accept-Encoding': headers['Accept-Encoding']})
+                    connection.close()
+                    etag = response.getheader('ETag')
+                    if etag is None:
+                        print(f"  {name:12} ETag 없음 (건너뜀)")
+                        continue
+                    headers['If-None-Match'] = etag
+
+                result = run_load(port, path, headers, args.connections, args.seconds)
+                average = result['bytes'] / result['requests'] if result['requests'] else 0
+                statuses = ','.join(str(status) for status in sorted(result['statuses']))
+                print(f"  {name:12} {result['rps']:9.0f} req/s  평균 {average / 1024:8.1f}KB  "
+                      f"상태 {statuses}  오류 {result['errors']}")
+        finally:
+            process.terminate()
+            process.wait()
+        print()
+
+
+if __name__ == '__main__':
+    main()
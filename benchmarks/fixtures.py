@@ -0,0 +1,244 @@
+"""벤치마크용 가짜 피드 데이터 생성"""
+import json
+import xml.etree.ElementTree as ET
+from datetime import datetime, timedelta, timezone
+from xml.sax.saxutils import escape, quoteattr
+
+YOUTUBE_ATOM_HEADER = """<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns:yt="http://www.youtube.com/xml/schemas/2015" xmlns:media="http://search.yahoo.com/mrss/" xmlns="http://www.w3.org/2005/Atom">
+ <link rel="self" href="http://www.youtube.com/feeds/videos.xml?channel_id={channel_id}"/>
+ <id>yt:channel:{channel_id}</id>
+ <yt:channelId>{channel_id}</yt:channelId>
+ <title>{channel_title}</title>
+ <link rel="alternate" href="https://www.youtube.com/channel/{channel_id}"/>
+ <author>
+  <name>{channel_title}</name>
+  <uri>https://www.youtube.com/channel/{channel_id}</uri>
+ </author>
+ <published>2015-01-01T00:00:00+00:00</published>
+"""
+
+YOUTUBE_ATOM_ENTRY = """ <entry>
+  <id>yt:video:{video_id}</id>
+  <yt:videoId>{video_id}</yt:videoId>
+  <yt:channelId>{channel_id}</yt:channelId>
+  <title>{title}</title>
+  <link rel="alternate" href={link}/>
+  <author>
+   <name>{channel_title}</name>
+   <uri>https://www.youtube.com/channel/{channel_id}</uri>
+  </author>
+  <published>{published}</published>
+  <updated>{published}</updated>
+  <media:group>
+   <media:title>{title}</media:title>
+   <media:content url="https://www.youtube.com/v/{video_id}?version=3" type="application/x-shockwave-flash" width="640" height="390"/>
+   <media:thumbnail url="https://i2.ytimg.com/vi/{video_id}/hqdefault.jpg" width="480" height="360"/>
+   <media:description>{description}</media:description>
+   <media:community>
+    <media:starRating count="12" average="5.00" min="1" max="5"/>
+    <media:statistics views="3456"/>
+   </media:community>
+  </media:group>
+ </entry>
+"""
+
+TITLES = [
+    '[팀네이버 컨퍼런스 DAN 24] 대규모 트래픽 처리 사례',
+    'INFCON 2024 │인프콘 - 개발자 커리어 이야기',
+    '주간 개발 뉴스 & 코드 리뷰 <라이브>',
+    '초보자를 위한 Python 성능 최적화',
+    '#shorts 1분 팁: git rebase',
+]
+
+
+def make_youtube_atom(count, channel_id='UCbenchmark0000000000000', channel_title='Benchmark Channel'):
+    """
+    유튜브 채널 피드와 같은 구조의 Atom 문서 생성
+
+    Args:
+        count: entry 개수
+        channel_id: 채널 ID
+        channel_title: 채널 이름
+
+    Returns:
+        bytes: Atom XML
+    """
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    parts = [YOUTUBE_ATOM_HEADER.format(channel_id=channel_id, channel_title=escape(channel_title))]
+    for i in range(count):
+        video_id = f'vid{i:08d}'
+        title = f'{TITLES[i % len(TITLES)]} #{i}'
+        path = f'/shorts/{video_id}' if i % len(TITLES) == 4 else f'/watch?v={video_id}'
+        parts.append(YOUTUBE_ATOM_ENTRY.format(
+            video_id=video_id,
+            channel_id=channel_id,
+            channel_title=escape(channel_title),
+            title=escape(title),
+            link=quoteattr(f'https://www.youtube.com{path}'),
+            published=(start - timedelta(hours=i)).isoformat(),
+            description=escape(f'{title}\n\n발표 자료와 타임라인은 설명란을 확인하세요. & 구독 부탁드립니다 ' * 3)
+        ))
+    parts.append('</feed>\n')
+    return ''.join(parts).encode('utf-8')
+
+
+VELOG_TRENDING_HEADER = """<!DOCTYPE html>
+<html lang="ko">
+<head>
+<meta charset="utf-8">
+<title>velog</title>
+<link rel="stylesheet" href="/static/velog.css">
+<link rel="preload" href="/static/font.woff2" as="font" type="font/woff2" crossorigin>
+</head>
+<body>
+<div id="root">
+<main class="Layout_main__2XmAs">
+<ul class="PostCardGrid_block__6Vv2h">
+"""
+
+VELOG_POST_CARD = """<li class="PostCard_block__FTMsy">
+  <a class="PostCard_styleLink__c2XJf" href="/@{username}/{slug}">
+    <div class="RatioImage_block__oHyvS"><img src="/static/thumbnail-{index}.png" alt="post-thumbnail"></div>
+  </a>
+  <div class="PostCard_content__wBIaS">
+    <a class="PostCard_styleLink__c2XJf" href="/@{username}/{slug}">
+      <h4 class="PostCard_h4__nmhOf">{title}</h4>
+      <div class="PostCard_descriptionWrapper__W0XGi"><p class="PostCard_clamp___2g_C">{summary}</p></div>
+    </a>
+    <div class="PostCard_subInfo__pSYSD"><span>{date_text}</span><span class="separator">·</span><span>{comments}개의 댓글</span></div>
+  </div>
+  <div class="PostCard_footer__h_xP1">
+    <a class="PostCard_userInfo__UT3Mi" href="/@{username}/posts"><img src="/static/avatar-{index}.png" alt="user thumbnail of {username}"><span>by <b>{username}</b></span></a>
+    <div class="PostCard_likes__8gDMs">{likes}</div>
+  </div>
+</li>
+"""
+
+VELOG_DATE_TEXTS = ['방금 전', '3시간 전', '2일 전', '6일 전', '2026년 1월 5일']
+
+
+def velog_trending_posts(count):
+    """HTML과 API fixture가 함께 쓰는 트렌딩 게시글 데이터"""
+    for i in range(count):
+        yield {
+            'index': i,
+            'username': f'writer{i % 17}',
+            'slug': f'benchmark-post-{i}',
+            'title': f'{TITLES[i % len(TITLES)]} - 트렌딩 #{i}',
+            'summary': f'게시글 {i}의 요약입니다. 성능 & 메모리 측정을 위한 본문 미리보기 ' * 4,
+            'date_text': VELOG_DATE_TEXTS[i % len(VELOG_DATE_TEXTS)],
+            'released_at': (datetime(2026, 1, 10, tzinfo=timezone.utc) - timedelta(hours=i)).isoformat(),
+            'comments': i % 9,
+            'likes': 100 - i % 100
+        }
+
+
+def make_velog_trending_html(count):
+    """
+    Velog 트렌딩 페이지의 PostCard 마크업을 흉내 낸 정적 HTML 생성
+
+    크롤러가 쓰는 셀렉터(li/h4/p/div[class*="PostCard..."])와 같은 구조이며,
+    썸네일/폰트/스타일시트 요청도 포함해 리소스 차단 경로를 함께 탑니다.
+
+    Args:
+        count: 카드 개수
+
+    Returns:
+        bytes: HTML
+    """
+    parts = [VELOG_TRENDING_HEADER]
+    for post in velog_trending_posts(count):
+        parts.append(VELOG_POST_CARD.format(**{
+            **post,
+            'title': escape(post['title']),
+            'summary': escape(post['summary'])
+        }))
+    parts.append('</ul>\n</main>\n</div>\n</body>\n</html>\n')
+    return ''.join(parts).encode('utf-8')
+
+
+def make_velog_trending_api(count):
+    """
+    Velog GraphQL trendingPosts 응답 (make_velog_trending_html()과 같은 게시글)
+
+    Args:
+        count: 게시글 개수
+
+    Returns:
+        bytes: JSON
+    """
+    posts = [
+        {
+            'title': post['title'],
+            'short_description': post['summary'],
+            'url_slug': post['slug'],
+            'released_at': post['released_at'],
+            'user': {'username': post['username']}
+        }
+        for post in velog_trending_posts(count)
+    ]
+    return json.dumps({'data': {'trendingPosts': posts}}, ensure_ascii=False).encode('utf-8')
+
+
+def rss_item_count(path):
+    """RSS 파일의 item 개수"""
+    return len(ET.parse(path).getroot().findall('channel/item'))
+
+
+def youtube_config(fixture_server, sizes):
+    """채널 피드 크기별 피드 설정 (fixture 서버 등록 포함)"""
+    feeds = {}
+    for size in sizes:
+        channel_id = f'UCbench{size:08d}'
+        fixture_server.add(
+            f'/feeds/videos.xml?channel_id={channel_id}',
+            make_youtube_atom(size, channel_id),
+            'application/atom+xml; charset=utf-8'
+        )
+        feeds[f'youtube_{size}'] = {
+            'name': f'벤치마크 채널 {size}',
+            'description': '벤치마크',
+            'crawler': 'youtube_channel',
+            'channel_id': channel_id,
+            'exclude_shorts': True,
+            'output': f'youtube-{size}.xml'
+        }
+    return {
+        'http': {'http2': False, 'timeout': 20},
+        'crawlers': {
+            'youtube_channel': {
+                'concurrency': 4,
+                'parser': 'fast',
+                'feed_url': fixture_server.url('/feeds/videos.xml?channel_id={channel_id}')
+            }
+        },
+        'feeds': feeds
+    }
+
+
+def velog_config(fixture_server, size, sources):
+    """트렌딩 페이지와 GraphQL 응답을 fixture 서버에 등록한 피드 설정"""
+    path = f'/trending/week-{size}'
+    fixture_server.add(path, make_velog_trending_html(size))
+    fixture_server.add(f'/graphql-{size}', make_velog_trending_api(size), 'application/json')
+    return {
+        'http': {'http2': False, 'timeout': 20},
+        'feeds': {
+            'velog_trending': {
+                'name': 'Velog 트렌딩',
+                'description': '벤치마크',
+                'crawler': 'velog_trending',
+                'url': fixture_server.url(path),
+                'api_url': fixture_server.url(f'/graphql-{size}'),
+                'sources': sources,
+                'extraction': 'batch',
+                'page_load': {
+                    'wait_until': 'domcontentloaded',
+                    'block_resource_types': ['image', 'media', 'font'],
+                    'block_trackers': True
+                },
+                'output': 'velog-trending.xml'
+            }
+        }
+    }
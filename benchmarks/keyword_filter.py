@@ -0,0 +1,83 @@
+"""키워드 필터 성능 비교 (기존 키워드 루프 vs 컴파일된 KeywordFilter)"""
+import os
+import sys
+import time
+import random
+import argparse
+
+# 상위 디렉토리 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.keyword_filter import KeywordFilter
+
+SYLLABLES = [chr(code) for code in range(0xAC00, 0xAC00 + 400)]
+LATIN = 'abcdefghijklmnopqrstuvwxyz'
+
+
+def random_word(rng, length):
+    pool = SYLLABLES if rng.random() < 0.5 else LATIN
+    return ''.join(rng.choice(pool) for _ in range(length))
+
+
+def make_keywords(rng, count):
+    return list({random_word(rng, rng.randint(3, 8)) for _ in range(count)})
+
+
+def make_entries(rng, count, keywords, hit_ratio=0.05):
+    entries = []
+    for _ in range(count):
+        words = [random_word(rng, rng.randint(2, 6)) for _ in range(rng.randint(5, 12))]
+        if rng.random() < hit_ratio:
+            words.insert(rng.randrange(len(words)), rng.choice(keywords).upper())
+        entries.append({'title': ' '.join(words), 'summary': ''})
+    return entries
+
+
+def naive_filter(entries, keywords):
+    """crawl_youtube_channel()이 쓰던 키워드 루프"""
+    result = []
+    for entry in entries:
+        title_lower = entry['title'].lower()
+        for keyword in keywords:
+            if keyword.lower() in title_lower:
+                result.append(entry)
+                break
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--keywords', type=int, nargs='+', default=[10, 1000, 5000])
+    parser.add_argument('--entries', type=int, nargs='+', default=[1000, 20000])
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'키워드':>8s} {'항목':>8s} {'컴파일':>10s} {'기존 루프':>12s} {'KeywordFilter':>14s} {'배율':>8s}")
+    for keyword_count in args.keywords:
+        keywords = make_keywords(rng, keyword_count)
+
+        started = time.perf_counter()
+        keyword_filter = KeywordFilter(include=keywords)
+        compile_s = time.perf_counter() - started
+
+        for entry_count in args.entries:
+            entries = make_entries(rng, entry_count, keywords)
+
+            started = time.perf_counter()
+            expected = naive_filter(entries, keywords)
+            naive_s = time.perf_counter() - started
+
+            started = time.perf_counter()
+            actual = keyword_filter.apply(entries)
+            compiled_s = time.perf_counter() - started
+
+            assert actual == expected, "필터 결과가 다릅니다"
+            print(
+                f"{keyword_count:8d} {entry_count:8d} {compile_s * 1000:8.1f}ms "
+                f"{naive_s * 1000:10.1f}ms {compiled_s * 1000:12.1f}ms {naive_s / compiled_s:7.1f}x"
+            )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,99 @@
+"""RSS 작성기 비교 (feedgen vs 스트리밍 작성기)
+
+케이스마다 별도 프로세스에서 실행해 피크 RSS(ru_maxrss)를 잽니다.
+lxml이 C에서 잡는 메모리는 tracemalloc에 잡히지 않기 때문입니다.
+state/와 docs/는 임시 디렉토리에 쓰므로 저장소를 건드리지 않습니다.
+"""
+import os
+import re
+import sys
+import json
+import time
+import argparse
+import tempfile
+import resource
+import subprocess
+from datetime import datetime, timedelta, timezone
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def generate_posts(count):
+    """최신 글부터 게시글을 하나씩 생성 (이미 정렬된 순서)"""
+    base = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    for i in range(count, 0, -1):
+        yield {
+            'title': f'벤치마크 게시글 {i} - RSS & XML <테스트>',
+            'link': f'https://example.com/posts/{i}',
+            'summary': f'게시글 {i}의 요약입니다. ' * 8,
+            'author': f'작성자{i % 50}',
+            'date': base + timedelta(minutes=i)
+        }
+
+
+def run_case(writer, count, output_path):
+    """자식 프로세스에서 실행: 피드 하나를 만들고 시간과 피크 메모리 출력"""
+    sys.path.insert(0, ROOT)
+    from utils.rss_generator import create_rss_feed
+
+    feed_info = {'title': '벤치마크 피드', 'link': 'https://example.com', 'description': 'RSS 작성기 벤치마크'}
+    baseline = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+    started = time.perf_counter()
+    if writer == 'stream':
+        # 저장소에서 한 건씩 읽어 오는 경우처럼 이터레이터 그대로 전달
+        create_rss_feed(feed_info, generate_posts(count), output_path, writer='stream', presorted=True)
+    else:
+        create_rss_feed(feed_info, list(generate_posts(count)), output_path, writer='feedgen', presorted=True)
+    elapsed = time.perf_counter() - started
+
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({'elapsed': elapsed, 'peak_kb': peak, 'growth_kb': peak - baseline}))
+
+
+def measure(writer, count, workdir):
+    """자식 프로세스로 케이스 하나 실행"""
+    output_path = os.path.join('docs', f'{writer}-{count}.xml')
+    result = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), '--case', writer, str(count), output_path],
+        cwd=workdir, capture_output=True, text=True, check=True
+    )
+    stats = json.loads(result.stdout.strip().splitlines()[-1])
+    stats['path'] = os.path.join(workdir, output_path)
+    return stats
+
+
+def read_without_build_date(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return re.sub(r'<lastBuildDate>.*?</lastBuildDate>', '', f.read())
+
+
+def main():
+    parser = argparse.ArgumentParser(description='RSS 작성기 처리량/피크 메모리 비교')
+    parser.add_argument('--items', type=int, nargs='+', default=[1000, 10000, 100000])
+    parser.add_argument('--case', nargs=3, metavar=('WRITER', 'COUNT', 'OUTPUT'), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.case:
+        writer, count, output_path = args.case
+        run_case(writer, int(count), output_path)
+        return
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for count in args.items:
+            reference = measure('feedgen', count, workdir)
+            stream = measure('stream', count, workdir)
+            size = os.path.getsize(stream['path'])
+
+            print(f"📄 {count:,}개 item ({size / 1024 / 1024:.1f}MB)")
+            for name, stats in (('feedgen', reference), ('stream', stream)):
+                print(f"  {name:8} {stats['elapsed'] * 1000:9.1f}ms  {count / stats['elapsed']:10,.0f} items/s  "
+                      f"피크 메모리 증가 {stats['growth_kb'] / 1024:7.1f}MB")
+            print(f"  ⚡ {reference['elapsed'] / stream['elapsed']:.1f}배 빠름, "
+                  f"피크 메모리 {(reference['growth_kb'] - stream['growth_kb']) / 1024:.1f}MB 절감")
+            same = read_without_build_date(reference['path']) == read_without_build_date(stream['path'])
+            print("  ✅ 출력 동일 (lastBuildDate 제외)\n" if same else "  ❌ 출력이 다릅니다\n")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,78 @@
+"""오케스트레이터 시작 시간 벤치마크
+
+`run_all.py --list`(크롤러를 import하지 않음)와 모든 크롤러를 미리 import하는 경우를
+매번 새 프로세스로 실행해 벽시계 시간과 `-X importtime`의 모듈별 누적 import 시간을 비교합니다.
+"""
+import os
+import re
+import sys
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# 시작 경로에서 import되면 안 되는 무거운 모듈
+HEAVY_MODULES = ('playwright', 'feedparser', 'feedgen', 'httpx', 'crawlers.velog_trending', 'crawlers.youtube_channel')
+
+CASES = {
+    'run_all --list': [os.path.join(ROOT, 'run_all.py'), '--list'],
+    'import run_all': ['-c', 'import run_all'],
+    'import 모든 크롤러': ['-c', 'import run_all, crawlers.velog_trending, crawlers.youtube_channel'],
+}
+
+_IMPORTTIME = re.compile(r'import time:\s+\d+ \|\s+(\d+) \|(\s*)(\S+)')
+
+
+def run_once(args):
+    """
+    새 프로세스로 한 번 실행
+
+    Returns:
+        tuple: (벽시계 시간(초), {최상위 import 모듈: 누적 import 시간(초)})
+    """
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', *args],
+        cwd=ROOT, capture_output=True, text=True, check=True
+    )
+    elapsed = time.perf_counter() - started
+
+    modules = {}
+    for line in result.stderr.splitlines():
+        match = _IMPORTTIME.match(line)
+        if match:
+            modules[match.group(3)] = int(match.group(1)) / 1_000_000
+    return elapsed, modules
+
+
+def loaded_heavy_modules(modules):
+    """import된 모듈 중 무거운 모듈 (하위 모듈은 최상위 이름으로 묶음)"""
+    return sorted({name for name in HEAVY_MODULES for module in modules if module == name or module.startswith(name + '.')})
+
+
+def main():
+    parser = argparse.ArgumentParser(description='오케스트레이터 시작 시간 비교')
+    parser.add_argument('--runs', type=int, default=5, help='케이스별 반복 횟수 (중앙값 출력)')
+    args = parser.parse_args()
+
+    for name, case_args in CASES.items():
+        timings = []
+        modules = {}
+        for _ in range(args.runs):
+            elapsed, modules = run_once(case_args)
+            timings.append(elapsed)
+
+        heavy = loaded_heavy_modules(modules)
+        print(f"🚀 {name}")
+        print(f"  중앙값 {statistics.median(timings) * 1000:8.1f}ms  (최소 {min(timings) * 1000:.1f}ms, {args.runs}회)")
+        print(f"  무거운 모듈: {', '.join(heavy) if heavy else '없음'}")
+        for module in heavy:
+            if module in modules:
+                print(f"    {module:28} {modules[module] * 1000:7.1f}ms")
+        print()
+
+
+if __name__ == '__main__':
+    main()
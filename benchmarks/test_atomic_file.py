@@ -0,0 +1,18 @@
+"""원자적 파일 쓰기 테스트"""
+import os
+import stat
+
+from utils.atomic_file import atomic_write
+
+
+def test_atomic_write_file_mode(workdir):
+    # 새 파일은 open()으로 만든 파일과 같은 권한 (mkstemp의 0600이 아님)
+    with open('plain.xml', 'w'):
+        pass
+    atomic_write('docs/feed.xml', 'a')
+    assert stat.S_IMODE(os.stat('docs/feed.xml').st_mode) == stat.S_IMODE(os.stat('plain.xml').st_mode)
+
+    # 기존 파일은 권한을 그대로 유지
+    os.chmod('docs/feed.xml', 0o640)
+    atomic_write('docs/feed.xml', 'b')
+    assert stat.S_IMODE(os.stat('docs/feed.xml').st_mode) == 0o640
@@ -0,0 +1,93 @@
+"""피드 서버 테스트 (요청 헤더 해석, 캐시, 304)"""
+import gzip
+import http.client
+import os
+import threading
+
+import pytest
+
+from fixtures import make_youtube_atom
+from utils.atomic_file import atomic_write
+from utils.feed_server import ENCODINGS, create_server, etag_matches, parse_accept_encoding
+
+
+@pytest.mark.parametrize('header, expected', [
+    (None, 'identity'),
+    ('', 'identity'),
+    ('gzip', 'gzip'),
+    ('GZIP, deflate', 'gzip'),
+    ('gzip;q=0', 'identity'),
+    ('gzip;q=abc', 'identity'),
+    ('deflate, identity', 'identity'),
+    ('*', ENCODINGS[0]),
+    ('*, gzip;q=0', 'br' if 'br' in ENCODINGS else 'identity'),
+    ('br;q=0.5, gzip;q=0.8', 'gzip'),
+])
+def test_parse_accept_encoding(header, expected):
+    assert parse_accept_encoding(header) == expected
+
+
+@pytest.mark.parametrize('header, expected', [
+    (None, False),
+    ('*', True),
+    ('"abc"', True),
+    ('W/"abc"', True),
+    ('"other", "abc"', True),
+    ('"other"', False),
+    ('"abc-gzip"', False),
+])
+def test_etag_matches(header, expected):
+    assert etag_matches(header, '"abc"') is expected
+
+
+def test_feed_server_cache(workdir, bench):
+    body = make_youtube_atom(500, 'UCserve')
+    atomic_write('docs/feed.xml', body)
+    server = create_server('docs', port=0, quiet=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    connection = http.client.HTTPConnection(*server.server_address[:2], timeout=5)
+
+    def get(path, **headers):
+        connection.request('GET', path, headers=headers)
+        response = connection.getresponse()
+        return response, response.read()
+
+    try:
+        response, data = get('/feed.xml')
+        etag = response.getheader('ETag')
+        assert response.status == 200 and data == body
+
+        # gzip 표현은 ETag가 다르고, 같은 ETag로 다시 요청하면 304
+        response, data = get('/feed.xml', **{'Accept-Encoding': 'gzip'})
+        gzip_etag = response.getheader('ETag')
+        assert response.getheader('Content-Encoding') == 'gzip' and gzip.decompress(data) == body
+        assert gzip_etag != etag
+        with bench.measure('feed_server[500 requests, 304]'):
+            for _ in range(500):
+                response, data = get('/feed.xml', **{'Accept-Encoding': 'gzip', 'If-None-Match': gzip_etag})
+                assert response.status == 304 and data == b''
+
+        # 파일을 다시 쓰면 캐시가 무효화되어 새 내용과 새 ETag로 응답
+        atomic_write('docs/feed.xml', body.replace(b'UCserve', b'UCserv2'))
+        response, data = get('/feed.xml', **{'If-None-Match': etag})
+        assert response.status == 200 and b'UCserv2' in data
+        assert response.getheader('ETag') != etag
+        assert server.cache.misses == 2
+
+        # 아카이브 페이지 같은 하위 디렉토리 파일도 제공
+        atomic_write('docs/archive/feed/0001-20240101.xml', body)
+        response, data = get('/archive/feed/0001-20240101.xml')
+        assert response.status == 200 and data == body
+
+        # docs/ 밖의 파일(심볼릭 링크 포함), 숨김/임시 파일, 알 수 없는 확장자는 제공하지 않음
+        atomic_write('docs/notes.txt', 'x')
+        atomic_write('secret.json', '{}')
+        os.symlink(os.path.abspath('secret.json'), 'docs/archive/secret.json')
+        for path in ('/../config.json', '/%2e%2e/config.json', '/archive/../../secret.json', '/archive/secret.json',
+                     '/.feed.xml.tmp', '/archive/.hidden/feed.xml', '/archive//feed/0001-20240101.xml',
+                     '/notes.txt', '/missing.xml', '/archive/feed/'):
+            assert get(path)[0].status == 404, path
+    finally:
+        connection.close()
+        server.shutdown()
+        server.server_close()
@@ -0,0 +1,61 @@
+"""항목 이력 저장소 테스트"""
+import sqlite3
+import threading
+from datetime import datetime, timezone
+
+from utils.item_store import ItemStore
+
+OLD_SCHEMA = """
+CREATE TABLE items (
+    feed_id    TEXT NOT NULL,
+    link       TEXT NOT NULL,
+    url        TEXT,
+    title      TEXT,
+    summary    TEXT,
+    author     TEXT,
+    published  TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL,
+    PRIMARY KEY (feed_id, link)
+);
+"""
+
+
+def test_item_store_concurrent_migration(workdir):
+    # 업그레이드 후 첫 실행처럼 여러 크롤러가 예전 스키마 DB를 동시에 열어도 한 번만 마이그레이션
+    for trial in range(5):
+        path = f'state/old-{trial}.db'
+        ItemStore(path).close()
+        conn = sqlite3.connect(path)
+        conn.executescript('DROP TABLE items;' + OLD_SCHEMA)
+        conn.close()
+
+        barrier = threading.Barrier(8)
+        errors = []
+
+        def open_store():
+            barrier.wait()
+            try:
+                ItemStore(path).close()
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=open_store) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        with ItemStore(path) as store:
+            assert store._missing_columns() == []
+
+
+def test_item_store_link_variants(workdir):
+    # 같은 글의 다른 표기(끝 슬래시, 대소문자, fragment)는 한 항목이고 모두 처음 본 시각을 받음
+    seen_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    links = ['https://velog.io/@a/post', 'https://velog.io/@a/post/', 'HTTPS://Velog.io/@a/post#top']
+    with ItemStore('state/items.db') as store:
+        first_seen = store.observe('velog_trending', [{'link': link} for link in links], seen_at=seen_at)
+        assert first_seen == {link: seen_at for link in links}
+        assert store.count('velog_trending') == 1
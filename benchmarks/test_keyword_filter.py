@@ -0,0 +1,52 @@
+"""키워드 필터 규칙 테스트"""
+import pytest
+
+from utils.keyword_filter import KeywordFilter
+
+
+def test_keyword_filter_inactive_passes_everything():
+    keyword_filter = KeywordFilter.from_config({})
+    assert not keyword_filter.active
+    assert keyword_filter.match({'title': '아무 제목'}) is True
+
+
+def test_keyword_filter_literals_fold_case():
+    keyword_filter = KeywordFilter(include=['Python', 'straße'])
+    assert keyword_filter.match({'title': 'PYTHON 3.13 릴리스'})
+    assert keyword_filter.match({'title': 'Die STRASSE'})
+    assert keyword_filter.match({'title': 'Rust 1.80'}) is None
+    # 키워드 목록 가운데 다른 키워드의 접두사가 있어도 부분 문자열로 찾음
+    assert KeywordFilter(include=['ab', 'abc']).match({'title': 'xxabyy'})
+
+
+def test_keyword_filter_regex_uses_original_text():
+    # 정규식 규칙은 원래 텍스트에 적용하므로 대문자와 ß가 들어간 패턴도 걸림
+    keyword_filter = KeywordFilter(include=[{'regex': r'DAN\s?2[45]'}, {'regex': 'Straße'}, {'regex': '(?i)rust'}])
+    assert keyword_filter.match({'title': 'DAN 24 키노트'})
+    assert keyword_filter.match({'title': 'Die Straße'})
+    assert keyword_filter.match({'title': 'RUST 1.80'})
+    # 대소문자를 무시하려면 (?i)를 붙여야 함
+    assert keyword_filter.match({'title': 'dan 24'}) is None
+
+
+def test_keyword_filter_fields_and_exclude():
+    keyword_filter = KeywordFilter.from_config({
+        'filter_keywords': ['DAN'],
+        'filters': {
+            'include': [{'keyword': '컨퍼런스', 'fields': ['description']}],
+            'exclude': ['shorts', {'keyword': '예고', 'fields': ['summary']}]
+        }
+    })
+    assert keyword_filter.match({'title': 'DAN 24 키노트', 'summary': ''})
+    assert keyword_filter.match({'title': '발표', 'summary': '개발자 컨퍼런스 세션'})
+    assert keyword_filter.match({'title': '컨퍼런스', 'summary': ''}) is None
+    # 제외 규칙이 포함 규칙보다 우선
+    assert keyword_filter.match({'title': 'DAN 24 #Shorts', 'summary': ''}) is None
+    assert keyword_filter.match({'title': 'DAN 24', 'summary': '다음 주 예고'}) is None
+    # 값이 없는 필드는 빈 문자열로 검사
+    assert keyword_filter.match({'title': 'DAN 24'})
+
+
+def test_keyword_filter_unknown_field():
+    with pytest.raises(ValueError):
+        KeywordFilter(include=[{'keyword': 'x', 'fields': ['author']}])
@@ -0,0 +1,65 @@
+"""크롤링 로그 (JSON Lines 저널, 회전, 집계, 상태 인덱스) 테스트"""
+import glob
+import json
+import os
+
+from utils.logger import CrawlLogger, load_feed_status
+
+
+def write_entries(logger, statuses):
+    for i, status in enumerate(statuses):
+        if status == 'success':
+            logger.log_success('feed', i)
+        else:
+            logger.log_failure('feed', f'오류 {i}')
+        logger.save()
+
+
+def test_crawl_log_rotation_and_compaction(workdir):
+    # 항목 두 개마다 회전하고, 회전 파일은 하나만 남김
+    logger = CrawlLogger(max_bytes=200, keep_rotated=1)
+    write_entries(logger, ['success'] * 6)
+
+    assert len(glob.glob('state/crawl_log.*.jsonl')) == 1
+    summary = logger.load_summary()
+    assert summary['compacted_files'] == 1
+    assert summary['feeds']['feed']['runs'] == 2 and summary['feeds']['feed']['successes'] == 2
+
+    # 지워진 항목은 뷰와 recent()에서 빠지지만 상태 인덱스는 전체 실행 수를 유지
+    assert [entry['count'] for entry in logger.recent()] == [2, 3, 4, 5]
+    with open('docs/crawl_log.json', 'r', encoding='utf-8') as f:
+        assert len(json.load(f)['history']) == 4
+    assert load_feed_status()['feed']['runs'] == 6
+
+
+def test_feed_status_rebuild(workdir):
+    logger = CrawlLogger(max_bytes=200, keep_rotated=1)
+    write_entries(logger, ['success', 'failure', 'failure', 'success', 'failure', 'failure'])
+    incremental = load_feed_status()['feed']
+
+    # 인덱스가 없어지면 집계와 남은 로그로 다시 만듦
+    os.remove('state/feed_status.json')
+    logger.log_success('other', 1)
+    logger.save()
+    rebuilt = load_feed_status()
+
+    assert rebuilt['other']['runs'] == 1
+    for key in ('runs', 'successes', 'success_rate', 'last_failure', 'last_error', 'consecutive_failures'):
+        assert rebuilt['feed'][key] == incremental[key], key
+    assert incremental['consecutive_failures'] == 2 and incremental['runs'] == 6
+
+
+def test_feed_status_rebuild_from_compacted_successes(workdir):
+    # 성공 기록이 집계로 합쳐진 회전 파일에만 있어도 다시 만든 인덱스에 마지막 성공 시각이 남음
+    logger = CrawlLogger(max_bytes=200, keep_rotated=1)
+    write_entries(logger, ['success', 'success', 'failure', 'failure', 'failure', 'failure'])
+    assert all(entry['status'] == 'failure' for entry in logger.recent())
+    incremental = load_feed_status()['feed']
+
+    os.remove('state/feed_status.json')
+    logger.log_success('other', 1)
+    logger.save()
+    rebuilt = load_feed_status()['feed']
+
+    assert rebuilt == incremental
+    assert rebuilt['last_success'] is not None and rebuilt['consecutive_failures'] == 4
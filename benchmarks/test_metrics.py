@@ -0,0 +1,32 @@
+"""계측 저장 테스트 (마지막 실행 파일과 실행별 이력)"""
+import json
+
+from utils.metrics import METRICS, append_history, count, feed_scope, write_metrics
+
+
+def test_write_metrics_appends_history(workdir):
+    for run in range(3):
+        METRICS.reset()
+        with feed_scope('feed'):
+            count('items_fetched', run)
+        write_metrics()
+
+    # metrics.json은 마지막 실행만, metrics.jsonl에는 실행마다 한 줄씩 남음
+    with open('state/metrics.json', 'r', encoding='utf-8') as f:
+        assert json.load(f)['feeds']['feed']['counters'] == {'items_fetched': 2}
+    with open('state/metrics.jsonl', 'r', encoding='utf-8') as f:
+        history = [json.loads(line) for line in f]
+    assert [run['feeds']['feed']['counters']['items_fetched'] for run in history] == [0, 1, 2]
+
+
+def test_metrics_history_is_capped(workdir):
+    snapshots = [{'run': run, 'padding': 'x' * 80} for run in range(50)]
+    for snapshot in snapshots:
+        append_history(snapshot, 'state/metrics.jsonl', max_bytes=1000)
+
+    with open('state/metrics.jsonl', 'rb') as f:
+        data = f.read()
+    runs = [json.loads(line)['run'] for line in data.splitlines()]
+    # 오래된 실행부터 지워지고 최근 실행은 순서대로 남음
+    assert len(data) <= 1000 and runs[-1] == 49
+    assert runs == list(range(runs[0], 50))
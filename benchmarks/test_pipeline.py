@@ -0,0 +1,53 @@
+"""FeedItem과 처리 파이프라인 테스트"""
+from datetime import datetime, timezone
+
+import pytest
+
+from utils.item_store import ItemStore
+from utils.pipeline import FeedItem, ObserveItems, Pipeline, dedupe, filter_items, normalize
+
+
+@pytest.mark.parametrize('kind', ['dict', 'FeedItem'])
+def test_feed_item_memory(kind, bench):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    # 문자열은 미리 만들어 두어 항목 컨테이너 자체의 크기만 비교
+    titles = [f'게시글 {i}' for i in range(100000)]
+    links = [f'https://example.com/posts/{i}' for i in range(100000)]
+    make = dict if kind == 'dict' else FeedItem
+
+    with bench.measure(f'items[{kind}, 100000]'):
+        items = [make(title=title, link=link, summary='', author='writer', date=base) for title, link in zip(titles, links)]
+
+    assert len(items) == 100000
+    if kind == 'FeedItem':
+        assert not hasattr(items[0], '__dict__')
+        assert dict(items[0]) == items[0].to_dict() and items[0]['link'] == links[0]
+
+
+def test_pipeline_stages(workdir):
+    store = ItemStore('state/items.db')
+    posts = [{'title': f'글 {i}', 'link': f'https://example.com/{i % 80}', 'summary': 'Python' if i % 2 else ''}
+             for i in range(100)]
+    observed = ObserveItems(store, 'pipeline', datetime(2026, 1, 1, tzinfo=timezone.utc), batch_size=16)
+    kept = []
+    items = Pipeline(posts, normalize, dedupe(), filter_items(lambda item: item.summary == 'Python'), observed)
+    items.on_done(kept.append)
+
+    result = list(items)
+    assert all(isinstance(item, FeedItem) for item in result)
+    assert [item.link for item in result] == [f'https://example.com/{i}' for i in range(1, 80, 2)]
+    assert kept == [40] and items.count == 40 and observed.new_items == 40
+    store.close()
+
+
+def test_observe_items_link_variants(workdir):
+    # 같은 글의 다른 표기가 한 배치에 들어와도 (dedupe 단계 없이) 같은 처음 본 시각을 받음
+    store = ItemStore('state/items.db')
+    seen_at = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    observed = ObserveItems(store, 'pipeline', seen_at, first_seen_as_date=True)
+    posts = [{'link': 'https://example.com/a'}, {'link': 'https://example.com/a/'}, {'link': 'HTTPS://example.com/b#top'}]
+
+    result = list(Pipeline(posts, normalize, observed))
+    assert [item.date for item in result] == [seen_at] * 3
+    assert observed.new_items == 2
+    store.close()
@@ -0,0 +1,61 @@
+"""트래픽 녹화/재생 오프라인 벤치마크"""
+import glob
+import os
+
+import pytest
+
+import run_all
+from crawlers import youtube_channel
+from fixtures import rss_item_count
+from utils.context import CrawlContext
+from utils.http_client import create_http_client
+from utils.recording import TrafficRecorder
+
+
+def test_youtube_channel_replay(youtube_feeds, fixture_server, monkeypatch, bench):
+    config = youtube_feeds([500])
+
+    recorder = TrafficRecorder('record', 'recordings')
+    with create_http_client(config['http'], recorder=recorder) as client:
+        youtube_channel.main(CrawlContext(http_client=client))
+    recorder.save()
+
+    # 재생은 서버 응답 없이 녹화본만으로, HTTP 캐시의 ETag가 있어도 304 없이 파싱~쓰기 전체 경로를 다시 탐
+    monkeypatch.delitem(fixture_server.routes, f'/feeds/videos.xml?channel_id=UCbench{500:08d}')
+    assert os.path.exists('state/http_cache.json')
+
+    replay = TrafficRecorder('replay', 'recordings')
+    with bench.measure('youtube_channel[500, replay]') as result:
+        with create_http_client(config['http'], recorder=replay) as client:
+            results = youtube_channel.main(CrawlContext(http_client=client))
+
+    assert results == {'youtube_500': True}
+    assert replay.hits == 1 and replay.misses == 0
+    assert {'parse', 'filter'} <= set(result['stages'])
+    assert rss_item_count('docs/youtube-500.xml') == 400
+
+
+def test_run_all_replay_keeps_outputs(youtube_feeds, fixture_server, workdir, monkeypatch):
+    config = youtube_feeds([15])
+    monkeypatch.setattr(run_all, 'load_config', lambda: config)
+    monkeypatch.setattr(run_all, 'update_readme_feed_status', lambda: None)
+    run_all.main(['--record', 'recordings'])
+
+    def snapshot():
+        return {
+            path: os.stat(path).st_mtime_ns
+            for path in glob.glob('docs/*') + glob.glob('state/*')
+        }
+
+    before = snapshot()
+    # 재생은 README도 건드리지 않음
+    monkeypatch.setattr(run_all, 'update_readme_feed_status', lambda: pytest.fail('README를 갱신함'))
+    monkeypatch.delitem(fixture_server.routes, f'/feeds/videos.xml?channel_id=UCbench{15:08d}')
+    run_all.main(['--replay', 'recordings'])
+
+    # 출력과 상태는 녹화 디렉토리 아래 작업 디렉토리에만 씀
+    replay_dir = workdir / 'recordings' / 'replay'
+    assert os.getcwd() == str(replay_dir)
+    assert rss_item_count(replay_dir / 'docs' / 'youtube-15.xml') == 12
+    os.chdir(workdir)
+    assert snapshot() == before
@@ -0,0 +1,69 @@
+"""create_rss_feed()와 압축본/매니페스트 오프라인 벤치마크"""
+import gzip
+import json
+import os
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from fixtures import rss_item_count
+from utils.feed_server import create_server
+from utils.rss_generator import create_rss_feed
+
+RSS_SIZES = [1000, 10000]
+
+
+@pytest.mark.parametrize('writer', ['stream', 'feedgen'])
+@pytest.mark.parametrize('size', RSS_SIZES)
+def test_create_rss_feed(size, writer, workdir, bench):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    posts = [
+        {
+            'title': f'벤치마크 게시글 {i} & <RSS>',
+            'link': f'https://example.com/posts/{i}',
+            'summary': f'게시글 {i}의 요약입니다. ' * 8,
+            'author': 'writer',
+            'date': base - timedelta(minutes=i)
+        }
+        for i in range(size)
+    ]
+    feed_info = {'title': '벤치마크', 'link': 'https://example.com', 'description': 'create_rss_feed'}
+
+    with bench.measure(f'create_rss_feed[{writer}, {size}]'):
+        create_rss_feed(feed_info, posts, 'docs/bench.xml', writer=writer)
+
+    assert os.path.exists('docs/bench.xml')
+    assert rss_item_count('docs/bench.xml') == size
+
+
+def test_feed_artifacts(workdir):
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    posts = [{'title': f'글 {i}', 'link': f'https://example.com/{i}', 'date': base - timedelta(hours=i)} for i in range(200)]
+    feed_info = {'title': '압축본', 'link': 'https://example.com', 'description': 'feed_artifacts'}
+    create_rss_feed(feed_info, posts, 'docs/feed.xml')
+
+    with open('docs/feed.xml', 'rb') as f:
+        body = f.read()
+    with open('docs/feed.xml.gz', 'rb') as f:
+        assert gzip.decompress(f.read()) == body
+    with open('docs/manifest.json', 'r', encoding='utf-8') as f:
+        entry = json.load(f)['feed.xml']
+    assert entry['size'] == len(body)
+    assert entry['encodings']['gzip']['path'] == 'feed.xml.gz'
+    assert entry['encodings']['gzip']['size'] == os.path.getsize('docs/feed.xml.gz')
+
+    # 피드 서버도 매니페스트와 같은 ETag로 응답
+    server = create_server('docs', port=0, quiet=True)
+    assert server.cache.representation(server.cache.get(server.cache.resolve('/feed.xml')), 'gzip')[1] == \
+        entry['encodings']['gzip']['etag']
+    server.server_close()
+
+    # 내용이 같으면 압축본도 다시 쓰지 않음
+    mtime = os.stat('docs/feed.xml.gz').st_mtime_ns
+    create_rss_feed(feed_info, posts, 'docs/feed.xml')
+    assert os.stat('docs/feed.xml.gz').st_mtime_ns == mtime
+
+    # 기존 출력에 압축본이 없으면 한 번 만들어 둠
+    os.remove('docs/feed.xml.gz')
+    create_rss_feed(feed_info, posts, 'docs/feed.xml')
+    assert os.path.exists('docs/feed.xml.gz')
@@ -0,0 +1,161 @@
+"""오케스트레이터(run_all.py) 오프라인 테스트: 브레이커, 실행 기한, 데몬, 시작 시간"""
+import os
+import threading
+
+import run_all
+from crawlers import youtube_channel
+from startup import CASES, loaded_heavy_modules, run_once
+from utils.context import CrawlContext
+from utils.http_client import create_http_client
+from utils.logger import CrawlLogger, load_feed_status
+from utils.resilience import CircuitBreakers, RunDeadline
+
+
+def test_circuit_breaker_keeps_last_good_feed(youtube_feeds, fixture_server):
+    config = youtube_feeds([15])
+    config['resilience'] = {'retry': {'attempts': 1}}
+    feeds = config['feeds']
+    breakers = CircuitBreakers(failure_threshold=2)
+
+    assert run_all.run_feeds(feeds) == {'youtube_15': True}
+    with open('docs/youtube-15.xml', 'rb') as f:
+        last_good = f.read()
+
+    fixture_server.fail(f'/feeds/videos.xml?channel_id=UCbench{15:08d}', 2, 500)
+    for _ in range(2):
+        results = run_all.run_feeds(feeds)
+        assert results == {'youtube_15': False}
+        run_all.record_breakers(results, breakers)
+
+    # 브레이커가 열리면 건너뛰고 마지막으로 성공한 RSS를 그대로 둠
+    runnable, skipped = run_all.skip_open_breakers(feeds, breakers)
+    assert runnable == {} and skipped == {'youtube_15': None}
+    with open('docs/youtube-15.xml', 'rb') as f:
+        assert f.read() == last_good
+
+    status = load_feed_status()['youtube_15']
+    assert status['last_status'] == 'skipped'
+    assert status['consecutive_failures'] == 2
+    assert status['breaker']['state'] == 'open'
+
+
+def test_run_deadline_skips_work(youtube_feeds):
+    config = youtube_feeds([15])
+    deadline = RunDeadline()
+    deadline.start(5)
+
+    # 남은 시간이 min_start보다 적으면 크롤러를 시작하지 않음
+    assert run_all.run_feeds(config['feeds'], deadline=deadline, min_start=30) == {'youtube_15': None}
+    assert not os.path.exists('docs/youtube-15.xml')
+    assert CrawlLogger().recent()[-1]['status'] == 'skipped'
+
+
+def test_timed_out_crawler_is_cancelled(youtube_feeds, monkeypatch):
+    config = youtube_feeds([15])
+    config['feeds']['youtube_15']['timeout'] = 0.3
+    crawl = youtube_channel.crawl_youtube_channel
+    release = threading.Event()
+
+    def slow_crawl(*args, **kwargs):
+        release.wait(10)
+        return crawl(*args, **kwargs)
+    monkeypatch.setattr(youtube_channel, 'crawl_youtube_channel', slow_crawl)
+
+    assert run_all.run_feeds(config['feeds']) == {'youtube_15': False}
+    stuck = run_all._running['youtube_channel']
+
+    # 지난 실행의 스레드가 아직 돌고 있으면 같은 크롤러를 다시 시작하지 않음
+    assert run_all.run_feeds(config['feeds']) == {'youtube_15': None}
+
+    # 늦게 끝난 스레드는 취소 신호를 보고 RSS도 성공 로그도 남기지 않음
+    release.set()
+    stuck.join(10)
+    assert 'youtube_channel' not in run_all._running
+    assert not os.path.exists('docs/youtube-15.xml')
+    assert [entry['status'] for entry in CrawlLogger().recent()] == ['failure', 'skipped']
+
+
+def test_timed_out_feed_keeps_finished_feeds(youtube_feeds, monkeypatch):
+    config = youtube_feeds([15, 16])
+    for feed_config in config['feeds'].values():
+        feed_config['timeout'] = 1
+    crawl = youtube_channel.crawl_youtube_channel
+    release = threading.Event()
+
+    def hang_channel_16(client, channel_id, *args, **kwargs):
+        if channel_id.endswith('16'):
+            release.wait(10)
+        return crawl(client, channel_id, *args, **kwargs)
+    monkeypatch.setattr(youtube_channel, 'crawl_youtube_channel', hang_channel_16)
+
+    # 같은 크롤러의 한 채널만 멈추면 그 채널만 실패하고, 이미 끝난 채널은 성공으로 남음
+    assert run_all.run_feeds(config['feeds']) == {'youtube_15': True, 'youtube_16': False}
+    assert os.path.exists('docs/youtube-15.xml') and not os.path.exists('docs/youtube-16.xml')
+    entries = CrawlLogger().recent()
+    assert [entry['status'] for entry in entries if entry['feed'] == 'youtube_15'] == ['success']
+    assert [entry['status'] for entry in entries if entry['feed'] == 'youtube_16'] == ['failure']
+    status = load_feed_status()
+    assert status['youtube_15']['last_status'] == 'success' and status['youtube_15']['consecutive_failures'] == 0
+
+    # 늦게 끝난 채널은 RSS도 로그도 남기지 않음
+    release.set()
+    stuck = run_all._running.get('youtube_channel')
+    if stuck:
+        stuck.join(10)
+    assert not os.path.exists('docs/youtube-16.xml')
+    assert len(CrawlLogger().recent()) == 2
+
+
+def test_daemon_adapts_interval(youtube_feeds, monkeypatch, bench):
+    config = youtube_feeds([15])
+    # README.md는 저장소 루트 기준으로 갱신되므로 테스트에서는 건너뜀
+    monkeypatch.setattr(run_all, 'update_readme_feed_status', lambda: None)
+    daemon_config = {'interval_minutes': 60, 'min_interval_minutes': 15, 'max_interval_minutes': 240}
+
+    with create_http_client(config['http']) as client:
+        context = CrawlContext(http_client=client)
+
+        # 첫 실행은 새 항목이 있으므로 주기가 절반으로 줄어듦
+        scheduler = run_all.run_daemon(config['feeds'], context, daemon_config, max_cycles=1)
+        assert scheduler.feeds['youtube_15']['interval_seconds'] == 30 * 60
+        assert scheduler.due() == []
+
+        # 다시 시작해도 저장된 주기를 이어서 씀: 바로 실행하도록 당기면 변화 없음(304) → 주기가 늘어남
+        scheduler.feeds['youtube_15']['next_run'] = None
+        scheduler.save()
+        with bench.measure('daemon[youtube_15, warm cycle]'):
+            scheduler = run_all.run_daemon(config['feeds'], context, daemon_config, max_cycles=1)
+
+    assert scheduler.feeds['youtube_15']['interval_seconds'] == 45 * 60
+    assert scheduler.feeds['youtube_15']['last_new_items'] == 0
+
+
+def test_daemon_survives_failed_cycle(youtube_feeds, monkeypatch):
+    config = youtube_feeds([15])
+    monkeypatch.setattr(run_all, 'update_readme_feed_status', lambda: None)
+    count_items = run_all.count_items
+    calls = []
+
+    def flaky_count_items(feed_ids):
+        calls.append(feed_ids)
+        if len(calls) == 1:
+            raise OSError('database is locked')
+        return count_items(feed_ids)
+    monkeypatch.setattr(run_all, 'count_items', flaky_count_items)
+
+    # 첫 실행이 예외로 끝나도 데몬은 멈추지 않고 poll_seconds 뒤 다시 실행
+    daemon_config = {'interval_minutes': 60, 'poll_seconds': 0.1}
+    with create_http_client(config['http']) as client:
+        scheduler = run_all.run_daemon(config['feeds'], CrawlContext(http_client=client), daemon_config,
+                                       max_cycles=2)
+
+    assert scheduler.feeds['youtube_15']['last_new_items'] == 12
+    assert os.path.exists('docs/youtube-15.xml')
+
+
+def test_startup_list(bench):
+    with bench.measure('run_all --list'):
+        _, modules = run_once(CASES['run_all --list'])
+
+    # --list는 레지스트리와 설정만 읽고 크롤러/Playwright/feedparser/httpx는 import하지 않음
+    assert loaded_heavy_modules(modules) == []
@@ -0,0 +1,56 @@
+"""적응형 스케줄러 테스트"""
+from datetime import datetime, timedelta, timezone
+
+from utils.scheduler import FeedScheduler
+
+NOW = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def make_scheduler(workdir, **schedule):
+    feeds = {'feed': {'schedule': schedule}} if schedule else {'feed': {}}
+    return FeedScheduler(feeds, {'interval_minutes': 60, 'min_interval_minutes': 15, 'max_interval_minutes': 240},
+                         state_file=str(workdir / 'schedule.json'))
+
+
+def test_scheduler_record_bounds(workdir):
+    scheduler = make_scheduler(workdir)
+
+    # 새 항목이 계속 있으면 절반씩 줄다가 최소 주기에서 멈춤
+    for expected in (30, 15, 15):
+        state = scheduler.record('feed', True, new_items=3, now=NOW)
+        assert state['interval_seconds'] == expected * 60
+
+    # 변화가 없으면 1.5배씩 늘다가 최대 주기에서 멈춤
+    for _ in range(10):
+        state = scheduler.record('feed', True, new_items=0, now=NOW)
+    assert state['interval_seconds'] == 240 * 60
+    assert state['next_run'] == (NOW + timedelta(minutes=240)).isoformat()
+
+
+def test_scheduler_failure_and_skip(workdir):
+    scheduler = make_scheduler(workdir)
+
+    # 실패하면 주기는 그대로 두고 최소 주기 뒤에 다시 시도
+    state = scheduler.record('feed', False, now=NOW)
+    assert state['interval_seconds'] == 60 * 60
+    assert state['next_run'] == (NOW + timedelta(minutes=15)).isoformat()
+    assert state['last_new_items'] is None
+
+    # 건너뛰면 현재 주기 뒤에 다시 실행
+    state = scheduler.record('feed', None, now=NOW)
+    assert state['next_run'] == (NOW + timedelta(minutes=60)).isoformat()
+    assert state['runs'] == 2
+
+
+def test_scheduler_saved_state_is_clamped(workdir):
+    scheduler = make_scheduler(workdir)
+    scheduler.record('feed', True, new_items=0, now=NOW)
+    scheduler.feeds['feed']['interval_seconds'] = 24 * 60 * 60
+    scheduler.save()
+
+    # 피드별 설정으로 최대 주기를 줄이면 저장된 주기도 그 안으로 들어옴
+    restarted = make_scheduler(workdir, max_interval_minutes=120)
+    assert restarted.feeds['feed']['interval_seconds'] == 120 * 60
+    assert restarted.due(NOW) == []
+    assert restarted.due(NOW + timedelta(minutes=90)) == ['feed']
+    assert restarted.seconds_until_next(NOW) == 90 * 60
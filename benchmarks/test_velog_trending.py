@@ -0,0 +1,98 @@
+"""Velog 트렌딩 크롤러 오프라인 벤치마크"""
+import pytest
+
+from crawlers import velog_trending
+from fixtures import rss_item_count
+from utils.context import CrawlContext
+from utils.http_client import create_http_client
+
+VELOG_SIZES = [30, 300]
+
+
+@pytest.mark.parametrize('size', VELOG_SIZES)
+def test_velog_trending(size, velog_feed, browser_pool, bench):
+    velog_feed(size, ['browser'])
+
+    with bench.measure(f'velog_trending[{size}]') as result:
+        velog_trending.main(CrawlContext(browser_pool=browser_pool))
+
+    assert rss_item_count('docs/velog-trending.xml') == min(size, 30)
+    assert {'navigation', 'selector_wait', 'extraction', 'write'} <= set(result['stages'])
+
+
+@pytest.mark.parametrize('source', ['api', 'html'])
+@pytest.mark.parametrize('size', VELOG_SIZES)
+def test_velog_trending_http(size, source, velog_feed, bench):
+    velog_feed(size, [source, 'browser'])
+
+    with bench.measure(f'velog_trending[{size}, {source}]') as result:
+        velog_trending.main()
+
+    assert rss_item_count('docs/velog-trending.xml') == min(size, 30)
+    # 브라우저 없이 끝남
+    assert {'fetch', 'extraction', 'write'} <= set(result['stages'])
+    assert 'browser_launch' not in result['stages']
+
+
+def test_velog_sources_identical(velog_feed, fixture_server):
+    velog_feed(30, [])
+
+    with create_http_client({'http2': False}) as client:
+        api_posts, _ = velog_trending.fetch_trending_api(client, 30, fixture_server.url('/graphql-30'))
+        html_posts, _ = velog_trending.fetch_trending_html(client, 30, fixture_server.url('/trending/week-30'))
+
+    # pubDate는 저장소의 처음 본 시각으로 정해지므로 날짜를 뺀 나머지가 같아야 함
+    def without_date(posts):
+        return [{key: value for key, value in post.items() if key != 'date'} for post in posts]
+
+    assert len(api_posts) == 30
+    assert without_date(api_posts) == without_date(html_posts)
+
+
+def test_velog_sources_match_browser(velog_feed, fixture_server, browser_pool):
+    velog_feed(30, [])
+    url = fixture_server.url('/trending/week-30')
+
+    with create_http_client({'http2': False}) as client:
+        html_records = velog_trending.extract_cards_html(client.get(url).text, 30)
+
+    async def extract(page):
+        await velog_trending.load_trending_page(page, url)
+        return await velog_trending.extract_cards_batch(page, 30)
+
+    assert browser_pool.run(extract) == html_records
+
+
+def test_velog_fallback(velog_feed, fixture_server):
+    velog_feed(30, [])
+
+    with create_http_client({'http2': False}) as client:
+        posts, stats = velog_trending.crawl_velog_trending(
+            max_items=30,
+            url=fixture_server.url('/trending/week-30'),
+            http_client=client,
+            sources=['api', 'html'],
+            api_url=fixture_server.url('/graphql-missing')
+        )
+
+    assert len(posts) == 30
+    assert stats['source'] == 'html'
+    assert [fallback['source'] for fallback in stats['fallbacks']] == ['api']
+
+
+def test_velog_build_posts(bench):
+    records = [
+        {
+            'title': f'게시글 {i}',
+            'href': f'/@writer/post-{i}',
+            'summary': '요약 ' * 50,
+            'author': 'writer',
+            'date_text': ['3시간 전', '2일 전', '2026년 1월 5일'][i % 3]
+        }
+        for i in range(5000)
+    ]
+
+    with bench.measure('velog_build_posts[5000]'):
+        posts = velog_trending.build_posts(records)
+
+    assert len(posts) == 5000
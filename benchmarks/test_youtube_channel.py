@@ -0,0 +1,115 @@
+"""유튜브 채널 크롤러 오프라인 벤치마크"""
+import json
+import os
+
+import pytest
+
+from crawlers import youtube_channel
+from fixtures import rss_item_count
+from utils.logger import CrawlLogger
+
+YOUTUBE_SIZES = [15, 500, 5000]
+
+
+@pytest.mark.parametrize('size', YOUTUBE_SIZES)
+def test_youtube_channel(size, youtube_feeds, bench):
+    youtube_feeds([size])
+
+    with bench.measure(f'youtube_channel[{size}]'):
+        results = youtube_channel.main()
+
+    assert results == {f'youtube_{size}': True}
+    # 다섯 개 중 하나는 쇼츠라 제외됨
+    assert rss_item_count(f'docs/youtube-{size}.xml') == size - size // 5
+
+
+def test_youtube_channel_not_modified(youtube_feeds, bench):
+    youtube_feeds([500])
+    youtube_channel.main()
+
+    with bench.measure('youtube_channel[500, 304]') as result:
+        results = youtube_channel.main()
+
+    assert results == {'youtube_500': True}
+    assert 'parse' not in result['stages']
+
+
+def test_parse_feed_entries_falls_back_when_empty():
+    # 경량 파서가 모르는 형식이라 항목을 못 찾으면 feedparser로 다시 파싱
+    body = (b'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>'
+            b'<item><title>A</title><link>https://example.com/a</link></item></channel></rss>')
+    assert [entry.link for entry in youtube_channel.parse_feed_entries(body)] == ['https://example.com/a']
+
+
+def test_youtube_channel_shared_http_cache(youtube_feeds, monkeypatch):
+    from utils import http_cache
+
+    youtube_feeds([15, 16, 17])
+    writes = []
+    atomic_write = http_cache.atomic_write
+    monkeypatch.setattr(http_cache, 'atomic_write', lambda *args: writes.append(args[0]) or atomic_write(*args))
+
+    # 채널이 여러 개여도 캐시 파일은 실행마다 한 번만 씀
+    assert all(youtube_channel.main().values())
+    assert writes == ['state/http_cache.json']
+    with open('state/http_cache.json', 'r', encoding='utf-8') as f:
+        assert len(json.load(f)) == 3
+
+    youtube_channel.main()
+    assert [entry['message'].startswith('변경 없음') for entry in CrawlLogger().recent()[-3:]] == [True] * 3
+
+
+def test_youtube_channel_formats(youtube_feeds, bench):
+    import feedparser
+
+    config = youtube_feeds([500])
+    config['feeds']['youtube_500']['formats'] = ['rss', 'atom', 'json']
+
+    with bench.measure('youtube_channel[500, rss+atom+json]'):
+        results = youtube_channel.main()
+
+    assert results == {'youtube_500': True}
+    expected = 500 - 500 // 5
+    assert rss_item_count('docs/youtube-500.xml') == expected
+    atom = feedparser.parse('docs/youtube-500.atom.xml')
+    assert not atom.bozo and atom.version == 'atom10' and len(atom.entries) == expected
+    with open('docs/youtube-500.feed.json', 'r', encoding='utf-8') as f:
+        json_feed = json.load(f)
+    assert json_feed['version'] == 'https://jsonfeed.org/version/1.1' and len(json_feed['items']) == expected
+    assert [item['url'] for item in json_feed['items']] == [entry.link for entry in atom.entries]
+
+    # 크롤링 로그에 형식별 출력 시간과 크기가 남음
+    formats = CrawlLogger().recent()[-1]['details']['formats']
+    assert set(formats) == {'rss', 'atom', 'json'}
+    assert all(result['written'] and result['seconds'] > 0 and result['bytes'] > 0 for result in formats.values())
+
+    # 형식을 빼면 그 형식의 이전 출력과 압축본은 지워짐
+    config['feeds']['youtube_500']['formats'] = ['rss', 'atom']
+    youtube_channel.main()
+    assert not os.path.exists('docs/youtube-500.feed.json')
+    assert not os.path.exists('docs/youtube-500.feed.json.gz')
+    assert os.path.exists('docs/youtube-500.atom.xml.gz')
+
+
+def test_youtube_channel_concurrent(youtube_feeds, bench):
+    youtube_feeds(YOUTUBE_SIZES)
+
+    with bench.measure('youtube_channel[all sizes]'):
+        results = youtube_channel.main()
+
+    assert all(results.values())
+
+
+def test_youtube_channel_retry(youtube_feeds, fixture_server, bench):
+    config = youtube_feeds([15])
+    config['resilience'] = {'retry': {'attempts': 3, 'base_delay': 0.01}}
+    fixture_server.fail(f'/feeds/videos.xml?channel_id=UCbench{15:08d}', 2)
+
+    with bench.measure('youtube_channel[15, retry]') as result:
+        results = youtube_channel.main()
+
+    assert results == {'youtube_15': True}
+    assert result['counters']['retries'] == 2
+    # 재시도 기록은 크롤링 로그 항목에 남음
+    entry = CrawlLogger().recent()[-1]
+    assert [retry['attempt'] for retry in entry['retries']] == [1, 2]
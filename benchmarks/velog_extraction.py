@@ -0,0 +1,72 @@
+"""Velog PostCard 추출 방식(batch vs 요소별) 시간 비교"""
+import os
+import sys
+import time
+import argparse
+
+# 상위 디렉토리 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.browser_pool import BrowserPool
+from crawlers.velog_trending import (
+    extract_cards_batch,
+    extract_cards_per_element,
+    build_posts,
+    load_trending_page,
+    TITLE_SELECTOR,
+)
+
+
+async def measure(page, source, max_items, repeat):
+    """같은 페이지에서 두 추출 방식을 번갈아 실행하며 시간 측정"""
+    if source.startswith('http'):
+        await load_trending_page(page, source)
+    else:
+        with open(source, 'r', encoding='utf-8') as f:
+            await page.set_content(f.read())
+        await page.wait_for_selector(TITLE_SELECTOR, timeout=30000)
+
+    timings = {'element': [], 'batch': []}
+    outputs = {}
+    extractors = {'element': extract_cards_per_element, 'batch': extract_cards_batch}
+
+    for _ in range(repeat):
+        for name, extract in extractors.items():
+            started = time.perf_counter()
+            records = await extract(page, max_items)
+            timings[name].append(time.perf_counter() - started)
+            outputs[name] = records
+
+    return timings, outputs
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('source', nargs='?', default='https://velog.io/trending/week',
+                        help='측정할 URL 또는 저장해 둔 HTML 파일 경로')
+    parser.add_argument('--max-items', type=int, default=30)
+    parser.add_argument('--repeat', type=int, default=10)
+    args = parser.parse_args()
+
+    with BrowserPool() as pool:
+        timings, outputs = pool.run(lambda page: measure(page, args.source, args.max_items, args.repeat))
+
+    print(f"📍 {args.source} (카드 {len(outputs['batch'])}개, {args.repeat}회 반복)\n")
+    for name, values in timings.items():
+        values = sorted(values)
+        median = values[len(values) // 2]
+        print(f"  {name:8s} 중앙값 {median * 1000:8.1f}ms  최소 {values[0] * 1000:8.1f}ms")
+
+    speedup = sorted(timings['element'])[args.repeat // 2] / sorted(timings['batch'])[args.repeat // 2]
+    print(f"\n⚡ batch가 {speedup:.1f}배 빠름")
+
+    # 두 방식이 같은 게시글을 만드는지 확인 (상대 날짜는 실행 시각에 따라 달라지므로 제외)
+    def comparable(records):
+        return [{k: v for k, v in post.items() if k != 'date'} for post in build_posts(records)]
+
+    same = comparable(outputs['batch']) == comparable(outputs['element'])
+    print("✅ 추출 결과 동일" if same else "❌ 추출 결과가 다릅니다")
+
+
+if __name__ == '__main__':
+    main()
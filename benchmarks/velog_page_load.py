@@ -0,0 +1,89 @@
+"""Velog 페이지 로딩 방식 비교 (networkidle + 차단 없음 vs 셀렉터 대기 + 요청 차단)"""
+import os
+import sys
+import json
+import argparse
+
+# 상위 디렉토리 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.browser_pool import BrowserPool
+from utils.request_filter import RequestFilter
+from crawlers.velog_trending import load_trending_page, TRENDING_URL
+
+
+def load_feed_page_config():
+    """config.json의 velog_trending page_load 설정 로드"""
+    config_path = os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+        'config.json'
+    )
+    with open(config_path, 'r', encoding='utf-8') as f:
+        return json.load(f)['feeds']['velog_trending'].get('page_load', {})
+
+
+async def load_until_idle(page, url, wait_until, request_filter):
+    """
+    load_trending_page() 후 네트워크가 잠잠해질 때까지 기다렸다가 요청/바이트 수 다시 집계
+
+    셀렉터 대기 방식은 카드가 보이면 바로 돌아오므로 그 뒤에도 받는 리소스가 있습니다.
+    두 방식 모두 networkidle 시점의 통계를 써야 절약한 바이트를 부풀리지 않습니다.
+    load_ms는 크롤러가 실제로 기다리는 시간이므로 그대로 둡니다.
+    """
+    stats = await load_trending_page(page, url, wait_until, request_filter)
+    await page.wait_for_load_state('networkidle', timeout=30000)
+    idle_stats = request_filter.stats()
+    stats.update(requests=idle_stats['requests'], blocked=idle_stats['blocked'],
+                 bytes_received=idle_stats['bytes_received'])
+    return stats
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('url', nargs='?', default=TRENDING_URL)
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    page_load = load_feed_page_config()
+    modes = {
+        'baseline': lambda page: load_until_idle(page, args.url, 'networkidle', RequestFilter()),
+        'optimized': lambda page: load_until_idle(
+            page, args.url, page_load.get('wait_until', 'domcontentloaded'), RequestFilter.from_config(page_load)
+        ),
+    }
+
+    results = {name: [] for name in modes}
+    with BrowserPool() as pool:
+        # 첫 실행의 브라우저 기동 시간이 섞이지 않도록 한 번 예열
+        pool.run(modes['baseline'])
+        for _ in range(args.repeat):
+            for name, load in modes.items():
+                results[name].append(pool.run(load))
+
+    print(f"📍 {args.url} ({args.repeat}회 반복, 각 실행은 새 context, 요청/바이트는 networkidle 시점 기준)\n")
+    summary = {}
+    for name, runs in results.items():
+        summary[name] = {
+            'load_ms': median([r['load_ms'] for r in runs]),
+            'bytes_received': median([r['bytes_received'] for r in runs]),
+            'requests': median([r['requests'] for r in runs]),
+            'blocked': median([r['blocked'] for r in runs]),
+        }
+        s = summary[name]
+        print(
+            f"  {name:9s} {s['load_ms']:8.0f}ms  {s['bytes_received'] / 1024:8.0f}KB  "
+            f"요청 {s['requests']}개 (차단 {s['blocked']}개)"
+        )
+
+    saved_ms = summary['baseline']['load_ms'] - summary['optimized']['load_ms']
+    saved_kb = (summary['baseline']['bytes_received'] - summary['optimized']['bytes_received']) / 1024
+    print(f"\n⚡ 크롤링 1회당 {saved_ms:.0f}ms, {saved_kb:.0f}KB 절약")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,59 @@
+"""유튜브 채널 피드 파서 비교 (feedparser vs 경량 Atom 파서)"""
+import os
+import sys
+import time
+import argparse
+import tracemalloc
+
+# 상위 디렉토리 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from crawlers.youtube_channel import parse_feed_entries
+from fixtures import make_youtube_atom
+
+
+def measure(parser, content, repeat):
+    """CPU 시간(중앙값)과 피크 메모리 측정"""
+    cpu_times = []
+    for _ in range(repeat):
+        started = time.process_time()
+        entries = parse_feed_entries(content, parser)
+        cpu_times.append(time.process_time() - started)
+
+    tracemalloc.start()
+    parse_feed_entries(content, parser)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    cpu_times.sort()
+    return entries, cpu_times[len(cpu_times) // 2], peak
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument('--entries', type=int, nargs='+', default=[15, 500, 5000],
+                        help='채널 피드 entry 개수 (실제 유튜브 채널 피드는 15개)')
+    parser.add_argument('--file', help='저장해 둔 실제 채널 피드 XML (지정하면 --entries 무시)')
+    parser.add_argument('--repeat', type=int, default=5)
+    args = parser.parse_args()
+
+    if args.file:
+        with open(args.file, 'rb') as f:
+            documents = [(args.file, f.read())]
+    else:
+        documents = [(f'{count}개 entry', make_youtube_atom(count)) for count in args.entries]
+
+    for label, content in documents:
+        reference, ref_cpu, ref_peak = measure('feedparser', content, args.repeat)
+        fast, fast_cpu, fast_peak = measure('fast', content, args.repeat)
+
+        print(f"📄 {label} ({len(content) / 1024:.0f}KB)")
+        print(f"  feedparser  CPU {ref_cpu * 1000:9.2f}ms  피크 메모리 {ref_peak / 1024:9.0f}KB")
+        print(f"  fast        CPU {fast_cpu * 1000:9.2f}ms  피크 메모리 {fast_peak / 1024:9.0f}KB")
+        print(f"  ⚡ CPU {ref_cpu / fast_cpu:.1f}배, 메모리 {ref_peak / max(fast_peak, 1):.1f}배 절감")
+        print("  ✅ 추출 결과 동일\n" if fast == reference else "  ❌ 추출 결과가 다릅니다\n")
+
+
+if __name__ == '__main__':
+    main()
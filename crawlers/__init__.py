@@ -1 +1,75 @@
 # Crawlers package
+"""크롤러 레지스트리
+
+오케스트레이터는 이 표만 보고 크롤러를 찾습니다. 크롤러 모듈(과 Playwright, feedparser 같은
+무거운 의존성)은 그 크롤러를 쓰는 피드가 실제로 실행될 때 처음 import합니다.
+"""
+import importlib
+import threading
+
+# 크롤러 이름 → 모듈 경로, 설명, 필요한 공유 자원('browser', 'http')
+CRAWLERS = {
+    'velog_trending': {
+        'module': 'crawlers.velog_trending',
+        'description': 'Velog 트렌딩 (데이터 API/HTML, 실패하면 헤드리스 Chromium)',
+        'requires': ('http', 'browser')
+    },
+    'youtube_channel': {
+        'module': 'crawlers.youtube_channel',
+        'description': '유튜브 채널 Atom 피드',
+        'requires': ('http',)
+    },
+}
+
+_import_lock = threading.Lock()
+
+
+def get_crawler(name):
+    """
+    크롤러 정보 조회 (모듈은 import하지 않음)
+
+    Args:
+        name: 크롤러 이름 (예: 'velog_trending')
+
+    Returns:
+        dict: {module, description, requires}
+
+    Raises:
+        KeyError: 등록되지 않은 크롤러
+    """
+    if name not in CRAWLERS:
+        raise KeyError(f"등록되지 않은 크롤러입니다: {name}")
+    return CRAWLERS[name]
+
+
+def load_crawler(name):
+    """
+    크롤러 모듈 import (처음 한 번만 실제로 import하고 이후에는 캐시된 모듈 반환)
+
+    Args:
+        name: 크롤러 이름
+
+    Returns:
+        module: main(context, feed_ids)를 가진 크롤러 모듈
+    """
+    info = get_crawler(name)
+    # 워커 스레드 여러 개가 같은 크롤러를 동시에 처음 import하지 않도록 잠금
+    with _import_lock:
+        return importlib.import_module(info['module'])
+
+
+def required_resources(crawler_names):
+    """
+    크롤러들이 필요로 하는 공유 자원 집합
+
+    Args:
+        crawler_names: 크롤러 이름 목록
+
+    Returns:
+        set: {'browser', 'http'} 중 필요한 것
+    """
+    resources = set()
+    for name in crawler_names:
+        if name in CRAWLERS:
+            resources.update(CRAWLERS[name]['requires'])
+    return resources
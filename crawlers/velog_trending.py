@@ -1,34 +1,33 @@
 """Velog 트렌딩 페이지 크롤러"""
 import os
-import sys
 import re
-import json
+import time
 from datetime import datetime, timezone, timedelta
-from playwright.sync_api import sync_playwright
 import xml.etree.ElementTree as ET
 from email.utils import parsedate_to_datetime
+from html.parser import HTMLParser
 
-# 상위 디렉토리 모듈 import를 위한 경로 추가
-sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
-from utils.rss_generator import create_rss_feed
+from utils.config import load_config
+from utils.context import CrawlCancelled, check_cancelled, finish_feed
+from utils.rss_generator import create_feeds
 from utils.logger import CrawlLogger
-
-
-def load_config():
-    """설정 파일 로드"""
-    config_path = os.path.join(
-        os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
-        'config.json'
-    )
-    with open(config_path, 'r', encoding='utf-8') as f:
-        return json.load(f)
+from utils.browser_pool import BrowserPool
+from utils.http_client import create_http_client
+from utils.request_filter import RequestFilter
+from utils.item_store import ItemStore
+from utils.keyword_filter import KeywordFilter
+from utils.pipeline import FeedItem, ObserveItems, Pipeline, dedupe, filter_items
+from utils.feed_archive import FeedArchive
+from utils.metrics import count, feed_scope, stage, write_metrics
+from utils.resilience import RUN_DEADLINE, CircuitBreakers, RetryPolicy, retry_call
 
 
 def load_existing_pubdates(xml_path):
     """
     기존 XML 파일에서 각 아이템의 pubDate를 추출
 
+    항목 저장소가 비어 있을 때 이전 출력의 이력을 가져오는 용도로만 사용합니다.
+
     Args:
         xml_path: XML 파일 경로
 
@@ -105,152 +104,656 @@ def parse_velog_date(date_text):
     return now
 
 
-def crawl_velog_trending(max_items=20):
+# PostCard 하나에서 필요한 필드를 모두 꺼내는 스크립트 (카드 전체를 한 번의 evaluate로 처리)
+EXTRACT_CARDS_JS = """
+(cards, maxItems) => cards.slice(0, maxItems).map((card) => {
+    const text = (selector) => {
+        const elem = card.querySelector(selector);
+        return elem ? elem.innerText.trim() : null;
+    };
+    const link = card.querySelector('a[href*="/@"]');
+    return {
+        title: text('h4[class*="PostCard"]'),
+        href: link ? link.getAttribute('href') : null,
+        summary: text('p[class*="PostCard_clamp"]'),
+        author: text('div[class*="PostCard_footer"] b'),
+        date_text: text('div[class*="PostCard_subInfo"] span'),
+    };
+})
+"""
+
+CARD_SELECTOR = 'li[class*="PostCard"]'
+TITLE_SELECTOR = 'h4[class*="PostCard"]'
+TRENDING_URL = 'https://velog.io/trending/week'
+
+# Velog 데이터 API (GraphQL, 피드 설정의 api_url로 바꿀 수 있음)
+VELOG_API_URL = 'https://v3.velog.io/graphql'
+
+TRENDING_QUERY = """
+query TrendingPosts($input: TrendingPostsInput!) {
+  trendingPosts(input: $input) {
+    title
+    short_description
+    url_slug
+    released_at
+    user {
+      username
+    }
+  }
+}
+"""
+
+TIMEFRAMES = ('day', 'week', 'month', 'year')
+
+# 게시글을 가져오는 방식 (앞에서부터 시도하고 게시글을 얻으면 멈춤)
+# api: GraphQL 데이터 API, html: 서버 렌더링된 HTML 파싱, browser: 헤드리스 Chromium
+DEFAULT_SOURCES = ('api', 'html', 'browser')
+
+# HTML을 나눠서 파싱하는 단위 (문자 수)
+HTML_CHUNK_SIZE = 16 * 1024
+
+# 내용이 없는 HTML 요소 (닫는 태그가 없으므로 요소 스택에 넣지 않음)
+VOID_ELEMENTS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link', 'meta', 'source', 'track', 'wbr'}
+
+
+async def extract_cards_batch(page, max_items=20):
     """
-    Velog 트렌딩 페이지 크롤링
+    모든 PostCard 필드를 evaluate 한 번으로 추출
 
     Args:
-        max_items: 최대 수집 개수
+        page: Playwright page (async API)
+        max_items: 최대 카드 개수
 
     Returns:
-        list: 게시글 정보 리스트
+        list: {title, href, summary, author, date_text} 레코드 리스트 (없는 필드는 None)
     """
-    print("Velog 트렌딩 크롤링 시작...")
+    return await page.eval_on_selector_all(CARD_SELECTOR, EXTRACT_CARDS_JS, max_items)
 
-    with sync_playwright() as p:
-        browser = p.chromium.launch(headless=True)
-        page = browser.new_page()
 
-        # Velog 트렌딩 페이지 접속 (week 단위)
-        page.goto('https://velog.io/trending/week', wait_until='networkidle', timeout=30000)
+async def extract_cards_per_element(page, max_items=20):
+    """
+    PostCard 필드를 요소별 query_selector/inner_text 호출로 추출 (카드당 IPC 여러 번)
 
-        # JavaScript 렌더링 대기
-        page.wait_for_selector('h4[class*="PostCard"]', timeout=30000)
+    extract_cards_batch()와 같은 레코드를 돌려주며, 비교 측정용으로 남겨 둡니다.
 
-        posts = []
-        seen_links = set()  # 중복 제거
+    Args:
+        page: Playwright page (async API)
+        max_items: 최대 카드 개수
 
-        # 포스트 카드(li 태그) 기준으로 수집
-        cards = page.query_selector_all('li[class*="PostCard"]')
-        print(f"✅ 총 {len(cards)}개 게시글 발견")
+    Returns:
+        list: {title, href, summary, author, date_text} 레코드 리스트 (없는 필드는 None)
+    """
+    async def text(card, selector):
+        elem = await card.query_selector(selector)
+        return (await elem.inner_text()).strip() if elem else None
+
+    records = []
+    cards = await page.query_selector_all(CARD_SELECTOR)
+    for card in cards[:max_items]:
+        try:
+            link_elem = await card.query_selector('a[href*="/@"]')
+            records.append({
+                'title': await text(card, 'h4[class*="PostCard"]'),
+                'href': await link_elem.get_attribute('href') if link_elem else None,
+                'summary': await text(card, 'p[class*="PostCard_clamp"]'),
+                'author': await text(card, 'div[class*="PostCard_footer"] b'),
+                'date_text': await text(card, 'div[class*="PostCard_subInfo"] span'),
+            })
+        except Exception as e:
+            print(f"  ⚠️  게시글 파싱 오류: {e}")
+            continue
+    return records
+
+
+class PostCardParser(HTMLParser):
+    """
+    서버 렌더링된 트렌딩 페이지 HTML에서 PostCard 필드를 추출
 
-        for card in cards[:max_items]:
-            try:
-                # 제목 (h4 태그)
-                title_elem = card.query_selector('h4[class*="PostCard"]')
-                if not title_elem:
-                    continue
-                title = title_elem.inner_text().strip()
+    EXTRACT_CARDS_JS와 같은 셀렉터 규칙(카드 안에서 처음 나오는 요소)을 따르고,
+    innerText처럼 공백을 하나로 합쳐 같은 레코드를 만듭니다.
+    """
 
-                # 링크 (a 태그)
-                link_elem = card.query_selector('a[href*="/@"]')
-                if not link_elem:
-                    continue
-                link = link_elem.get_attribute('href')
+    def __init__(self, max_items=20):
+        super().__init__(convert_charrefs=True)
+        self.max_items = max_items
+        self.records = []
+        self._stack = []
+        self._card = None
+        self._card_depth = 0
+        self._field = None
+        self._field_depth = 0
+        self._text = []
+
+    def _inside(self, tag, class_part):
+        return any(t == tag and class_part in c for t, c in self._stack[self._card_depth:])
+
+    def handle_starttag(self, tag, attrs):
+        if tag in VOID_ELEMENTS:
+            return
+        attrs = dict(attrs)
+        class_name = attrs.get('class') or ''
+        self._stack.append((tag, class_name))
+
+        if self._card is None:
+            if tag == 'li' and 'PostCard' in class_name and len(self.records) < self.max_items:
+                self._card = {}
+                self._card_depth = len(self._stack)
+            return
+
+        card = self._card
+        if tag == 'a' and 'href' not in card and '/@' in (attrs.get('href') or ''):
+            card['href'] = attrs['href']
+        if self._field is not None:
+            return
+
+        if tag == 'h4' and 'PostCard' in class_name and 'title' not in card:
+            field = 'title'
+        elif tag == 'p' and 'PostCard_clamp' in class_name and 'summary' not in card:
+            field = 'summary'
+        elif tag == 'b' and 'author' not in card and self._inside('div', 'PostCard_footer'):
+            field = 'author'
+        elif tag == 'span' and 'date_text' not in card and self._inside('div', 'PostCard_subInfo'):
+            field = 'date_text'
+        else:
+            return
+        self._field = field
+        self._field_depth = len(self._stack)
+        self._text = []
+
+    def handle_endtag(self, tag):
+        # 닫히지 않은 요소가 있어도 가장 가까운 같은 태그까지 정리
+        for index in range(len(self._stack) - 1, -1, -1):
+            if self._stack[index][0] == tag:
+                del self._stack[index:]
+                break
+        else:
+            return
+
+        if self._field is not None and len(self._stack) < self._field_depth:
+            self._card[self._field] = ' '.join(''.join(self._text).split())
+            self._field = None
+        if self._card is not None and len(self._stack) < self._card_depth:
+            card = self._card
+            self.records.append({
+                'title': card.get('title'),
+                'href': card.get('href'),
+                'summary': card.get('summary'),
+                'author': card.get('author'),
+                'date_text': card.get('date_text'),
+            })
+            self._card = None
+
+    def handle_data(self, data):
+        if self._field is not None:
+            self._text.append(data)
+
+
+def extract_cards_html(html, max_items=20):
+    """
+    HTML 문자열에서 PostCard 레코드 추출 (브라우저 없이)
 
-                # 전체 URL 만들기
-                if link and not link.startswith('http'):
-                    link = f'https://velog.io{link}' if link.startswith('/') else link
+    Args:
+        html: 트렌딩 페이지 HTML
+        max_items: 최대 카드 개수
 
-                # 중복 체크
-                if link in seen_links:
-                    continue
-                seen_links.add(link)
-
-                # 요약 (p.PostCard_clamp___2g_C)
-                summary = ''
-                summary_elem = card.query_selector('p[class*="PostCard_clamp"]')
-                if summary_elem:
-                    summary = summary_elem.inner_text().strip()
-
-                # 작성자 (footer 영역의 b 태그)
-                author = 'Unknown'
-                author_elem = card.query_selector('div[class*="PostCard_footer"] b')
-                if author_elem:
-                    author = author_elem.inner_text().strip()
-
-                # 날짜 (PostCard_subInfo 내부의 첫 번째 span)
-                date = datetime.now(timezone.utc)
-                date_elem = card.query_selector('div[class*="PostCard_subInfo"] span')
-                if date_elem:
-                    date_text = date_elem.inner_text().strip()
-                    date = parse_velog_date(date_text)
-
-                posts.append({
-                    'title': title,
-                    'link': link,
-                    'summary': summary[:500] if summary else '',
-                    'author': author,
-                    'date': date
-                })
+    Returns:
+        list: {title, href, summary, author, date_text} 레코드 리스트 (없는 필드는 None)
+    """
+    parser = PostCardParser(max_items)
+    # 필요한 카드를 다 모으면 나머지 문서는 파싱하지 않음
+    for start in range(0, len(html), HTML_CHUNK_SIZE):
+        parser.feed(html[start:start + HTML_CHUNK_SIZE])
+        if len(parser.records) >= max_items:
+            return parser.records
+    parser.close()
+    return parser.records
 
-            except Exception as e:
-                print(f"  ⚠️  게시글 파싱 오류: {e}")
+
+def api_records(data, max_items=20):
+    """
+    GraphQL trendingPosts 응답을 PostCard 레코드로 변환
+
+    Args:
+        data: 응답 JSON
+        max_items: 최대 개수
+
+    Returns:
+        list: {title, href, summary, author, date_text, released_at} 레코드 리스트
+
+    Raises:
+        ValueError: GraphQL 오류 응답
+    """
+    if data.get('errors'):
+        raise ValueError(f"GraphQL 오류: {data['errors'][0].get('message', data['errors'][0])}")
+
+    def text(value):
+        # 페이지의 innerText처럼 줄바꿈/연속 공백을 하나로
+        return ' '.join(value.split()) if value is not None else None
+
+    records = []
+    for item in (data.get('data') or {}).get('trendingPosts') or []:
+        username = (item.get('user') or {}).get('username')
+        slug = item.get('url_slug')
+        records.append({
+            'title': text(item.get('title')),
+            'href': f'/@{username}/{slug}' if username and slug else None,
+            'summary': text(item.get('short_description')),
+            'author': username,
+            'date_text': None,
+            'released_at': item.get('released_at'),
+        })
+        if len(records) >= max_items:
+            break
+    return records
+
+
+def record_items(records):
+    """
+    추출한 카드 레코드를 FeedItem으로 바꾸는 파이프라인 단계 (URL 보정, 날짜 파싱)
+
+    Args:
+        records: extract_cards_*()나 api_records()가 돌려준 레코드 이터러블
+
+    Yields:
+        FeedItem: 제목과 링크가 있는 게시글
+    """
+    for record in records:
+        try:
+            # 제목 (h4 태그)
+            title = record.get('title')
+            if not title:
                 continue
 
-        browser.close()
+            # 링크 (a 태그)
+            link = record.get('href')
+            if not link:
+                continue
 
-    print(f"\n📊 수집 결과: {len(posts)}개 게시글")
-    return posts
+            # 전체 URL 만들기
+            if not link.startswith('http'):
+                link = f'https://velog.io{link}' if link.startswith('/') else link
 
+            # 요약 (p.PostCard_clamp___2g_C)
+            summary = record.get('summary') or ''
 
-def main():
-    """메인 실행 함수"""
-    logger = CrawlLogger()
+            # 작성자 (footer 영역의 b 태그)
+            author = record.get('author') or 'Unknown'
 
-    try:
-        # 설정 로드
-        config = load_config()
-        feed_config = config['feeds']['velog_trending']
+            # 날짜 (API는 released_at, 페이지는 PostCard_subInfo 내부의 첫 번째 span)
+            date = datetime.now(timezone.utc)
+            if record.get('released_at'):
+                date = datetime.fromisoformat(record['released_at'].replace('Z', '+00:00'))
+            elif record.get('date_text'):
+                date = parse_velog_date(record['date_text'])
 
-        output_path = f"docs/{feed_config['output']}"
+            item = FeedItem(title, link, summary[:500], author, date)
 
-        # 기존 XML에서 pubDate 정보 로드
-        existing_pubdates = load_existing_pubdates(output_path)
+        except Exception as e:
+            print(f"  ⚠️  게시글 파싱 오류: {e}")
+            continue
 
-        # 크롤링 실행
-        posts = crawl_velog_trending(max_items=30)
+        yield item
 
-        if not posts:
-            raise Exception("수집된 게시글이 없습니다")
 
-        # pubDate 설정: 기존 글은 기존 날짜 유지, 새 글은 현재 시간
-        current_time = datetime.now(timezone.utc)
-        new_count = 0
+def build_posts(records):
+    """
+    추출한 카드 레코드를 게시글로 변환 (URL 보정, 날짜 파싱, 중복 제거)
 
-        for post in posts:
-            link = post['link']
-            if link in existing_pubdates:
-                # 기존 글: 기존 pubDate 유지
-                post['date'] = existing_pubdates[link]
-            else:
-                # 새 글: 현재 시간으로 설정
-                post['date'] = current_time
-                new_count += 1
+    Args:
+        records: extract_cards_*()가 돌려준 레코드 리스트
+
+    Returns:
+        list: FeedItem 리스트
+    """
+    return list(Pipeline(records, record_items, dedupe()))
 
-        print(f"✨ 새로 추가된 글: {new_count}개 / 기존 글: {len(posts) - new_count}개")
 
-        # RSS 생성
-        feed_info = {
-            'title': feed_config['name'],
-            'link': 'https://velog.io/trending',
-            'description': feed_config['description']
-        }
+async def load_trending_page(page, url=TRENDING_URL, wait_until='domcontentloaded', request_filter=None):
+    """
+    트렌딩 페이지를 열고 게시글 카드가 렌더링될 때까지 대기
 
-        os.makedirs('docs', exist_ok=True)
-        create_rss_feed(feed_info, posts, output_path)
+    networkidle은 이미지/폰트/분석 비콘까지 모두 끝나길 기다리므로,
+    기본값은 DOM이 준비되면 바로 카드 제목 셀렉터를 기다리는 방식입니다.
 
-        # 성공 로그
-        logger.log_success('velog_trending', len(posts), f'{output_path} 생성 완료')
+    Args:
+        page: Playwright page (async API)
+        url: 접속할 URL
+        wait_until: page.goto()의 wait_until 값 ('domcontentloaded', 'load', 'networkidle' 등)
+        request_filter: 요청 차단/통계용 RequestFilter (없으면 차단하지 않음)
 
-    except Exception as e:
-        # 실패 로그
-        logger.log_failure('velog_trending', str(e))
-        raise
+    Returns:
+        dict: 로딩 통계 (load_ms, requests, blocked, bytes_received 등). 요청/바이트 수는
+            카드가 보인 시점까지만 센 하한값입니다 (그 뒤에 끝나는 요청은 포함되지 않음).
+    """
+    request_filter = request_filter or RequestFilter()
+    await request_filter.install(page)
+
+    # 실행 마감이 가까우면 마감 안에서 끝나도록 대기 시간을 줄임
+    started = time.perf_counter()
+    with stage('navigation'):
+        await page.goto(url, wait_until=wait_until, timeout=RUN_DEADLINE.clip(30) * 1000)
+
+    # JavaScript 렌더링 대기
+    with stage('selector_wait'):
+        await page.wait_for_selector(TITLE_SELECTOR, timeout=RUN_DEADLINE.clip(30) * 1000)
+
+    stats = request_filter.stats()
+    count('requests', stats['requests'])
+    count('bytes_fetched', stats['bytes_received'])
+    stats['load_ms'] = round((time.perf_counter() - started) * 1000, 1)
+    return stats
+
+
+async def scrape_trending_page(page, max_items=20, extraction='batch', page_load=None, url=TRENDING_URL):
+    """
+    트렌딩 페이지에서 게시글 정보 추출
+
+    Args:
+        page: 브라우저 풀에서 빌린 Playwright page (async API)
+        max_items: 최대 수집 개수
+        extraction: 'batch'(evaluate 한 번) 또는 'element'(요소별 호출)
+        page_load: 피드 설정의 page_load 항목 (wait_until, 차단 목록)
+        url: 트렌딩 페이지 URL
+
+    Returns:
+        tuple: (게시글 정보 리스트, 로딩 통계 딕셔너리)
+    """
+    page_load = page_load or {}
+    load_stats = await load_trending_page(
+        page,
+        url=url,
+        wait_until=page_load.get('wait_until', 'domcontentloaded'),
+        request_filter=RequestFilter.from_config(page_load)
+    )
+    print(
+        f"🌐 페이지 로딩 {load_stats['load_ms']:.0f}ms - 요청 {load_stats['requests']}개 "
+        f"(차단 {load_stats['blocked']}개), 수신 {load_stats['bytes_received'] / 1024:.0f}KB 이상"
+    )
+
+    # 포스트 카드(li 태그) 기준으로 수집
+    with stage('extraction'):
+        if extraction == 'element':
+            records = await extract_cards_per_element(page, max_items)
+        else:
+            records = await extract_cards_batch(page, max_items)
+        posts = build_posts(records)
+    print(f"✅ 총 {len(records)}개 게시글 발견")
+    count('items_fetched', len(posts))
+
+    return posts, load_stats
+
+
+def trending_timeframe(url):
+    """트렌딩 페이지 URL의 기간 (…/trending/week → 'week', 알 수 없으면 'week')"""
+    timeframe = url.rstrip('/').rsplit('/', 1)[-1]
+    return timeframe if timeframe in TIMEFRAMES else 'week'
+
+
+def fetch_trending_api(client, max_items=20, api_url=VELOG_API_URL, timeframe='week'):
+    """
+    GraphQL 데이터 API에서 트렌딩 게시글 조회 (브라우저 없음)
+
+    Args:
+        client: httpx.Client
+        max_items: 최대 수집 개수
+        api_url: GraphQL 엔드포인트
+        timeframe: 'day', 'week', 'month', 'year'
+
+    Returns:
+        tuple: (게시글 정보 리스트, 로딩 통계 딕셔너리)
+    """
+    payload = {
+        'operationName': 'TrendingPosts',
+        'query': TRENDING_QUERY,
+        'variables': {'input': {'limit': max_items, 'offset': 0, 'timeframe': timeframe}}
+    }
+    started = time.perf_counter()
+    with stage('fetch'):
+        response = client.post(api_url, json=payload)
+        response.raise_for_status()
+    count('requests')
+    count('bytes_fetched', len(response.content))
+    stats = {'requests': 1, 'bytes_received': len(response.content),
+             'load_ms': round((time.perf_counter() - started) * 1000, 1)}
+
+    with stage('extraction'):
+        posts = build_posts(api_records(response.json(), max_items))
+    return posts, stats
+
+
+def fetch_trending_html(client, max_items=20, url=TRENDING_URL):
+    """
+    서버 렌더링된 트렌딩 페이지 HTML을 받아 파싱 (브라우저 없음)
+
+    Args:
+        client: httpx.Client
+        max_items: 최대 수집 개수
+        url: 트렌딩 페이지 URL
+
+    Returns:
+        tuple: (게시글 정보 리스트, 로딩 통계 딕셔너리)
+    """
+    started = time.perf_counter()
+    with stage('fetch'):
+        response = client.get(url)
+        response.raise_for_status()
+    count('requests')
+    count('bytes_fetched', len(response.content))
+    stats = {'requests': 1, 'bytes_received': len(response.content),
+             'load_ms': round((time.perf_counter() - started) * 1000, 1)}
+
+    with stage('extraction'):
+        posts = build_posts(extract_cards_html(response.text, max_items))
+    return posts, stats
+
+
+def crawl_velog_trending(max_items=20, browser_pool=None, extraction='batch', page_load=None,
+                         url=TRENDING_URL, http_client=None, sources=DEFAULT_SOURCES,
+                         api_url=VELOG_API_URL, retry_policy=None, breakers=None):
+    """
+    Velog 트렌딩 페이지 크롤링
+
+    sources 순서대로 시도해서 게시글을 얻은 첫 방식의 결과를 씁니다.
+    기본은 데이터 API → 서버 렌더링 HTML → 헤드리스 Chromium 순서라서
+    앞의 두 방식이 되면 브라우저를 띄우지 않습니다.
+    각 방식은 일시적인 오류에 재시도하고, breakers가 있으면 연속으로 실패해
+    서킷 브레이커가 열린 방식은 건너뜁니다 (마지막 방식은 항상 시도).
 
+    Args:
+        max_items: 최대 수집 개수
+        browser_pool: 공유 BrowserPool (없으면 이번 실행용 풀을 만들고 닫음)
+        extraction: 카드 추출 방식 ('batch' 또는 'element')
+        page_load: 페이지 로딩 설정 (wait_until, 차단할 리소스/호스트)
+        url: 트렌딩 페이지 URL (기본값: velog.io, 벤치마크에서는 로컬 서버)
+        http_client: 공유 httpx.Client (없으면 이번 실행용 클라이언트를 만들고 닫음)
+        sources: 시도할 방식 목록 ('api', 'html', 'browser')
+        api_url: GraphQL 엔드포인트
+        retry_policy: 일시적인 오류 재시도 규칙 (RetryPolicy, 없으면 기본값)
+        breakers: 방식별 서킷 브레이커 (CircuitBreakers, 없으면 사용하지 않음)
+
+    Returns:
+        tuple: (게시글 정보 리스트, 로딩 통계 딕셔너리 - source와 실패한 방식의 fallbacks 포함)
+    """
+    print("Velog 트렌딩 크롤링 시작...")
+
+    def scrape(page):
+        return scrape_trending_page(page, max_items, extraction, page_load, url)
+
+    def browse():
+        if browser_pool is not None:
+            return browser_pool.run(scrape)
+        with BrowserPool() as pool:
+            return pool.run(scrape)
+
+    client = http_client
+    own_client = client is None and any(source != 'browser' for source in sources)
+    if own_client:
+        client = create_http_client()
+
+    fetchers = {
+        'api': lambda: fetch_trending_api(client, max_items, api_url, trending_timeframe(url)),
+        'html': lambda: fetch_trending_html(client, max_items, url),
+        'browser': browse,
+    }
+
+    posts, load_stats = [], {}
+    fallbacks = []
+    try:
+        for index, source in enumerate(sources):
+            breaker_name = f'velog_trending:{source}'
+            if breakers is not None and index < len(sources) - 1 and not breakers.allow(breaker_name):
+                print(f"⏭️  {source} 방식은 연속 실패로 건너뜁니다 (서킷 브레이커 열림)")
+                fallbacks.append({'source': source, 'error': '서킷 브레이커 열림', 'breaker': 'open'})
+                continue
+
+            try:
+                if source not in fetchers:
+                    raise ValueError(f"지원하지 않는 방식입니다: {source}")
+                posts, load_stats = retry_call(fetchers[source], retry_policy, source)
+                if not posts:
+                    raise ValueError("찾은 게시글이 없습니다")
+            except Exception as e:
+                print(f"⚠️  {source} 방식 실패, 다음 방식으로 넘어갑니다: {e}")
+                fallback = {'source': source, 'error': str(e)}
+                if breakers is not None:
+                    fallback['breaker'] = breakers.record_failure(breaker_name, e)['state']
+                fallbacks.append(fallback)
+                count(f'fallback.{source}')
+                posts, load_stats = [], {}
+                continue
+
+            if breakers is not None:
+                breakers.record_success(breaker_name)
+            load_stats['source'] = source
+            break
     finally:
-        logger.save()
+        if own_client:
+            client.close()
+
+    if fallbacks:
+        load_stats['fallbacks'] = fallbacks
+    print(f"\n📊 수집 결과: {len(posts)}개 게시글 ({load_stats.get('source', '실패')})")
+    return posts, load_stats
+
+
+def main(context=None, feed_ids=None):
+    """
+    메인 실행 함수
+
+    Args:
+        context: 오케스트레이터가 넘겨주는 CrawlContext (단독 실행 시 None)
+        feed_ids: 오케스트레이터가 넘겨주는 피드 ID 리스트 (이 크롤러는 velog_trending만 처리)
+    """
+    # 이 실행에서 잡는 단계 시간/카운터는 velog_trending 피드로 기록
+    with feed_scope('velog_trending'):
+        logger = CrawlLogger()
+        store = ItemStore()
+        own_client = None
+        success = False
+
+        try:
+            # 설정 로드
+            config = load_config()
+            feed_config = config['feeds']['velog_trending']
+            resilience_config = config.get('resilience', {})
+
+            output_path = f"docs/{feed_config['output']}"
+
+            # 저장소가 비어 있으면 기존 XML의 pubDate를 처음 본 시각으로 가져오기
+            if store.count('velog_trending') == 0:
+                store.seed('velog_trending', load_existing_pubdates(output_path))
+
+            # 크롤링 실행
+            browser_pool = context.browser_pool if context else None
+            http_client = context.http_client if context else None
+            if http_client is None:
+                http_client = own_client = create_http_client(config.get('http'))
+            posts, load_stats = crawl_velog_trending(
+                max_items=30,
+                browser_pool=browser_pool,
+                extraction=feed_config.get('extraction', 'batch'),
+                page_load=feed_config.get('page_load'),
+                url=feed_config.get('url', TRENDING_URL),
+                http_client=http_client,
+                sources=feed_config.get('sources', DEFAULT_SOURCES),
+                api_url=feed_config.get('api_url', VELOG_API_URL),
+                retry_policy=RetryPolicy.from_config(resilience_config.get('retry')),
+                breakers=CircuitBreakers.from_config(resilience_config.get('breaker'))
+            )
+
+            if not posts:
+                raise Exception("수집된 게시글이 없습니다")
+
+            # 제한 시간 초과로 취소됐으면 저장소/RSS를 건드리지 않음
+            check_cancelled(context)
+
+            # 필터 → 처음 본 시각 기록/pubDate 설정을 거쳐 RSS 생성 단계로 하나씩 넘김
+            # (pubDate는 처음 본 시각: 기존 글은 저장소의 기록, 새 글은 현재 시간)
+            keyword_filter = KeywordFilter.from_config(feed_config)
+            current_time = datetime.now(timezone.utc)
+            observed = ObserveItems(store, 'velog_trending', current_time, first_seen_as_date=True)
+            items = Pipeline(
+                posts,
+                filter_items(keyword_filter.match) if keyword_filter.active else None,
+                observed
+            ).on_done(lambda kept: count('items_kept', kept))
+
+            # RSS 생성
+            feed_info = {
+                'title': feed_config['name'],
+                'link': 'https://velog.io/trending',
+                'description': feed_config['description']
+            }
+
+            os.makedirs('docs', exist_ok=True)
+            details = {'page_load': load_stats}
+
+            # 아카이브 설정이 있으면 크롤링 창에서 빠진 글을 아카이브 페이지로 넘김
+            archive = FeedArchive.from_config(
+                store, 'velog_trending', feed_config, output_path,
+                base_url=config.get('site', {}).get('base_url'),
+                pub_date='first_seen'
+            )
+            if archive:
+                archive_stats = archive.publish(feed_info, items, current_time)
+                details['formats'] = archive_stats.pop('formats')
+                details['archive'] = archive_stats
+            else:
+                details['formats'] = create_feeds(feed_info, items, output_path, feed_config.get('formats'))
+
+            if keyword_filter.active:
+                print(f"🔎 필터링 결과: {items.count}개 게시글")
+            print(f"✨ 새로 추가된 글: {observed.new_items}개 / 기존 글: {items.count - observed.new_items}개")
+
+            # 성공 로그
+            check_cancelled(context)
+            logger.log_success(
+                'velog_trending',
+                items.count,
+                f'{output_path} 생성 완료',
+                details=details
+            )
+            success = True
+
+        except CrawlCancelled:
+            # 오케스트레이터가 이미 시간 초과 실패로 기록함
+            raise
+
+        except Exception as e:
+            # 실패 로그
+            logger.log_failure('velog_trending', str(e))
+            raise
+
+        finally:
+            if own_client is not None:
+                own_client.close()
+            # 취소됐으면 아무것도 남기지 않고, 아니면 로그를 저장하면서 오케스트레이터에 결과를 알림
+            finish_feed(context, 'velog_trending', success, logger)
+            store.close()
 
 
 if __name__ == '__main__':
-    main()
+    try:
+        main()
+    finally:
+        write_metrics()
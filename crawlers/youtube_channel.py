@@ -0,0 +1,375 @@
+"""유튜브 채널 영상 크롤러 (config.json에서 crawler가 youtube_channel인 모든 피드)"""
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from utils.config import load_config
+from utils.context import CrawlCancelled, check_cancelled, finish_feed, is_cancelled, start_feed_timer
+from utils.feed_formats import DEFAULT_FORMATS, format_path
+from utils.pipeline import FeedItem, ObserveItems, Pipeline, enrich, filter_items
+from utils.rss_generator import create_feeds
+from utils.logger import CrawlLogger
+from utils.http_cache import HttpCache, config_fingerprint
+from utils.http_client import create_http_client
+from utils.item_store import ItemStore
+from utils.keyword_filter import KeywordFilter
+from utils.youtube_atom import parse_youtube_atom
+from utils.feed_archive import FeedArchive
+from utils.metrics import count, feed_scope, stage, write_metrics
+from utils.resilience import RUN_DEADLINE, RetryPolicy, retry_call
+
+CRAWLER_NAME = 'youtube_channel'
+
+# 동시에 가져올 채널 수 기본값
+DEFAULT_CONCURRENCY = 8
+
+# 채널 피드 URL (crawlers.youtube_channel.feed_url 설정으로 바꿀 수 있음, 예: 로컬 벤치마크 서버)
+FEED_URL_TEMPLATE = 'https://www.youtube.com/feeds/videos.xml?channel_id={channel_id}'
+
+
+def youtube_feed_url(channel_id, template=FEED_URL_TEMPLATE):
+    """유튜브 채널 RSS URL"""
+    return template.format(channel_id=channel_id)
+
+
+def parse_feed_entries(content, parser='fast'):
+    """
+    채널 피드 본문에서 영상 항목 추출
+
+    기본은 유튜브 Atom 스키마 전용 경량 파서이고, 실패하거나 비어 있지 않은 본문에서
+    항목을 하나도 찾지 못하면 feedparser로 다시 파싱합니다.
+
+    Args:
+        content: 피드 본문 (bytes)
+        parser: 'fast'(경량 파서 우선) 또는 'feedparser'
+
+    Returns:
+        list: FeedItem 리스트 (date가 없으면 None)
+            경량 파서가 중간에 실패하면 처음부터 feedparser로 다시 읽어야 하므로 여기서는 모두 모음
+    """
+    if parser == 'fast':
+        try:
+            entries = list(parse_youtube_atom(content))
+        except Exception as e:
+            print(f"⚠️  경량 파서 실패, feedparser로 다시 파싱합니다: {e}")
+        else:
+            # 본문이 있는데 항목이 없으면 스키마가 달라졌을 수 있으므로 feedparser로 한 번 더 확인
+            if entries or not content.strip():
+                return entries
+            print("⚠️  경량 파서가 항목을 찾지 못해 feedparser로 다시 파싱합니다")
+
+    # feedparser는 import만 수십 ms 걸려서 실제로 필요할 때만 불러옴
+    import feedparser
+    feed = feedparser.parse(content)
+    entries = []
+    for entry in feed.entries:
+        published = entry.get('published_parsed')
+        entries.append(FeedItem(
+            entry.get('title', ''),
+            entry.get('link', ''),
+            entry.get('summary', ''),
+            entry.get('author', 'Unknown'),
+            datetime(*published[:6], tzinfo=timezone.utc) if published else None
+        ))
+    return entries
+
+
+def crawl_youtube_channel(client, channel_id, keyword_filter=None, exclude_shorts=False,
+                          http_cache=None, fingerprint=None, conditional=True, parser='fast',
+                          feed_url=None, retry_policy=None):
+    """
+    유튜브 채널 RSS를 가져와서 키워드 필터링
+
+    Args:
+        client: 공유 httpx.Client
+        channel_id: 유튜브 채널 ID
+        keyword_filter: 컴파일된 KeywordFilter (없거나 규칙이 없으면 모두 수집)
+        exclude_shorts: 쇼츠 제외 여부 (기본값: False)
+        http_cache: 조건부 요청에 쓸 HttpCache (없으면 매번 전체 다운로드)
+        fingerprint: 캐시 검증자를 쓸 수 있는지 판단할 설정 해시
+        conditional: 캐시 검증자로 조건부 요청을 보낼지 여부
+        parser: 피드 파서 ('fast' 또는 'feedparser')
+        feed_url: 채널 피드 URL (없으면 youtube.com 주소)
+        retry_policy: 일시적인 오류 재시도 규칙 (RetryPolicy, 없으면 기본값)
+
+    Returns:
+        Pipeline: 쇼츠 제외 → 날짜 보정 → 키워드 필터를 거친 영상(FeedItem)을 하나씩 내는 파이프라인
+            (채널 피드가 바뀌지 않았으면 None). 끝까지 소비하면 항목 수 기록과
+            HTTP 캐시 기록이 이뤄집니다.
+    """
+    # 유튜브 채널 RSS URL
+    rss_url = feed_url or youtube_feed_url(channel_id)
+
+    # 이전 응답의 ETag / Last-Modified로 조건부 요청
+    headers = http_cache.conditional_headers(rss_url, fingerprint) if http_cache and conditional else {}
+
+    def fetch():
+        response = client.get(rss_url, headers=headers)
+        if response.status_code != 304:
+            response.raise_for_status()
+        return response
+
+    # 네트워크 오류/5xx는 백오프하며 다시 시도
+    with stage('fetch'):
+        response = retry_call(fetch, retry_policy, 'fetch')
+    count('bytes_fetched', len(response.content))
+
+    if response.status_code == 304:
+        http_cache.record_hit()
+        print(f"♻️  [{channel_id}] 변경 없음 (304 Not Modified)")
+        return None
+    if http_cache:
+        http_cache.record_miss()
+
+    # RSS 파싱
+    with stage('parse'):
+        entries = parse_feed_entries(response.content, parser)
+    total = len(entries)
+    count('items_fetched', total)
+
+    if not entries:
+        raise Exception("피드에서 항목을 찾을 수 없습니다. 채널 ID를 확인하세요.")
+
+    filtering = keyword_filter is not None and keyword_filter.active
+    now = datetime.now(timezone.utc)
+
+    def not_short(video):
+        return '/shorts/' not in video.link
+
+    def default_date(video):
+        # 날짜가 없으면 현재 시간
+        if video.date is None:
+            video.date = now
+
+    def matches(video):
+        # 키워드 필터링 (규칙 하나라도 걸리면 추가)
+        if not keyword_filter.match(video):
+            return False
+        print(f"  ✅ {video.title}")
+        return True
+
+    def done(kept):
+        count('items_kept', kept)
+        if filtering:
+            print(f"📊 [{channel_id}] 필터링 결과: {kept}개 영상 (전체 {total}개 중)")
+        else:
+            print(f"✅ [{channel_id}] {kept}개 영상 수집 완료")
+        if http_cache:
+            http_cache.store(
+                rss_url,
+                response.headers.get('ETag'),
+                response.headers.get('Last-Modified'),
+                fingerprint,
+                kept
+            )
+
+    return Pipeline(
+        entries,
+        filter_items(not_short) if exclude_shorts else None,
+        enrich(default_date),
+        filter_items(matches) if filtering else None
+    ).on_done(done)
+
+
+def run_feed(feed_id, feed_config, client, parser='fast', base_url=None,
+             feed_url_template=FEED_URL_TEMPLATE, retry_policy=None, context=None, http_cache=None):
+    """
+    피드 하나 크롤링 후 RSS 생성
+
+    Args:
+        feed_id: 피드 ID
+        feed_config: 피드 설정 딕셔너리
+        client: 공유 httpx.Client
+        parser: 피드 파서 ('fast' 또는 'feedparser')
+        base_url: 아카이브 링크에 쓸 공개 URL 접두사 (없으면 상대 경로)
+        feed_url_template: 채널 피드 URL 형식 ({channel_id} 자리표시자)
+        retry_policy: 일시적인 오류 재시도 규칙 (RetryPolicy)
+        context: 취소 신호를 확인하고 결과를 알릴 피드 CrawlContext (취소되면 출력과 로그를 남기지 않음)
+        http_cache: 채널들이 함께 쓰는 HttpCache (저장은 호출한 쪽이 한 번에 함, 없으면 조건부 요청 안 함)
+
+    Raises:
+        CrawlCancelled: 제한 시간 초과로 취소됨
+        Exception: 크롤링 또는 RSS 생성 실패 시
+    """
+    logger = CrawlLogger()
+    feed_url = None
+    success = False
+
+    try:
+        channel_id = feed_config['channel_id']
+        filter_keywords = feed_config.get('filter_keywords', [])
+        exclude_shorts = feed_config.get('exclude_shorts', False)
+
+        output_path = f"docs/{feed_config['output']}"
+        feed_url = youtube_feed_url(channel_id, feed_url_template)
+
+        # 출력 파일이 있을 때만 캐시 검증자 사용 (없으면 새로 받아서 생성)
+        videos = crawl_youtube_channel(
+            client,
+            channel_id,
+            KeywordFilter.from_config(feed_config),
+            exclude_shorts,
+            http_cache=http_cache,
+            fingerprint=config_fingerprint(feed_config),
+            conditional=all(
+                os.path.exists(format_path(output_path, name))
+                for name in feed_config.get('formats') or DEFAULT_FORMATS
+            ),
+            parser=parser,
+            feed_url=feed_url,
+            retry_policy=retry_policy
+        )
+
+        check_cancelled(context)
+        if videos is None:
+            # 채널 피드가 그대로면 파싱/필터링/RSS 생성 생략
+            cached = http_cache.entry(feed_url) or {}
+            logger.log_success(
+                feed_id,
+                cached.get('count') or 0,
+                f'변경 없음 (304) - 기존 RSS 유지: {output_path}',
+                details={'http_cache': {'hits': 1, 'misses': 0}}
+            )
+            success = True
+            return
+
+        # RSS 생성
+        feed_info = {
+            'title': feed_config['name'],
+            'link': f'https://www.youtube.com/channel/{channel_id}',
+            'description': feed_config['description']
+        }
+
+        os.makedirs('docs', exist_ok=True)
+        details = {'http_cache': {'hits': 0, 'misses': 1}}
+
+        # 항목 이력을 기록하면서 RSS 생성 (아카이브 설정이 있으면 지난 영상은 아카이브 페이지로)
+        with ItemStore() as store:
+            crawled_at = datetime.now(timezone.utc)
+            videos.pipe(ObserveItems(store, feed_id, crawled_at))
+            archive = FeedArchive.from_config(store, feed_id, feed_config, output_path, base_url=base_url)
+            if archive:
+                archive_stats = archive.publish(feed_info, videos, crawled_at)
+                details['formats'] = archive_stats.pop('formats')
+                details['archive'] = archive_stats
+            else:
+                details['formats'] = create_feeds(feed_info, videos, output_path, feed_config.get('formats'))
+        check_cancelled(context)
+
+        # 성공 로그
+        if videos.count:
+            logger.log_success(
+                feed_id,
+                videos.count,
+                f'{output_path} 생성 완료 (필터: {", ".join(filter_keywords)})',
+                details=details
+            )
+        else:
+            # 영상이 없어도 성공으로 기록 (경고 메시지 포함)
+            logger.log_success(
+                feed_id,
+                0,
+                f'⚠️ 필터링된 영상 없음 - 빈 RSS 생성: {output_path}',
+                details=details
+            )
+        success = True
+
+    except CrawlCancelled:
+        # 시간 초과 실패는 이미 기록됨 (RSS를 못 썼으니 캐시 검증자도 버림)
+        if http_cache:
+            http_cache.discard(feed_url)
+        raise
+
+    except Exception as e:
+        # 실패 로그
+        if http_cache:
+            http_cache.discard(feed_url)
+        logger.log_failure(feed_id, str(e))
+        raise
+
+    finally:
+        # 취소됐으면 아무것도 남기지 않고, 아니면 로그를 저장하면서 오케스트레이터에 결과를 알림
+        finish_feed(context, feed_id, success, logger)
+
+
+def main(context=None, feed_ids=None):
+    """
+    메인 실행 함수
+
+    채널들을 공유 HTTP 클라이언트(keep-alive, 가능하면 HTTP/2)로 동시에 가져오고,
+    HTTP 캐시도 하나를 함께 써서 끝날 때 한 번만 저장합니다.
+    오케스트레이터가 피드별 제한 시간을 넘겨주면 채널마다 따로 걸어, 멈춘 채널은 그 채널만
+    실패로 기록하고 다른 채널의 결과는 그대로 둡니다.
+
+    Args:
+        context: 오케스트레이터가 넘겨주는 CrawlContext (단독 실행 시 None)
+        feed_ids: 실행할 피드 ID 리스트 (None이면 youtube_channel을 쓰는 활성 피드 전체)
+
+    Returns:
+        dict: {feed_id: 성공 여부 (실행 마감으로 건너뛰었으면 None)}
+    """
+    config = load_config()
+    if feed_ids is None:
+        feed_ids = [
+            feed_id for feed_id, feed_config in config['feeds'].items()
+            if feed_config.get('crawler') == CRAWLER_NAME and feed_config.get('enabled', True)
+        ]
+
+    crawler_config = config.get('crawlers', {}).get(CRAWLER_NAME, {})
+    concurrency = crawler_config.get('concurrency', DEFAULT_CONCURRENCY)
+    parser = crawler_config.get('parser', 'fast')
+    base_url = config.get('site', {}).get('base_url')
+    feed_url_template = crawler_config.get('feed_url', FEED_URL_TEMPLATE)
+    retry_policy = RetryPolicy.from_config(config.get('resilience', {}).get('retry'))
+    print(f"유튜브 채널 {len(feed_ids)}개 크롤링 시작... (동시 {concurrency}개)")
+
+    client = context.http_client if context and context.http_client else None
+    own_client = client is None
+    if own_client:
+        client = create_http_client(config.get('http'))
+    http_cache = HttpCache()
+
+    def run(feed_id):
+        # 제한 시간 초과로 취소된 작업은 남은 채널을 시작하지 않음
+        if is_cancelled(context):
+            return False
+        # 실행 마감이 지났으면 시작하지 않음 (기존 RSS 파일은 그대로)
+        if RUN_DEADLINE.expired():
+            logger = CrawlLogger()
+            logger.log_skipped(feed_id, '실행 마감 시간 초과')
+            finish_feed(context, feed_id, None, logger)
+            return None
+        feed_context = context.for_feed() if context else None
+        timer = start_feed_timer(feed_context, feed_id)
+        try:
+            with feed_scope(feed_id):
+                run_feed(feed_id, config['feeds'][feed_id], client, parser, base_url, feed_url_template,
+                         retry_policy, feed_context, http_cache)
+            return True
+        except Exception:
+            return False
+        finally:
+            if timer:
+                timer.cancel()
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix=CRAWLER_NAME) as executor:
+            results = dict(zip(feed_ids, executor.map(run, feed_ids)))
+    finally:
+        if own_client:
+            client.close()
+        # 취소된 작업은 캐시도 남기지 않음 (다음 실행이 304로 건너뛰지 않게)
+        if not is_cancelled(context):
+            http_cache.save()
+
+    success_count = sum(1 for success in results.values() if success)
+    print(f"\n📊 유튜브 채널 결과: 성공 {success_count}/{len(results)}")
+    return results
+
+
+if __name__ == '__main__':
+    results = main()
+    write_metrics()
+    if any(success is False for success in results.values()):
+        sys.exit(1)
@@ -1,72 +1,547 @@
 """모든 크롤러 실행"""
-import json
-import sys
-import importlib.util
+import argparse
 import os
-from utils.logger import CrawlLogger
+import signal
+import sys
+import time
+import queue
+import threading
+from contextlib import ExitStack
+from crawlers import CRAWLERS, load_crawler, required_resources
+from utils.config import DEFAULT_RECORDING_DIR, load_config
+from utils.context import CrawlContext
+from utils.logger import CrawlLogger, load_feed_status
 from utils.readme_updater import update_readme_feed_status
+from utils.metrics import METRICS, stage, write_metrics
+from utils.resilience import RUN_DEADLINE, CircuitBreakers
+from utils.scheduler import FeedScheduler
 
+# 동시에 실행할 크롤러 수 기본값
+DEFAULT_MAX_WORKERS = 3
+# 피드별 제한 시간 기본값 (초)
+DEFAULT_FEED_TIMEOUT = 180
+# 실행 마감까지 이만큼도 남지 않았으면 새 크롤러를 시작하지 않음 (초)
+DEFAULT_MIN_START_SECONDS = 30
+# 데몬 모드에서 실행할 피드가 없을 때 최대 대기 시간 (초)
+DEFAULT_POLL_SECONDS = 60
+# 제한 시간을 넘겨 취소한 작업이 끝나기를 새 워커가 기다리는 시간 (초)
+CANCEL_GRACE_SECONDS = 10
 
-def load_config():
-    """설정 파일 로드"""
-    with open('config.json', 'r', encoding='utf-8') as f:
-        return json.load(f)
+# 실행 중인 크롤러 작업 → 워커 스레드 (제한 시간을 넘겨 버린 작업도 끝날 때까지 남음)
+_running = {}
+_running_lock = threading.Lock()
 
 
-def run_crawler(crawler_name):
+def run_crawler(crawler_name, feed_ids, context=None):
     """
     특정 크롤러 실행
     
     Args:
         crawler_name: 크롤러 모듈 이름 (예: 'velog_trending')
+        feed_ids: 이 크롤러로 실행할 피드 ID 리스트
+        context: 크롤러에 넘길 CrawlContext
         
     Returns:
-        bool: 성공 여부
+        dict: {feed_id: 성공 여부 (건너뛰었으면 None)}
     """
+    if crawler_name not in CRAWLERS:
+        print(f"❌ 크롤러를 찾을 수 없습니다: {crawler_name}")
+        return {feed_id: False for feed_id in feed_ids}
+
     try:
-        # 크롤러 모듈 동적 import
-        module_path = f'crawlers/{crawler_name}.py'
-        
-        if not os.path.exists(module_path):
-            print(f"❌ 크롤러를 찾을 수 없습니다: {module_path}")
-            return False
-        
-        # 모듈 로드
-        spec = importlib.util.spec_from_file_location(crawler_name, module_path)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        # 크롤러 모듈은 처음 실행할 때 import (레지스트리가 캐시)
+        with stage(f'import.{crawler_name}'):
+            module = load_crawler(crawler_name)
         
         # main() 함수 실행
         print(f"\n{'='*60}")
-        print(f"🚀 {crawler_name} 실행 중...")
+        print(f"🚀 {crawler_name} 실행 중... ({', '.join(feed_ids)})")
         print(f"{'='*60}")
         
-        module.main()
+        # 피드별 결과를 돌려주지 않는 크롤러는 예외가 없으면 모두 성공
+        with stage(f'crawler.{crawler_name}'):
+            results = module.main(context, feed_ids) or {feed_id: True for feed_id in feed_ids}
         
         print(f"✅ {crawler_name} 완료\n")
-        return True
+        return {feed_id: results.get(feed_id, False) for feed_id in feed_ids}
         
     except Exception as e:
         print(f"❌ {crawler_name} 실패: {e}\n")
-        return False
+        return {feed_id: False for feed_id in feed_ids}
+
+
+def run_feeds(feeds, max_workers=DEFAULT_MAX_WORKERS, default_timeout=DEFAULT_FEED_TIMEOUT,
+              context=None, deadline=RUN_DEADLINE, min_start=DEFAULT_MIN_START_SECONDS):
+    """
+    여러 피드를 병렬로 실행
+
+    같은 크롤러를 쓰는 피드는 한 작업으로 묶어 크롤러에 넘기고(크롤러 안에서 동시 처리),
+    서로 다른 크롤러는 워커 스레드에서 병렬로 실행합니다.
+
+    피드별 제한 시간은 작업 context에 담아 넘기고 크롤러가 피드마다 따로 걸며(start_feed_timer),
+    크롤러는 끝난 피드의 결과를 context로 바로 알립니다(finish_feed). 모든 피드의 결과가
+    나왔는데도 작업 스레드가 CANCEL_GRACE_SECONDS 안에 끝나지 않으면(멈춘 채널이 있으면)
+    알린 결과로 마무리하고 더 기다리지 않습니다.
+    피드 제한 시간을 걸지 않는 크롤러나 멈춘 작업을 위해 작업 전체에도 제한 시간(피드 제한
+    시간의 합)을 두고, 넘기면 취소 신호를 보낸 뒤 아직 결과가 없는 피드만 실패로 기록합니다.
+    워커 스레드는 daemon이라 멈춘 작업을 더 기다리지 않고, 남은 작업이 있으면 새 워커가
+    그 작업이 끝나기를 CANCEL_GRACE_SECONDS만큼 기다린 뒤 이어받습니다.
+    이전 실행(예: 데몬의 지난 주기)의 스레드가 아직 돌고 있는 크롤러는 같은 출력을
+    동시에 쓰지 않도록 이번에는 건너뜁니다.
+    실행 마감(deadline)이 있으면 작업 제한 시간을 남은 시간 안으로 줄이고,
+    min_start초도 남지 않았을 때 차례가 온 작업은 시작하지 않고 건너뜁니다.
+
+    Args:
+        feeds: {feed_id: feed_config} 딕셔너리
+        max_workers: 동시에 실행할 크롤러 수
+        default_timeout: 피드별 제한 시간(초), feed_config['timeout']이 있으면 그 값 사용
+        context: 모든 크롤러가 공유할 CrawlContext
+        deadline: 실행 전체 마감 (RunDeadline)
+        min_start: 새 작업을 시작하는 데 필요한 최소 남은 시간(초)
+
+    Returns:
+        dict: {feed_id: 성공 여부 (건너뛰었으면 None)} (feeds 순서 유지)
+    """
+    # 크롤러별로 피드 묶기
+    groups = {}
+    for feed_id, feed_config in feeds.items():
+        groups.setdefault(feed_config['crawler'], []).append(feed_id)
+
+    def feed_timeouts(crawler_name):
+        return {feed_id: feeds[feed_id].get('timeout', default_timeout) for feed_id in groups[crawler_name]}
+
+    def job_timeout(crawler_name):
+        # 크롤러 안에서 채널이 하나씩 차례로 돌아도 각자 제한 시간을 다 쓸 수 있는 시간
+        return sum(feed_timeouts(crawler_name).values())
+
+    jobs = queue.Queue()
+    finished = queue.Queue()
+    started_at = {}
+    timeouts = {}
+    job_contexts = {}
+    reported_at = {}
+    results = {}
+    # 다른 워커가 이어받았으므로 지금 작업을 마치면 끝낼 워커 스레드
+    replaced = set()
+
+    for crawler_name in groups:
+        jobs.put(crawler_name)
+
+    def skip_group(crawler_name, reason):
+        logger = CrawlLogger()
+        for feed_id in groups[crawler_name]:
+            logger.log_skipped(feed_id, reason)
+        logger.save()
+        return {feed_id: None for feed_id in groups[crawler_name]}
+
+    def claim(crawler_name):
+        # 지난 실행의 스레드가 아직 이 크롤러를 돌리고 있으면 False
+        with _running_lock:
+            if crawler_name in _running:
+                return False
+            _running[crawler_name] = threading.current_thread()
+            return True
+
+    def release(crawler_name):
+        with _running_lock:
+            _running.pop(crawler_name, None)
+
+    def run_job(crawler_name):
+        job_context = (context or CrawlContext()).for_job(
+            feed_timeouts=feed_timeouts(crawler_name),
+            deadline=deadline,
+            # 피드 결과가 나오면 대기 중인 루프를 깨움
+            on_report=lambda feed_id, success: finished.put((crawler_name, None))
+        )
+        job_contexts[crawler_name] = job_context
+        timeouts[crawler_name] = deadline.clip(job_timeout(crawler_name))
+        started_at[crawler_name] = time.monotonic()
+        try:
+            return run_crawler(crawler_name, groups[crawler_name], job_context)
+        finally:
+            release(crawler_name)
+
+    def worker(wait_for=None):
+        if wait_for is not None:
+            # 취소한 작업이 다음 확인 지점에서 멈추기를 잠시 기다려 동시 실행 수를 max_workers로 유지
+            wait_for.join(CANCEL_GRACE_SECONDS)
+        while True:
+            try:
+                crawler_name = jobs.get_nowait()
+            except queue.Empty:
+                return
+            remaining = deadline.remaining()
+            if remaining is not None and remaining < min_start:
+                finished.put((crawler_name, skip_group(crawler_name, '실행 마감 시간까지 남은 시간이 부족함')))
+                continue
+            if not claim(crawler_name):
+                finished.put((crawler_name, skip_group(crawler_name, '이전 실행이 아직 끝나지 않음')))
+                continue
+            finished.put((crawler_name, run_job(crawler_name)))
+            with _running_lock:
+                if threading.current_thread() in replaced:
+                    return
+
+    def start_worker(wait_for=None):
+        threading.Thread(target=worker, args=(wait_for,), name='crawler-worker', daemon=True).start()
+
+    def hand_over(crawler_name):
+        # 결과가 정해진 작업의 스레드가 아직 돌고 있으면 남은 작업은 새 워커가 이어받음
+        if jobs.empty():
+            return
+        with _running_lock:
+            stuck = _running.get(crawler_name)
+            if stuck is None:
+                return
+            replaced.add(stuck)
+        start_worker(stuck)
+
+    for _ in range(min(max(1, max_workers), len(groups))):
+        start_worker()
+
+    while len(results) < len(groups):
+        # 가장 먼저 제한 시간이 끝나는 작업까지만 대기
+        now = time.monotonic()
+        deadlines = [
+            min(start + timeouts[crawler_name], reported_at.get(crawler_name, float('inf')) + CANCEL_GRACE_SECONDS)
+            for crawler_name, start in list(started_at.items())
+            if crawler_name not in results
+        ]
+        wait_seconds = max(0.0, min(deadlines) - now) if deadlines else 1.0
+
+        try:
+            crawler_name, group_results = finished.get(timeout=min(wait_seconds, 1.0))
+            # 피드 결과 알림(None)은 아래에서 확인하고, 이미 처리된 작업의 늦은 결과는 무시
+            if group_results is not None:
+                results.setdefault(crawler_name, group_results)
+        except queue.Empty:
+            pass
+
+        now = time.monotonic()
+        for crawler_name, start in list(started_at.items()):
+            if crawler_name in results:
+                continue
+            timeout = timeouts[crawler_name]
+            timed_out = now - start >= timeout
+            reported = job_contexts[crawler_name].reported()
+            if all(feed_id in reported for feed_id in groups[crawler_name]):
+                # 보통은 곧 작업 결과가 오므로 잠시 기다리고, 멈춘 채널 때문에 안 끝나면 알린 결과로 마무리
+                # (모든 피드가 끝났으므로 작업은 취소하지 않음: 남은 정리 작업은 그대로 진행)
+                reported_at.setdefault(crawler_name, now)
+                if timed_out or now - reported_at[crawler_name] >= CANCEL_GRACE_SECONDS:
+                    results[crawler_name] = reported
+                    hand_over(crawler_name)
+                continue
+            if timed_out:
+                print(f"⏱️  {crawler_name} 제한 시간 초과 ({timeout:g}초) - 취소 신호를 보냄\n")
+                # 이미 끝난 피드의 결과는 그대로 두고 결과가 없는 피드만 실패로 기록
+                reported = job_contexts[crawler_name].cancel()
+                logger = CrawlLogger()
+                for feed_id in groups[crawler_name]:
+                    if feed_id not in reported:
+                        logger.log_failure(feed_id, f'제한 시간 초과 ({timeout:g}초)')
+                logger.save()
+                results[crawler_name] = {feed_id: reported.get(feed_id, False) for feed_id in groups[crawler_name]}
+                hand_over(crawler_name)
+
+    return {feed_id: results[feeds[feed_id]['crawler']][feed_id] for feed_id in feeds}
+
+
+def skip_open_breakers(feeds, breakers):
+    """
+    서킷 브레이커가 열린 피드를 실행 목록에서 빼고 건너뜀으로 기록
+
+    Args:
+        feeds: {feed_id: feed_config} 딕셔너리
+        breakers: CircuitBreakers
+
+    Returns:
+        tuple: (실행할 피드 딕셔너리, 건너뛴 피드의 {feed_id: None})
+    """
+    runnable = {}
+    skipped = {}
+    logger = CrawlLogger()
+    for feed_id, feed_config in feeds.items():
+        state = breakers.state(feed_id)
+        if state['state'] == 'open':
+            logger.log_skipped(
+                feed_id,
+                f"서킷 브레이커 열림 ({state['consecutive_failures']}회 연속 실패, {state['retry_after']}까지)",
+                details={'breaker': state}
+            )
+            skipped[feed_id] = None
+        else:
+            runnable[feed_id] = feed_config
+    logger.save()
+    return runnable, skipped
+
+
+def record_breakers(results, breakers):
+    """
+    실행 결과를 서킷 브레이커에 반영하고, 열리거나 다시 닫히면 크롤링 로그에 기록
+
+    Args:
+        results: {feed_id: 성공 여부 (건너뛰었으면 None)}
+        breakers: CircuitBreakers
+    """
+    feed_status = load_feed_status() or {}
+    logger = CrawlLogger()
+    for feed_id, success in results.items():
+        if success is None:
+            continue
+        if success:
+            state = breakers.record_success(feed_id)
+        else:
+            state = breakers.record_failure(feed_id, feed_status.get(feed_id, {}).get('last_error'))
+        if state['state'] != state['previous_state']:
+            logger.log_breaker(feed_id, state)
+            if state['state'] == 'open':
+                print(f"🔌 {feed_id} 서킷 브레이커 열림 - {state['retry_after']}까지 건너뜀")
+    logger.save()
+
+
+def parse_args(argv=None):
+    """명령행 인자 파싱"""
+    parser = argparse.ArgumentParser(description='RSS 피드 생성')
+    parser.add_argument('--workers', type=int, help='동시에 실행할 크롤러 수')
+    parser.add_argument('--timeout', type=float, help='피드별 제한 시간(초)')
+    parser.add_argument('--deadline', type=float, help='실행 전체 제한 시간(초), 넘기면 남은 피드는 건너뜀')
+    parser.add_argument('--list', action='store_true', help='등록된 크롤러와 피드 목록만 출력 (크롤러는 import하지 않음)')
+    parser.add_argument('--daemon', action='store_true',
+                        help='계속 실행하며 피드별 갱신 주기에 맞춰 크롤링 (브라우저/HTTP 연결 유지)')
+    traffic = parser.add_mutually_exclusive_group()
+    traffic.add_argument('--record', nargs='?', const=DEFAULT_RECORDING_DIR, metavar='DIR',
+                         help=f'네트워크 트래픽 녹화 (HAR + HTTP 교환, 기본값: {DEFAULT_RECORDING_DIR}/)')
+    traffic.add_argument('--replay', nargs='?', const=DEFAULT_RECORDING_DIR, metavar='DIR',
+                         help='녹화한 트래픽으로 네트워크 없이 실행 (docs/, state/ 대신 DIR/replay/에 씀)')
+    return parser.parse_args(argv)
+
+
+def run_cycle(feeds, context, max_workers=DEFAULT_MAX_WORKERS, feed_timeout=DEFAULT_FEED_TIMEOUT,
+              breakers=None, deadline_seconds=None, min_start=DEFAULT_MIN_START_SECONDS):
+    """
+    피드 한 차례 실행 (서킷 브레이커 확인 → 병렬 실행 → 브레이커 갱신)
+
+    Args:
+        feeds: {feed_id: feed_config} 딕셔너리
+        context: 크롤러가 공유할 CrawlContext
+        max_workers: 동시에 실행할 크롤러 수
+        feed_timeout: 피드별 제한 시간(초)
+        breakers: CircuitBreakers (없으면 기본 설정)
+        deadline_seconds: 이번 실행 전체 제한 시간(초), 없으면 제한 없음
+        min_start: 새 작업을 시작하는 데 필요한 최소 남은 시간(초)
+
+    Returns:
+        dict: {feed_id: 성공 여부 (건너뛰었으면 None)} (feeds 순서 유지)
+    """
+    breakers = breakers or CircuitBreakers()
+    RUN_DEADLINE.start(deadline_seconds)
+
+    # 연속 실패로 서킷 브레이커가 열린 피드는 건너뜀 (기존 RSS 파일은 그대로 제공)
+    runnable, skipped = skip_open_breakers(feeds, breakers)
+    results = run_feeds(runnable, max_workers, feed_timeout, context, RUN_DEADLINE, min_start)
+    record_breakers(results, breakers)
+
+    results.update(skipped)
+    return {feed_id: results[feed_id] for feed_id in feeds if feed_id in results}
+
 
+def count_items(feed_ids):
+    """항목 저장소에 기록된 피드별 항목 수 (새 항목 수를 세는 데 사용)"""
+    from utils.item_store import ItemStore
 
-def main():
+    with ItemStore() as store:
+        return {feed_id: store.count(feed_id) for feed_id in feed_ids}
+
+
+def publish_status(update_readme=True):
+    """
+    계측 파일과 README 피드 상태 테이블 갱신
+
+    Args:
+        update_readme: README.md도 갱신할지 (재생 모드에서는 저장소 파일을 건드리지 않음)
+    """
+    # 단계별 시간/자원 계측 저장 (state/metrics.json, state/metrics.prom)
+    try:
+        write_metrics()
+    except Exception as e:
+        print(f"⚠️  계측 저장 실패: {e}")
+
+    # README.md 피드 상태 테이블 업데이트
+    if not update_readme:
+        return
+    print("\n📝 README.md 업데이트 중...")
+    try:
+        update_readme_feed_status()
+    except Exception as e:
+        print(f"⚠️  README 업데이트 실패: {e}")
+
+
+def run_daemon(feeds, context, daemon_config=None, stop_event=None, max_cycles=None, update_readme=True,
+               **cycle_options):
+    """
+    데몬 모드: 피드마다 정해진 주기가 되면 실행하고, 결과에 따라 주기를 조절
+
+    브라우저 풀과 HTTP 클라이언트(context)는 실행 사이에도 유지되므로
+    매번 Python/Playwright/Chromium을 새로 띄우지 않습니다.
+    stop_event가 설정되면 진행 중인 실행을 마친 뒤 멈춥니다.
+    한 번의 실행이 예외로 끝나면 오류를 출력하고 poll_seconds 뒤에 다시 시도합니다.
+
+    Args:
+        feeds: {feed_id: feed_config} 딕셔너리
+        context: 크롤러가 공유할 CrawlContext
+        daemon_config: config.json의 daemon 항목 (주기 기본값, poll_seconds)
+        stop_event: 종료 신호 (threading.Event)
+        max_cycles: 이 횟수만큼 실행하면 멈춤 (없으면 계속)
+        update_readme: 실행할 때마다 README.md 피드 상태도 갱신할지
+        **cycle_options: run_cycle()에 넘길 옵션
+
+    Returns:
+        FeedScheduler: 마지막 스케줄 상태
+    """
+    daemon_config = daemon_config or {}
+    scheduler = FeedScheduler(feeds, daemon_config)
+    stop_event = stop_event or threading.Event()
+    poll_seconds = daemon_config.get('poll_seconds', DEFAULT_POLL_SECONDS)
+    cycles = 0
+
+    print(f"🕰️  데몬 모드 시작: 피드 {len(feeds)}개")
+    while not stop_event.is_set():
+        due = scheduler.due()
+        wait_seconds = None
+        if due:
+            try:
+                METRICS.reset()
+                due_feeds = {feed_id: feeds[feed_id] for feed_id in due}
+                before = count_items(due)
+                results = run_cycle(due_feeds, context, **cycle_options)
+                after = count_items(due)
+
+                for feed_id, success in results.items():
+                    new_items = after[feed_id] - before[feed_id]
+                    state = scheduler.record(feed_id, success, new_items)
+                    status = "⏸️ " if success is None else "✅" if success else "❌"
+                    print(f"{status} {feed_id}: 새 항목 {new_items}개 → 다음 실행 {state['next_run']} "
+                          f"(주기 {state['interval_seconds'] / 60:.0f}분)")
+                scheduler.save()
+                publish_status(update_readme)
+            except Exception as e:
+                # 한 번의 오류로 데몬이 멈추지 않도록 기록만 하고, 바로 다시 돌지 않게 poll_seconds만큼 쉼
+                print(f"❌ 데몬 실행 실패 (피드 {len(due)}개): {type(e).__name__}: {e} → {poll_seconds}초 후 다시 시도")
+                wait_seconds = poll_seconds
+
+            cycles += 1
+            if max_cycles and cycles >= max_cycles:
+                break
+
+        if wait_seconds is None:
+            wait_seconds = min(poll_seconds, scheduler.seconds_until_next())
+        stop_event.wait(wait_seconds)
+
+    print("🛑 데몬 종료")
+    return scheduler
+
+
+def list_feeds(config):
+    """
+    등록된 크롤러와 피드 목록 출력
+
+    레지스트리와 설정만 읽으므로 크롤러 모듈이나 Playwright/feedparser를 import하지 않습니다.
+
+    Args:
+        config: 설정 딕셔너리
+    """
+    print("📦 크롤러")
+    for crawler_name, info in CRAWLERS.items():
+        print(f"  {crawler_name:20} {info['description']} [{', '.join(info['requires'])}]")
+
+    print("\n📰 피드")
+    for feed_id, feed_config in config['feeds'].items():
+        crawler_name = feed_config.get('crawler')
+        if crawler_name not in CRAWLERS:
+            status = "❓"
+        elif feed_config.get('enabled', True):
+            status = "✅"
+        else:
+            status = "⏭️ "
+        print(f"  {status} {feed_id:28} {crawler_name:20} docs/{feed_config.get('output', '')}")
+
+
+def main(argv=None):
     """모든 크롤러 실행"""
+    args = parse_args(argv)
+    if args.list:
+        list_feeds(load_config())
+        return
+
     print("RSS 피드 생성 시작\n")
-    
+    started = time.monotonic()
+
     # 설정 로드
     config = load_config()
-    
+    run_config = config.get('run', {})
+    resilience_config = config.get('resilience', {})
+    cycle_options = {
+        'max_workers': args.workers or run_config.get('max_workers', DEFAULT_MAX_WORKERS),
+        'feed_timeout': args.timeout or run_config.get('feed_timeout', DEFAULT_FEED_TIMEOUT),
+        'breakers': CircuitBreakers.from_config(resilience_config.get('breaker')),
+        'deadline_seconds': args.deadline or resilience_config.get('deadline_seconds'),
+        'min_start': resilience_config.get('min_start_seconds', DEFAULT_MIN_START_SECONDS)
+    }
+
     # 활성화된 피드만 실행
-    results = {}
+    enabled_feeds = {}
     for feed_id, feed_config in config['feeds'].items():
         if feed_config.get('enabled', True):
-            crawler_name = feed_config['crawler']
-            success = run_crawler(crawler_name)
-            results[feed_id] = success
+            enabled_feeds[feed_id] = feed_config
         else:
             print(f"⏭️  {feed_id} - 비활성화됨\n")
+
+    # --record / --replay: 크롤러의 모든 HTTP 교환을 녹화하거나 녹화본으로 재생
+    recorder = None
+    if args.record or args.replay:
+        from utils.recording import TrafficRecorder
+        recorder = TrafficRecorder('record', args.record) if args.record else TrafficRecorder('replay', os.path.abspath(args.replay))
+
+    # --replay: docs/와 state/는 녹화 디렉토리 아래 작업 디렉토리에 씀 (실제 피드/상태/README는 그대로)
+    if args.replay:
+        from utils.recording import enter_replay_workdir
+        print(f"📂 재생 결과 저장 위치: {enter_replay_workdir(recorder.directory)}\n")
+
+    # 데몬 모드에서는 SIGTERM/SIGINT를 받으면 진행 중인 실행을 마치고 종료
+    stop_event = threading.Event()
+    if args.daemon:
+        def request_stop(signum, frame):
+            print("\n🛑 종료 신호를 받았습니다. 진행 중인 실행을 마치고 종료합니다.")
+            stop_event.set()
+        signal.signal(signal.SIGTERM, request_stop)
+        signal.signal(signal.SIGINT, request_stop)
+
+    # 브라우저 풀과 HTTP 클라이언트는 오케스트레이터가 소유하고 모든 크롤러가 빌려 씀
+    # (이번에 실행할 크롤러가 필요로 하는 자원만 만들고, 해당 모듈도 그때 import)
+    resources = required_resources({feed_config['crawler'] for feed_config in enabled_feeds.values()})
+    with ExitStack() as stack:
+        browser_pool = None
+        http_client = None
+        if 'browser' in resources:
+            from utils.browser_pool import BrowserPool
+            browser_pool = stack.enter_context(BrowserPool(**config.get('browser', {}), recorder=recorder))
+        if 'http' in resources:
+            from utils.http_client import create_http_client
+            http_client = stack.enter_context(create_http_client(config.get('http'), recorder=recorder))
+        context = CrawlContext(browser_pool=browser_pool, http_client=http_client)
+
+        if args.daemon:
+            run_daemon(enabled_feeds, context, config.get('daemon'), stop_event,
+                       update_readme=not args.replay, **cycle_options)
+        else:
+            results = run_cycle(enabled_feeds, context, **cycle_options)
+
+    if recorder:
+        recorder.save()
+        print(recorder.summary())
+    if args.daemon:
+        return
     
     # 결과 요약
     print("\n" + "="*60)
@@ -74,23 +549,20 @@ def main():
     print("="*60)
     
     success_count = sum(1 for success in results.values() if success)
+    failure_count = sum(1 for success in results.values() if success is False)
     total_count = len(results)
     
     for feed_id, success in results.items():
-        status = "✅" if success else "❌"
+        status = "⏸️ " if success is None else "✅" if success else "❌"
         print(f"{status} {feed_id}")
     
-    print(f"\n성공: {success_count}/{total_count}")
-    
-    # README.md 피드 상태 테이블 업데이트
-    print("\n📝 README.md 업데이트 중...")
-    try:
-        update_readme_feed_status()
-    except Exception as e:
-        print(f"⚠️  README 업데이트 실패: {e}")
+    skipped_text = f", 건너뜀 {total_count - success_count - failure_count}" if success_count + failure_count < total_count else ""
+    print(f"\n성공: {success_count}/{total_count}{skipped_text} (소요 시간: {time.monotonic() - started:.1f}초)")
+
+    publish_status(update_readme=not args.replay)
 
-    # 하나라도 실패하면 exit code 1
-    if success_count < total_count:
+    # 하나라도 실패하면 exit code 1 (건너뛴 피드는 기존 RSS를 유지하므로 실패로 보지 않음)
+    if failure_count:
         sys.exit(1)
     else:
         print("\n🎉 모든 피드 생성 완료!")
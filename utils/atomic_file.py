@@ -0,0 +1,64 @@
+"""원자적 파일 쓰기 유틸리티"""
+import os
+import tempfile
+from contextlib import contextmanager
+
+# 현재 umask (읽으려면 바꿨다가 되돌려야 하므로 스레드가 뜨기 전인 import 시점에 한 번만 읽음)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+
+def _file_mode(path):
+    """교체할 파일의 권한 (기존 파일이 있으면 그 권한, 없으면 open()으로 만들 때와 같은 권한)"""
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except OSError:
+        return 0o666 & ~_UMASK
+
+
+@contextmanager
+def atomic_open(path, mode='wb', encoding=None):
+    """
+    같은 디렉토리의 임시 파일에 쓰고, 블록이 정상 종료되면 rename으로 교체
+
+    쓰는 도중 크래시가 나도 기존 파일이 잘린 채로 남지 않습니다.
+    mkstemp는 0600으로 만들므로, 교체 전에 기존 파일(없으면 umask 기준) 권한으로 맞춥니다.
+
+    Args:
+        path: 최종 파일 경로
+        mode: 'wb' 또는 'w'
+        encoding: 텍스트 모드 인코딩
+
+    Yields:
+        파일 객체
+    """
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f'.{os.path.basename(path)}.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, _file_mode(path))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def atomic_write(path, data):
+    """
+    bytes 또는 str을 원자적으로 파일에 저장
+
+    Args:
+        path: 파일 경로
+        data: 저장할 내용 (str이면 UTF-8로 인코딩)
+    """
+    if isinstance(data, str):
+        data = data.encode('utf-8')
+    with atomic_open(path, 'wb') as f:
+        f.write(data)
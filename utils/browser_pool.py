@@ -0,0 +1,188 @@
+"""공유 Chromium 브라우저 풀"""
+import asyncio
+import threading
+from concurrent.futures import TimeoutError as FutureTimeoutError
+
+from utils.metrics import current_feed, feed_scope, stage
+
+
+class _BrowserSlot:
+    """풀이 관리하는 브라우저 하나와 사용 현황"""
+
+    def __init__(self, browser):
+        self.browser = browser
+        self.active_contexts = 0
+        self.pages_served = 0
+        self.retired = False
+
+
+class BrowserPool:
+    """
+    여러 크롤러가 함께 쓰는 headless Chromium 풀
+
+    Playwright 객체는 만든 스레드에서만 쓸 수 있으므로 풀은 전용 이벤트 루프
+    스레드에서 async API로 브라우저를 관리합니다. 크롤러는 run()에 async 함수를
+    넘기고, 그 함수는 격리된 새 context의 page를 받아 실행됩니다.
+
+    브라우저는 처음 빌려갈 때 띄우고 풀을 닫을 때까지 재사용합니다.
+    브라우저 하나가 recycle_after_pages개의 page를 만들면 더 이상 빌려주지 않고,
+    사용 중인 context가 모두 반납되면 닫아서 Chromium 메모리 증가를 막습니다.
+    """
+
+    def __init__(self, max_contexts_per_browser=4, recycle_after_pages=50, max_browsers=1,
+                 headless=True, launch_options=None, recorder=None):
+        """
+        Args:
+            max_contexts_per_browser: 브라우저 하나에서 동시에 열 수 있는 context 수
+            recycle_after_pages: 브라우저 하나가 만들 page 수 (넘으면 새 브라우저로 교체)
+            max_browsers: 동시에 띄울 수 있는 브라우저 수
+            headless: headless 모드 여부
+            launch_options: chromium.launch()에 그대로 넘길 추가 옵션
+            recorder: 페이지 트래픽을 HAR로 녹화/재생할 TrafficRecorder (없으면 None)
+        """
+        self.max_contexts_per_browser = max_contexts_per_browser
+        self.recycle_after_pages = recycle_after_pages
+        self.max_browsers = max_browsers
+        self.launch_options = dict(launch_options or {}, headless=headless)
+        self.recorder = recorder
+
+        self._loop = None
+        self._thread = None
+        self._playwright = None
+        self._slots = []
+        self._condition = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        """이벤트 루프 스레드 시작 (브라우저는 처음 빌려갈 때 실행)"""
+        if self._thread is not None:
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='browser-pool', daemon=True)
+        self._thread.start()
+
+    def run(self, fn, timeout=None, **context_options):
+        """
+        새 context의 page로 fn을 실행하고 결과 반환
+
+        Args:
+            fn: page를 받아 coroutine을 돌려주는 함수 (예: async def scrape(page))
+            timeout: 결과를 기다릴 최대 시간(초), None이면 무제한
+            **context_options: browser.new_context()에 넘길 옵션
+
+        Returns:
+            fn의 반환값
+        """
+        self.start()
+        # 호출한 스레드의 피드를 이벤트 루프 task로 넘겨 계측이 그 피드에 잡히게 함
+        future = asyncio.run_coroutine_threadsafe(self._run(fn, context_options, current_feed()), self._loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise
+
+    def close(self):
+        """모든 브라우저와 Playwright 종료 후 이벤트 루프 정지"""
+        if self._thread is None:
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result(30)
+        except Exception as e:
+            print(f"⚠️  브라우저 풀 종료 오류: {e}")
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join(5)
+            self._loop.close()
+            self._thread = None
+            self._loop = None
+
+    @property
+    def browser_count(self):
+        """현재 떠 있는 브라우저 수"""
+        return len(self._slots)
+
+    async def _run(self, fn, context_options, feed_id):
+        with feed_scope(feed_id):
+            return await self._run_in_context(fn, context_options, feed_id)
+
+    async def _run_in_context(self, fn, context_options, feed_id):
+        slot = await self._acquire()
+        context = None
+        try:
+            with stage('browser_context'):
+                context = await slot.browser.new_context(**context_options)
+                if self.recorder is not None:
+                    await self.recorder.attach(context, feed_id)
+                page = await context.new_page()
+            return await fn(page)
+        finally:
+            if context is not None:
+                try:
+                    await context.close()
+                except Exception:
+                    pass
+            await self._release(slot)
+
+    async def _acquire(self):
+        """빈 자리가 있는 브라우저를 고르고, 없으면 새로 띄우거나 반납을 기다림"""
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+
+        async with self._condition:
+            if self._playwright is None:
+                from playwright.async_api import async_playwright
+                with stage('playwright_start'):
+                    self._playwright = await async_playwright().start()
+
+            while True:
+                # 연결이 끊긴 브라우저(크래시 등)는 버림
+                self._slots = [s for s in self._slots if s.browser.is_connected()]
+                live = [s for s in self._slots if not s.retired]
+
+                slot = next(
+                    (s for s in live if s.active_contexts < self.max_contexts_per_browser),
+                    None
+                )
+                if slot is None and len(live) < self.max_browsers:
+                    with stage('browser_launch'):
+                        browser = await self._playwright.chromium.launch(**self.launch_options)
+                    slot = _BrowserSlot(browser)
+                    self._slots.append(slot)
+                if slot is not None:
+                    break
+                await self._condition.wait()
+
+            slot.active_contexts += 1
+            slot.pages_served += 1
+            if slot.pages_served >= self.recycle_after_pages:
+                slot.retired = True
+            return slot
+
+    async def _release(self, slot):
+        async with self._condition:
+            slot.active_contexts -= 1
+            if slot.retired and slot.active_contexts == 0 and slot in self._slots:
+                self._slots.remove(slot)
+                try:
+                    await slot.browser.close()
+                except Exception:
+                    pass
+            self._condition.notify_all()
+
+    async def _shutdown(self):
+        for slot in self._slots:
+            try:
+                await slot.browser.close()
+            except Exception:
+                pass
+        self._slots = []
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
@@ -0,0 +1,24 @@
+"""설정 파일 로드"""
+import json
+import os
+
+# 저장소 루트의 config.json (작업 디렉토리와 관계없이 같은 파일)
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'config.json')
+
+# 기본 녹화 디렉토리 (utils.recording과 run_all.py가 함께 씀. utils.recording은 httpx를 불러오므로
+# run_all.py는 --record/--replay일 때만 import하고, 인자 기본값은 여기서 읽음)
+DEFAULT_RECORDING_DIR = 'recordings'
+
+
+def load_config(path=CONFIG_PATH):
+    """
+    설정 파일 로드
+
+    Args:
+        path: 설정 파일 경로 (기본값: 저장소 루트의 config.json)
+
+    Returns:
+        dict: 설정
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
@@ -0,0 +1,170 @@
+"""크롤러 실행 컨텍스트"""
+import threading
+
+from utils.logger import CrawlLogger
+
+
+class CrawlCancelled(Exception):
+    """오케스트레이터가 제한 시간을 넘긴 크롤러 실행을 취소함"""
+
+
+class CrawlContext:
+    """
+    오케스트레이터가 소유하고 크롤러들이 빌려 쓰는 공유 자원 묶음
+
+    크롤러를 단독 실행할 때는 context 없이 main()을 호출하며,
+    이 경우 크롤러가 필요한 자원을 직접 만들고 정리합니다.
+
+    오케스트레이터는 크롤러 작업마다 for_job()으로 취소 신호(cancel_event)를 따로 가진
+    context를 넘기고, 제한 시간을 넘기면 신호를 보냅니다. 스레드는 강제로 멈출 수 없으므로
+    크롤러는 출력을 쓰거나 로그를 남기기 직전에 check_cancelled()로 확인합니다.
+
+    크롤러는 피드마다 for_feed()로 피드 context를 만들어 그 피드의 제한 시간을 걸고,
+    끝난 피드는 finish_feed()로 로그를 저장하면서 결과를 작업 context에 알립니다.
+    그래서 오케스트레이터는 작업 전체가 끝나기를 기다리지 않고도 피드별 결과를 알 수 있고,
+    작업을 취소할 때도 이미 끝난 피드의 결과는 그대로 둡니다.
+    """
+
+    def __init__(self, browser_pool=None, http_client=None, cancel_event=None,
+                 feed_timeouts=None, deadline=None, on_report=None, parent=None):
+        """
+        Args:
+            browser_pool: 공유 BrowserPool (없으면 None)
+            http_client: 공유 httpx.Client (없으면 None)
+            cancel_event: 취소 신호 (없으면 새로 만듦)
+            feed_timeouts: {feed_id: 제한 시간(초)} (없으면 크롤러가 피드 제한 시간을 걸지 않음)
+            deadline: 피드 제한 시간을 남은 시간 안으로 줄일 실행 마감 (RunDeadline)
+            on_report: 피드 결과가 나올 때마다 호출할 함수 (feed_id, success)
+            parent: 피드 context의 작업 context (결과와 잠금을 같이 쓰고 취소 신호를 물려받음)
+        """
+        self.browser_pool = browser_pool
+        self.http_client = http_client
+        self.cancel_event = cancel_event or threading.Event()
+        self.parent = parent
+        if parent is not None:
+            self.feed_timeouts = parent.feed_timeouts
+            self.deadline = parent.deadline
+            self.on_report = parent.on_report
+            self.results = parent.results
+            self.lock = parent.lock
+        else:
+            self.feed_timeouts = feed_timeouts or {}
+            self.deadline = deadline
+            self.on_report = on_report
+            self.results = {}
+            self.lock = threading.Lock()
+
+    def for_job(self, feed_timeouts=None, deadline=None, on_report=None):
+        """같은 공유 자원을 쓰고 취소 신호와 피드 결과만 따로 가진 context (크롤러 작업 하나용)"""
+        return CrawlContext(browser_pool=self.browser_pool, http_client=self.http_client,
+                            feed_timeouts=feed_timeouts, deadline=deadline, on_report=on_report)
+
+    def for_feed(self):
+        """작업의 취소 신호를 따르면서 이 피드만 따로 취소할 수 있는 context (피드 하나용)"""
+        return CrawlContext(browser_pool=self.browser_pool, http_client=self.http_client, parent=self)
+
+    def cancelled(self):
+        """이 context나 작업 context가 취소됐는지"""
+        return self.cancel_event.is_set() or (self.parent is not None and self.parent.cancelled())
+
+    def cancel(self):
+        """
+        취소 신호를 보내고 그때까지 끝난 피드의 결과 반환
+
+        Returns:
+            dict: {feed_id: 성공 여부} (이후에는 finish_feed()가 결과를 남기지 않음)
+        """
+        with self.lock:
+            self.cancel_event.set()
+            return dict(self.results)
+
+    def reported(self):
+        """지금까지 finish_feed()로 알린 피드 결과 ({feed_id: 성공 여부})"""
+        with self.lock:
+            return dict(self.results)
+
+    def feed_timeout(self, feed_id):
+        """피드의 제한 시간(초), 실행 마감이 더 가까우면 남은 시간 (제한이 없으면 None)"""
+        timeout = self.feed_timeouts.get(feed_id)
+        if timeout is not None and self.deadline is not None:
+            timeout = self.deadline.clip(timeout)
+        return timeout
+
+
+def is_cancelled(context):
+    """context가 취소됐는지 (단독 실행처럼 context가 없으면 False)"""
+    return context is not None and context.cancelled()
+
+
+def check_cancelled(context):
+    """
+    취소됐으면 CrawlCancelled 발생
+
+    Raises:
+        CrawlCancelled: 오케스트레이터가 이 작업을 취소함
+    """
+    if is_cancelled(context):
+        raise CrawlCancelled("제한 시간 초과로 취소됨 - 출력과 로그를 남기지 않음")
+
+
+def finish_feed(context, feed_id, success, logger, cancel=False):
+    """
+    피드 하나의 로그를 저장하고 결과를 작업 context에 알림
+
+    취소 확인과 저장을 같은 잠금 안에서 하므로, 제한 시간 초과로 기록된 피드에 크롤러가
+    뒤늦게 결과를 남기거나 이미 결과를 남긴 피드가 시간 초과로 다시 기록되지 않습니다.
+
+    Args:
+        context: 피드 또는 작업 CrawlContext (없으면 로그만 저장)
+        feed_id: 피드 ID
+        success: 성공 여부 (건너뛰었으면 None)
+        logger: 이 피드의 항목을 담은 CrawlLogger
+        cancel: 저장하면서 context도 취소 (피드 제한 시간 초과를 기록할 때)
+
+    Returns:
+        bool: 저장했는지 (이미 취소됐거나 결과가 있으면 False)
+    """
+    if context is None:
+        logger.save()
+        return True
+    with context.lock:
+        if context.cancelled() or feed_id in context.results:
+            return False
+        if cancel:
+            context.cancel_event.set()
+        logger.save()
+        context.results[feed_id] = success
+    if context.on_report:
+        context.on_report(feed_id, success)
+    return True
+
+
+def start_feed_timer(context, feed_id):
+    """
+    피드 context에 그 피드의 제한 시간 걸기
+
+    시간이 지나면 피드를 실패로 기록하고 취소하므로, 멈춘 피드가 같은 작업의 다른 피드
+    결과에 영향을 주지 않습니다. 피드가 끝나면 반환된 타이머를 cancel()합니다.
+
+    Args:
+        context: for_feed()로 만든 피드 context (None이면 제한 없음)
+        feed_id: 피드 ID
+
+    Returns:
+        threading.Timer: 시작한 타이머 (제한 시간이 없으면 None)
+    """
+    timeout = context.feed_timeout(feed_id) if context is not None else None
+    if timeout is None:
+        return None
+
+    def expire():
+        if context.cancelled() or feed_id in context.reported():
+            return
+        logger = CrawlLogger()
+        logger.log_failure(feed_id, f'제한 시간 초과 ({timeout:g}초)')
+        finish_feed(context, feed_id, False, logger, cancel=True)
+
+    timer = threading.Timer(timeout, expire)
+    timer.daemon = True
+    timer.start()
+    return timer
@@ -0,0 +1,173 @@
+"""페이지 단위 피드 아카이브 (RFC 5005 Feed Paging and Archiving)"""
+import os
+
+from utils.pipeline import FeedItem
+from utils.rss_generator import create_feeds, create_rss_feed
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def archive_dir(output_path):
+    """피드 출력 경로에 대응하는 아카이브 디렉토리 (docs/foo.xml -> docs/archive/foo)"""
+    stem = os.path.splitext(os.path.basename(output_path))[0]
+    return os.path.join(os.path.dirname(output_path), 'archive', stem)
+
+
+def archive_page_path(output_path, page, newest):
+    """
+    아카이브 페이지 파일 경로
+
+    Args:
+        output_path: 메인 피드 경로
+        page: 페이지 번호 (1부터, 오래된 순)
+        newest: 페이지에서 가장 최근에 처음 본 시각
+
+    Returns:
+        str: 예) docs/archive/velog-trending/0003-20240105.xml
+    """
+    return os.path.join(archive_dir(output_path), f"{page:04d}-{newest:%Y%m%d}.xml")
+
+
+class FeedArchive:
+    """
+    메인 피드는 작게 유지하고, 크롤링 창에서 빠진 항목은 아카이브 페이지로 넘기기
+
+    - 메인 피드: 이번 크롤링 결과 + 아직 페이지를 채우지 못한 지난 항목 (page_size개 미만)
+    - 아카이브 페이지: 지난 항목 page_size개씩, 처음 본 순서대로 번호를 매긴 고정 문서
+
+    메인 피드는 가장 최근 페이지를 prev-archive로, 각 페이지는 fh:archive 표시와 함께
+    current(메인 피드), prev-archive(이전 페이지), next-archive(다음 페이지)를 가리킵니다.
+    페이지에 들어간 항목은 ItemStore에 페이지 번호로 고정되므로 페이지 내용은 바뀌지 않고,
+    다음 페이지가 생길 때 next-archive 링크가 한 번 추가될 뿐입니다.
+    """
+
+    def __init__(self, store, feed_id, output_path, page_size=DEFAULT_PAGE_SIZE,
+                 base_url=None, pub_date='published', formats=None):
+        """
+        Args:
+            store: ItemStore
+            feed_id: 피드 ID
+            output_path: 메인 피드 경로 (docs/...)
+            page_size: 아카이브 페이지당 항목 수
+            base_url: 공개 URL 접두사 (docs/ 기준, 없으면 상대 경로 링크)
+            pub_date: 지난 항목의 pubDate로 쓸 값 ('published' 또는 'first_seen')
+            formats: 메인 피드의 출력 형식 목록 (아카이브 페이지는 RSS만 씀)
+        """
+        self.store = store
+        self.feed_id = feed_id
+        self.output_path = output_path
+        self.page_size = max(1, page_size)
+        self.base_url = base_url.rstrip('/') if base_url else None
+        self.pub_date = pub_date
+        self.formats = formats
+
+    @classmethod
+    def from_config(cls, store, feed_id, feed_config, output_path, base_url=None, pub_date='published'):
+        """
+        피드 설정의 archive 항목으로 생성 (없거나 enabled=false면 None)
+
+        설정 형식 (config.json):
+            "archive": {"page_size": 50}
+        """
+        archive_config = feed_config.get('archive')
+        if not archive_config or not archive_config.get('enabled', True):
+            return None
+        return cls(
+            store,
+            feed_id,
+            output_path,
+            page_size=archive_config.get('page_size', DEFAULT_PAGE_SIZE),
+            base_url=base_url,
+            pub_date=pub_date,
+            formats=feed_config.get('formats')
+        )
+
+    def _url(self, target, source):
+        """source 문서에서 target 문서를 가리키는 URL"""
+        if self.base_url:
+            docs_dir = os.path.dirname(self.output_path) or '.'
+            return f"{self.base_url}/{os.path.relpath(target, docs_dir).replace(os.sep, '/')}"
+        return os.path.relpath(target, os.path.dirname(source) or '.').replace(os.sep, '/')
+
+    def _as_post(self, item):
+        """저장소 항목을 FeedItem으로 변환"""
+        date = item['first_seen'] if self.pub_date == 'first_seen' else (item['date'] or item['first_seen'])
+        return FeedItem(item['title'] or item['link'], item['link'], item['summary'], item['author'], date)
+
+    def _write_page(self, feed_info, pages, index):
+        """아카이브 페이지 하나 쓰기 (내용이 같으면 create_rss_feed가 건너뜀)"""
+        page, _, newest = pages[index]
+        path = archive_page_path(self.output_path, page, newest)
+
+        links = [{'href': self._url(self.output_path, path), 'rel': 'current'}]
+        if index > 0:
+            prev_page, _, prev_newest = pages[index - 1]
+            links.append({
+                'href': self._url(archive_page_path(self.output_path, prev_page, prev_newest), path),
+                'rel': 'prev-archive'
+            })
+        if index + 1 < len(pages):
+            next_page, _, next_newest = pages[index + 1]
+            links.append({
+                'href': self._url(archive_page_path(self.output_path, next_page, next_newest), path),
+                'rel': 'next-archive'
+            })
+
+        page_info = dict(
+            feed_info,
+            title=f"{feed_info['title']} (아카이브 {page})",
+            links=links,
+            archive=True
+        )
+        items = self.store.archive_page_items(self.feed_id, page)
+        create_rss_feed(page_info, [self._as_post(item) for item in items], path)
+
+    def publish(self, feed_info, posts, crawled_at):
+        """
+        아카이브 페이지를 갱신하고 메인 피드 생성
+
+        Args:
+            feed_info: 피드 정보 딕셔너리
+            posts: 이번 크롤링 게시글 (리스트 또는 Pipeline, 여기서 먼저 모두 받아서
+                ItemStore 기록을 마친 뒤 지난 항목을 조회함)
+            crawled_at: 이번 크롤링의 관측 시각 (observe에 넘긴 seen_at)
+
+        Returns:
+            dict: {pages, sealed, pending} 통계와 메인 피드의 형식별 출력 결과(formats)
+        """
+        posts = list(posts)
+        current = {post['link'] for post in posts}
+        pending = [item for item in self.store.pending_archive(self.feed_id, crawled_at)
+                   if item['link'] not in current]
+
+        # 꽉 찬 만큼 새 페이지로 고정
+        pages = self.store.archive_pages(self.feed_id)
+        next_page = pages[-1][0] + 1 if pages else 1
+        sealed = 0
+        while len(pending) >= self.page_size:
+            chunk, pending = pending[:self.page_size], pending[self.page_size:]
+            self.store.assign_archive_page(self.feed_id, [item['link'] for item in chunk], next_page)
+            next_page += 1
+            sealed += 1
+
+        if sealed:
+            pages = self.store.archive_pages(self.feed_id)
+            print(f"🗄️  아카이브 페이지 {sealed}개 추가 (전체 {len(pages)}개)")
+
+        # 새 페이지, next-archive가 생긴 직전 페이지, 그리고 파일이 없는 페이지만 쓰기
+        for index, (page, _, newest) in enumerate(pages):
+            if index >= len(pages) - sealed - 1 or not os.path.exists(
+                    archive_page_path(self.output_path, page, newest)):
+                self._write_page(feed_info, pages, index)
+
+        main_info = dict(feed_info)
+        if pages:
+            page, _, newest = pages[-1]
+            main_info['links'] = [{
+                'href': self._url(archive_page_path(self.output_path, page, newest), self.output_path),
+                'rel': 'prev-archive'
+            }]
+        formats = create_feeds(main_info, posts + [self._as_post(item) for item in pending],
+                               self.output_path, self.formats)
+
+        return {'pages': len(pages), 'sealed': sealed, 'pending': len(pending), 'formats': formats}
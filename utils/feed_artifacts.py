@@ -0,0 +1,174 @@
+"""미리 압축한 피드 파일(.gz/.br)과 검증자 매니페스트
+
+정적 호스팅(GitHub Pages)이나 CDN이 압축본과 ETag/Last-Modified를 다시 계산하지 않고
+바로 쓸 수 있도록, 피드 XML이 바뀔 때마다 옆에 압축본을 만들고 docs/manifest.json에
+내용 해시, 크기, 수정 시각을 기록합니다.
+"""
+import gzip
+import hashlib
+import json
+import os
+from contextlib import ExitStack
+from email.utils import formatdate
+
+from utils.atomic_file import atomic_open, atomic_write
+from utils.file_lock import file_lock
+from utils.metrics import count
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 .gz만 생성
+    brotli = None
+
+MANIFEST_FILE = 'docs/manifest.json'
+MANIFEST_LOCK_FILE = 'state/manifest.json.lock'
+
+# 압축본 확장자
+SUFFIXES = {'gzip': '.gz', 'br': '.br'}
+
+# 만들 인코딩 (brotli 품질 11은 큰 피드에서 수 초 걸리므로 9 사용)
+ENCODINGS = ('gzip', 'br') if brotli is not None else ('gzip',)
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 9
+
+# 파일을 읽는 단위 (큰 피드도 메모리 사용량이 일정하도록)
+CHUNK_SIZE = 64 * 1024
+
+
+def strong_etag(digest, encoding=None):
+    """
+    내용 해시로 만든 강한 ETag (피드 서버와 같은 형식)
+
+    Args:
+        digest: sha256 hex 문자열
+        encoding: 압축본이면 인코딩 이름 (표현마다 ETag가 달라야 함)
+
+    Returns:
+        str: 따옴표를 포함한 ETag
+    """
+    return f'"{digest[:32]}-{encoding}"' if encoding else f'"{digest[:32]}"'
+
+
+class _HashingWriter:
+    """쓰는 바이트의 크기와 sha256을 함께 계산하는 파일 래퍼"""
+
+    def __init__(self, f):
+        self._f = f
+        self.sha = hashlib.sha256()
+        self.size = 0
+
+    def write(self, data):
+        self.sha.update(data)
+        self.size += len(data)
+        return self._f.write(data)
+
+    def flush(self):
+        self._f.flush()
+
+
+def _compressor(f, encoding):
+    """파일에 압축해서 쓰는 (write, finish) 함수 쌍"""
+    if encoding == 'gzip':
+        # 임시 파일 이름과 시각이 헤더에 들어가지 않게 해 같은 내용이면 같은 바이트가 나오도록 함
+        stream = gzip.GzipFile(filename='', mode='wb', fileobj=f, compresslevel=GZIP_LEVEL, mtime=0)
+        return stream.write, stream.close
+
+    compressor = brotli.Compressor(quality=BROTLI_QUALITY)
+
+    def write(chunk):
+        f.write(compressor.process(chunk))
+
+    def finish():
+        f.write(compressor.finish())
+    return write, finish
+
+
+def _write_compressed(path, encodings):
+    """
+    원본을 한 번 읽으면서 내용 해시와 압축본을 함께 만들기
+
+    Returns:
+        tuple: (원본 sha256 hex, {encoding: (압축본 경로, _HashingWriter)})
+    """
+    sha = hashlib.sha256()
+    outputs = {}
+    with ExitStack() as stack:
+        writers = []
+        for encoding in encodings:
+            target = path + SUFFIXES[encoding]
+            f = _HashingWriter(stack.enter_context(atomic_open(target, 'wb')))
+            outputs[encoding] = (target, f)
+            writers.append(_compressor(f, encoding))
+
+        with open(path, 'rb') as source:
+            for chunk in iter(lambda: source.read(CHUNK_SIZE), b''):
+                sha.update(chunk)
+                for write, _ in writers:
+                    write(chunk)
+        for _, finish in writers:
+            finish()
+    return sha.hexdigest(), outputs
+
+
+def _load_manifest(manifest_file):
+    try:
+        with open(manifest_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+def publish_artifacts(path, manifest_file=MANIFEST_FILE, encodings=ENCODINGS):
+    """
+    피드 파일 옆에 압축본을 만들고 매니페스트 갱신
+
+    피드 내용이 바뀌어 파일을 새로 썼을 때만 호출합니다 (create_rss_feed가 호출).
+    만들지 않는 인코딩의 오래된 압축본은 지워서 원본과 어긋난 파일이 남지 않게 합니다.
+
+    Args:
+        path: 피드 파일 경로 (예: 'docs/velog-trending.xml')
+        manifest_file: 매니페스트 경로 (항목 이름은 매니페스트 디렉토리 기준 상대 경로)
+        encodings: 만들 인코딩 ('gzip', 'br')
+
+    Returns:
+        dict: 매니페스트 항목 {sha256, etag, size, last_modified, encodings}
+    """
+    digest, outputs = _write_compressed(path, encodings)
+    for encoding, suffix in SUFFIXES.items():
+        if encoding not in outputs and os.path.exists(path + suffix):
+            os.remove(path + suffix)
+
+    stat = os.stat(path)
+    entry = {
+        'sha256': digest,
+        'etag': strong_etag(digest),
+        'size': stat.st_size,
+        'last_modified': formatdate(stat.st_mtime, usegmt=True),
+        'encodings': {}
+    }
+    base_dir = os.path.dirname(manifest_file) or '.'
+    for encoding, (target, written) in outputs.items():
+        entry['encodings'][encoding] = {
+            'path': os.path.relpath(target, base_dir),
+            'sha256': written.sha.hexdigest(),
+            'etag': strong_etag(digest, encoding),
+            'size': written.size
+        }
+        count('bytes_precompressed', written.size)
+
+    name = os.path.relpath(path, base_dir)
+    with file_lock(MANIFEST_LOCK_FILE):
+        manifest = _load_manifest(manifest_file)
+        manifest[name] = entry
+        # 지워진 피드(예: 정리된 아카이브 페이지)의 항목은 함께 제거
+        manifest = {
+            key: value for key, value in sorted(manifest.items())
+            if os.path.exists(os.path.join(base_dir, key))
+        }
+        atomic_write(manifest_file, json.dumps(manifest, ensure_ascii=False, indent=2))
+    return entry
+
+
+def artifacts_missing(path, encodings=ENCODINGS):
+    """압축본 중 없는 것이 있는지 (기존 출력에 처음 적용할 때 확인용)"""
+    return any(not os.path.exists(path + SUFFIXES[encoding]) for encoding in encodings)
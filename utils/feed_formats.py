@@ -0,0 +1,186 @@
+"""피드 출력 형식 (RSS 2.0, Atom 1.0, JSON Feed 1.1)
+
+형식마다 문서 머리, item 하나, 꼬리를 문자열로 만드는 함수를 두어서
+create_feeds()가 게시글을 한 번만 돌면서 여러 형식을 함께 쓸 수 있게 합니다.
+"""
+import json
+import os
+
+from utils.rss_writer import RSS_FOOTER, _attr, _text
+from utils.rss_writer import render_header as render_rss_header
+from utils.rss_writer import render_item as render_rss_item
+
+ATOM_HEADER = """<?xml version='1.0' encoding='UTF-8'?>
+<feed xmlns="http://www.w3.org/2005/Atom" xml:lang="ko">
+"""
+
+ATOM_FOOTER = """</feed>
+"""
+
+JSON_FEED_VERSION = 'https://jsonfeed.org/version/1.1'
+
+
+def render_atom_header(feed_info, build_date):
+    """
+    feed 시작부터 첫 entry 직전까지의 Atom XML
+
+    Args:
+        feed_info: 피드 정보 딕셔너리 (title, link, description, 선택적으로 links=[{href, rel}])
+        build_date: updated로 쓸 datetime
+
+    Returns:
+        str: XML 문자열
+    """
+    lines = [
+        ATOM_HEADER,
+        f"  <id>{_text(feed_info['link'])}</id>\n",
+        f"  <title>{_text(feed_info['title'])}</title>\n",
+        f"  <subtitle>{_text(feed_info['description'])}</subtitle>\n",
+        f'  <link href="{_attr(feed_info["link"])}" rel="alternate"/>\n',
+    ]
+    for link in feed_info.get('links', []):
+        lines.append(f'  <link href="{_attr(link["href"])}" rel="{_attr(link["rel"])}"/>\n')
+    lines += [
+        f"  <author><name>{_text(feed_info.get('author', 'RSS Feed Generator'))}</name></author>\n",
+        "  <generator>rss-feeds-generator</generator>\n",
+        f"  <updated>{build_date.isoformat()}</updated>\n",
+    ]
+    return ''.join(lines)
+
+
+def render_atom_entry(post, default_date=None):
+    """
+    게시글 하나의 Atom entry XML
+
+    Args:
+        post: FeedItem (title, link, summary, author, date)
+        default_date: date가 없을 때 쓸 published/updated
+
+    Returns:
+        str: XML 문자열
+    """
+    lines = [
+        "  <entry>\n",
+        f"    <id>{_text(post.link)}</id>\n",
+        f"    <title>{_text(post.title or post.link)}</title>\n",
+        f'    <link href="{_attr(post.link)}" rel="alternate"/>\n',
+    ]
+    if post.summary:
+        lines.append(f"    <summary>{_text(post.summary)}</summary>\n")
+    if post.author:
+        lines.append(f"    <author><name>{_text(post.author)}</name></author>\n")
+    date = post.date or default_date
+    if date:
+        lines.append(f"    <published>{date.isoformat()}</published>\n")
+        lines.append(f"    <updated>{date.isoformat()}</updated>\n")
+    lines.append("  </entry>\n")
+    return ''.join(lines)
+
+
+def _indent(text, prefix):
+    return ''.join(prefix + line for line in text.splitlines(True))
+
+
+def render_json_header(feed_info, build_date):
+    """
+    JSON Feed 문서 시작부터 items 배열 여는 괄호까지
+
+    Args:
+        feed_info: 피드 정보 딕셔너리 (title, link, description, author)
+        build_date: 쓰지 않음 (JSON Feed에는 문서 수정 시각 필드가 없음)
+
+    Returns:
+        str: JSON 문자열 조각
+    """
+    header = {
+        'version': JSON_FEED_VERSION,
+        'title': feed_info['title'],
+        'home_page_url': feed_info['link'],
+        'description': feed_info['description'],
+        'language': 'ko',
+        'authors': [{'name': feed_info.get('author', 'RSS Feed Generator')}]
+    }
+    body = json.dumps(header, ensure_ascii=False, indent=2)
+    return body[:-2] + ',\n  "items": [\n'
+
+
+def render_json_item(post, default_date=None):
+    """
+    게시글 하나의 JSON Feed item
+
+    Args:
+        post: FeedItem (title, link, summary, author, date)
+        default_date: date가 없을 때 쓸 date_published
+
+    Returns:
+        str: JSON 문자열 조각 (구분 쉼표 제외)
+    """
+    item = {
+        'id': post.link,
+        'url': post.link,
+        'title': post.title or post.link,
+        'content_text': post.summary or ''
+    }
+    date = post.date or default_date
+    if date:
+        item['date_published'] = date.isoformat()
+    if post.author:
+        item['authors'] = [{'name': post.author}]
+    return _indent(json.dumps(item, ensure_ascii=False, indent=2), '    ')
+
+
+# 형식 이름 → 출력 파일 접미사와 문서 조각을 만드는 함수
+# separator: item 사이에 넣을 문자열 (JSON 배열은 쉼표로 구분)
+FORMATS = {
+    'rss': {
+        'suffix': '.xml',
+        'header': render_rss_header,
+        'item': render_rss_item,
+        'separator': '',
+        'footer': RSS_FOOTER
+    },
+    'atom': {
+        'suffix': '.atom.xml',
+        'header': render_atom_header,
+        'item': render_atom_entry,
+        'separator': '',
+        'footer': ATOM_FOOTER
+    },
+    'json': {
+        'suffix': '.feed.json',
+        'header': render_json_header,
+        'item': render_json_item,
+        'separator': ',\n',
+        'footer': '\n  ]\n}\n'
+    },
+}
+
+DEFAULT_FORMATS = ('rss',)
+
+
+def get_format(name):
+    """
+    출력 형식 조회
+
+    Raises:
+        ValueError: 지원하지 않는 형식
+    """
+    if name not in FORMATS:
+        raise ValueError(f"지원하지 않는 출력 형식입니다: {name} (지원: {', '.join(FORMATS)})")
+    return FORMATS[name]
+
+
+def format_path(output_path, name):
+    """
+    형식별 출력 경로 (RSS는 설정의 output 그대로, 나머지는 같은 이름에 접미사만 바꿈)
+
+    Args:
+        output_path: RSS 출력 경로 (예: 'docs/velog-trending.xml')
+        name: 형식 이름
+
+    Returns:
+        str: 예) 'docs/velog-trending.atom.xml', 'docs/velog-trending.feed.json'
+    """
+    if name == 'rss':
+        return output_path
+    return os.path.splitext(output_path)[0] + get_format(name)['suffix']
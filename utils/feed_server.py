@@ -0,0 +1,343 @@
+"""생성된 피드를 제공하는 로컬 HTTP 서버
+
+`python -m http.server`와 달리 파일 내용을 메모리에 캐시하고(파일이 다시 쓰이면 자동으로
+다시 읽음), 강한 ETag와 If-None-Match → 304, gzip/brotli 압축을 지원합니다.
+
+사용법:
+    python -m utils.feed_server --root docs --port 8000
+"""
+import argparse
+import gzip
+import hashlib
+import os
+import threading
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import unquote, urlsplit
+
+from utils.feed_artifacts import strong_etag
+
+try:
+    import brotli
+except ImportError:  # brotli가 없으면 gzip만 제공
+    brotli = None
+
+# 제공할 파일 확장자 → Content-Type
+CONTENT_TYPES = {
+    '.xml': 'application/xml; charset=utf-8',
+    '.json': 'application/json; charset=utf-8',
+}
+
+# 피드 형식별 출력 파일(utils.feed_formats)의 접미사 → Content-Type
+FEED_CONTENT_TYPES = {
+    '.atom.xml': 'application/atom+xml; charset=utf-8',
+    '.feed.json': 'application/feed+json; charset=utf-8',
+}
+
+# 이보다 작은 파일은 압축하지 않음 (헤더 비용이 더 큼)
+MIN_COMPRESS_SIZE = 256
+
+# 같은 품질이면 앞에 있는 인코딩을 우선
+ENCODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+
+def content_type(path):
+    """파일 이름으로 Content-Type 결정"""
+    for suffix, value in FEED_CONTENT_TYPES.items():
+        if path.endswith(suffix):
+            return value
+    return CONTENT_TYPES[os.path.splitext(path)[1]]
+
+
+def _compress(body, encoding):
+    """압축 (캐시해 두고 재사용하므로 최고 압축률 사용)"""
+    if encoding == 'br':
+        return brotli.compress(body, quality=11)
+    return gzip.compress(body, compresslevel=9, mtime=0)
+
+
+def parse_accept_encoding(header):
+    """
+    Accept-Encoding 헤더에서 사용할 인코딩 선택
+
+    Args:
+        header: Accept-Encoding 헤더 값 (없으면 None)
+
+    Returns:
+        str: 'br', 'gzip' 또는 'identity'
+    """
+    if not header:
+        return 'identity'
+
+    qualities = {}
+    for part in header.split(','):
+        name, _, params = part.strip().partition(';')
+        name = name.strip().lower()
+        quality = 1.0
+        for param in params.split(';'):
+            key, _, value = param.strip().partition('=')
+            if key.strip().lower() == 'q':
+                try:
+                    quality = float(value)
+                except ValueError:
+                    quality = 0.0
+        if name:
+            qualities[name] = quality
+
+    best, best_quality = 'identity', 0.0
+    for encoding in ENCODINGS:
+        quality = qualities.get(encoding, qualities.get('*', 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def etag_matches(header, etag):
+    """
+    If-None-Match 헤더가 ETag와 일치하는지 (약한 비교)
+
+    Args:
+        header: If-None-Match 헤더 값
+        etag: 현재 표현의 ETag
+
+    Returns:
+        bool
+    """
+    if not header:
+        return False
+    if header.strip() == '*':
+        return True
+    return any(tag.strip().removeprefix('W/') == etag for tag in header.split(','))
+
+
+class FeedCache:
+    """
+    파일 내용, ETag, 압축본을 메모리에 보관하는 캐시
+
+    요청마다 stat()만 확인해 파일이 다시 쓰였으면(크롤러는 임시 파일을 rename해 교체하므로
+    inode/mtime/크기가 바뀜) 다시 읽고, 그렇지 않으면 디스크를 읽지 않습니다.
+    압축본은 인코딩별로 처음 요청될 때 한 번만 만듭니다.
+    """
+
+    def __init__(self, root):
+        """
+        Args:
+            root: 제공할 디렉토리 (예: 'docs')
+        """
+        self.root = os.path.realpath(root)
+        self._lock = threading.Lock()
+        self._entries = {}
+        self.hits = 0
+        self.misses = 0
+
+    def resolve(self, url_path):
+        """
+        URL 경로를 제공할 파일 경로로 변환
+
+        하위 디렉토리(예: 아카이브 페이지 '/archive/velog-trending/0001-20240101.xml')도
+        제공하지만, 심볼릭 링크나 '..'로 root 밖을 가리키는 경로는 거부합니다.
+
+        Args:
+            url_path: 요청 경로 (예: '/velog-trending.xml')
+
+        Returns:
+            str: 파일 경로 (제공하지 않는 파일이면 None)
+        """
+        name = unquote(url_path).lstrip('/')
+        parts = name.split('/')
+        # 숨김/임시 파일과 디렉토리, 알 수 없는 확장자는 제공하지 않음
+        if not name or '\\' in name or '\0' in name or any(not part or part.startswith('.') for part in parts):
+            return None
+        if os.path.splitext(name)[1] not in CONTENT_TYPES:
+            return None
+        path = os.path.realpath(os.path.join(self.root, *parts))
+        if os.path.commonpath([self.root, path]) != self.root:
+            return None
+        return path
+
+    def get(self, path):
+        """
+        파일의 캐시 항목 (바뀌었으면 다시 읽음)
+
+        Args:
+            path: resolve()가 돌려준 파일 경로
+
+        Returns:
+            dict: {body, digest, content_type, last_modified, variants} (파일이 없으면 None)
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            with self._lock:
+                self._entries.pop(path, None)
+            return None
+        key = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry['key'] == key:
+                self.hits += 1
+                return entry
+
+        try:
+            with open(path, 'rb') as f:
+                body = f.read()
+        except OSError:
+            return None
+
+        entry = {
+            'key': key,
+            'body': body,
+            'digest': hashlib.sha256(body).hexdigest(),
+            'content_type': content_type(path),
+            'last_modified': formatdate(stat.st_mtime, usegmt=True),
+            'variants': {}
+        }
+        with self._lock:
+            self._entries[path] = entry
+            self.misses += 1
+        return entry
+
+    def representation(self, entry, encoding):
+        """
+        인코딩별 응답 본문과 ETag
+
+        강한 ETag는 표현마다 달라야 하므로 압축본에는 인코딩 이름을 붙입니다
+        (docs/manifest.json에 기록되는 ETag와 같은 값).
+
+        Args:
+            entry: get()이 돌려준 항목
+            encoding: parse_accept_encoding()이 고른 인코딩
+
+        Returns:
+            tuple: (본문 bytes, ETag, Content-Encoding 또는 None)
+        """
+        if encoding == 'identity' or len(entry['body']) < MIN_COMPRESS_SIZE:
+            return entry['body'], strong_etag(entry['digest']), None
+
+        variant = entry['variants'].get(encoding)
+        if variant is None:
+            # 두 스레드가 동시에 만들어도 결과가 같으므로 잠그지 않음
+            variant = _compress(entry['body'], encoding)
+            entry['variants'][encoding] = variant
+        return variant, strong_etag(entry['digest'], encoding), encoding
+
+    def names(self):
+        """제공 가능한 파일 이름 목록"""
+        try:
+            return sorted(
+                name for name in os.listdir(self.root)
+                if not name.startswith('.') and os.path.splitext(name)[1] in CONTENT_TYPES
+            )
+        except OSError:
+            return []
+
+
+class FeedRequestHandler(BaseHTTPRequestHandler):
+    """GET/HEAD만 처리하는 요청 핸들러 (HTTP/1.1 keep-alive)"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'rss-feeds'
+    # 헤더와 본문을 따로 쓰므로 Nagle 알고리즘이 켜져 있으면 keep-alive 연결에서 응답마다 ACK 지연을 기다림
+    disable_nagle_algorithm = True
+
+    def do_HEAD(self):
+        self._serve(send_body=False)
+
+    def do_GET(self):
+        self._serve(send_body=True)
+
+    def _serve(self, send_body):
+        path = urlsplit(self.path).path
+        if path == '/':
+            self._send_index(send_body)
+            return
+
+        cache = self.server.cache
+        file_path = cache.resolve(path)
+        entry = cache.get(file_path) if file_path else None
+        if entry is None:
+            self._send_empty(404)
+            return
+
+        body, etag, encoding = cache.representation(entry, parse_accept_encoding(self.headers.get('Accept-Encoding')))
+        not_modified = etag_matches(self.headers.get('If-None-Match'), etag)
+
+        self.send_response(304 if not_modified else 200)
+        self.send_header('ETag', etag)
+        self.send_header('Last-Modified', entry['last_modified'])
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Vary', 'Accept-Encoding')
+        if not_modified:
+            self.end_headers()
+            return
+
+        self.send_header('Content-Type', entry['content_type'])
+        if encoding:
+            self.send_header('Content-Encoding', encoding)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_index(self, send_body):
+        links = ''.join(f'<li><a href="/{name}">{name}</a></li>' for name in self.server.cache.names())
+        body = f'<!DOCTYPE html><meta charset="utf-8"><title>RSS 피드</title><ul>{links}</ul>'.encode('utf-8')
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/html; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(body)
+
+    def _send_empty(self, status):
+        self.send_response(status)
+        self.send_header('Content-Length', '0')
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        if not self.server.quiet:
+            super().log_message(format, *args)
+
+
+def create_server(root='docs', host='127.0.0.1', port=8000, quiet=False):
+    """
+    피드 서버 생성 (serve_forever()로 실행)
+
+    Args:
+        root: 제공할 디렉토리
+        host: 바인드할 주소
+        port: 포트 (0이면 임의의 빈 포트)
+        quiet: 요청 로그를 출력하지 않음
+
+    Returns:
+        ThreadingHTTPServer: .cache에 FeedCache가 있음
+    """
+    server = ThreadingHTTPServer((host, port), FeedRequestHandler)
+    server.daemon_threads = True
+    server.cache = FeedCache(root)
+    server.quiet = quiet
+    return server
+
+
+def main():
+    parser = argparse.ArgumentParser(description='생성된 RSS 피드를 제공하는 로컬 서버')
+    parser.add_argument('--root', default='docs', help='제공할 디렉토리 (기본값: docs)')
+    parser.add_argument('--host', default='127.0.0.1', help='바인드할 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8000, help='포트 (기본값: 8000)')
+    parser.add_argument('--quiet', action='store_true', help='요청 로그 숨기기')
+    args = parser.parse_args()
+
+    server = create_server(args.root, args.host, args.port, args.quiet)
+    host, port = server.server_address[:2]
+    print(f"🌐 {args.root}/ 제공 중: http://{host}:{port}/ (압축: {', '.join(ENCODINGS)})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n🛑 서버 종료")
+    finally:
+        server.server_close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,41 @@
+"""프로세스/스레드 간 파일 잠금 유틸리티"""
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: 같은 프로세스 안의 스레드끼리만 직렬화
+    fcntl = None
+
+# 같은 프로세스 안에서는 경로별 스레드 잠금도 함께 잡음
+_thread_locks = {}
+_thread_locks_guard = threading.Lock()
+
+
+def _thread_lock(path):
+    with _thread_locks_guard:
+        return _thread_locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+@contextmanager
+def file_lock(path):
+    """
+    잠금 파일에 배타적 잠금을 잡고 블록을 실행
+
+    여러 스레드와 여러 프로세스(예: 병렬로 실행한 크롤러)가 같은 파일을
+    고칠 때 한 번에 하나씩만 들어가게 합니다.
+
+    Args:
+        path: 잠금 파일 경로 (없으면 생성)
+    """
+    with _thread_lock(path):
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'a') as f:
+            if fcntl:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl:
+                    fcntl.flock(f.fileno(), fcntl.LOCK_UN)
@@ -0,0 +1,156 @@
+"""조건부 요청(ETag / Last-Modified)용 HTTP 캐시"""
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime, timezone
+
+from utils.atomic_file import atomic_write
+from utils.file_lock import file_lock
+
+
+def config_fingerprint(feed_config):
+    """
+    피드 설정의 해시값 (설정이 바뀌면 캐시된 검증자를 쓰지 않기 위함)
+
+    Args:
+        feed_config: 피드 설정 딕셔너리
+
+    Returns:
+        str: sha256 hex 문자열
+    """
+    data = json.dumps(feed_config, sort_keys=True, ensure_ascii=False)
+    return hashlib.sha256(data.encode('utf-8')).hexdigest()
+
+
+class HttpCache:
+    """
+    URL별 ETag / Last-Modified 검증자를 디스크에 보관하는 캐시
+
+    크롤러 한 번 실행에 하나를 만들어 모든 피드가 함께 쓰고(파일은 처음에 한 번 읽음),
+    store()로 기록한 항목은 실행이 끝날 때 save()로 한 번에 저장합니다.
+    RSS를 쓰지 못한 피드는 discard()로 기록을 취소해, 다음 실행이 304를 받고
+    출력 없이 건너뛰는 일이 없게 합니다.
+    """
+
+    def __init__(self, cache_file='state/http_cache.json'):
+        self.cache_file = cache_file
+        self.lock_file = cache_file + '.lock'
+        # 파일은 원자적으로 교체되므로 잠금 없이 읽어도 반쯤 쓰인 내용을 보지 않음
+        self.entries = self._load_entries()
+        self.hits = 0
+        self.misses = 0
+        self._updates = {}
+        self._lock = threading.Lock()
+
+    def _load_entries(self):
+        """기존 캐시 불러오기"""
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (OSError, ValueError):
+                return {}
+        return {}
+
+    def entry(self, url):
+        """URL의 캐시 항목 (없으면 None)"""
+        return self.entries.get(url)
+
+    def validators(self, url, fingerprint=None):
+        """
+        조건부 요청에 쓸 검증자 반환
+
+        Args:
+            url: 요청 URL
+            fingerprint: 저장 당시와 비교할 설정 해시 (다르면 검증자를 쓰지 않음)
+
+        Returns:
+            dict: {'etag': ..., 'modified': ...} (캐시가 없으면 값이 None)
+        """
+        entry = self.entries.get(url)
+        if not entry or entry.get('fingerprint') != fingerprint:
+            return {'etag': None, 'modified': None}
+        return {'etag': entry.get('etag'), 'modified': entry.get('modified')}
+
+    def conditional_headers(self, url, fingerprint=None):
+        """
+        조건부 요청 헤더 반환
+
+        Returns:
+            dict: If-None-Match / If-Modified-Since 헤더 (캐시가 없으면 빈 딕셔너리)
+        """
+        validators = self.validators(url, fingerprint)
+        headers = {}
+        if validators['etag']:
+            headers['If-None-Match'] = validators['etag']
+        if validators['modified']:
+            headers['If-Modified-Since'] = validators['modified']
+        return headers
+
+    def record_hit(self):
+        """304 Not Modified 응답 집계"""
+        with self._lock:
+            self.hits += 1
+
+    def record_miss(self):
+        """본문을 새로 받은 응답 집계"""
+        with self._lock:
+            self.misses += 1
+
+    def store(self, url, etag=None, modified=None, fingerprint=None, count=None):
+        """
+        응답의 검증자 기록 (save() 전까지는 메모리에만 보관)
+
+        Args:
+            url: 요청 URL
+            etag: 응답 ETag 헤더
+            modified: 응답 Last-Modified 헤더
+            fingerprint: 응답을 처리할 때 사용한 설정 해시
+            count: 이 응답으로 만든 항목 수 (304일 때 로그에 사용)
+        """
+        if not etag and not modified:
+            return
+        entry = {
+            'etag': etag,
+            'modified': modified,
+            'fingerprint': fingerprint,
+            'count': count,
+            'updated_at': datetime.now(timezone.utc).isoformat()
+        }
+        with self._lock:
+            self.entries[url] = entry
+            self._updates[url] = entry
+
+    def discard(self, url):
+        """
+        아직 저장하지 않은 URL의 기록 취소 (RSS 생성에 실패한 피드용)
+
+        Args:
+            url: 요청 URL (None이면 무시)
+        """
+        with self._lock:
+            if self._updates.pop(url, None) is not None:
+                self.entries.pop(url, None)
+
+    def stats(self):
+        """캐시 적중/실패 횟수"""
+        return {'hits': self.hits, 'misses': self.misses}
+
+    def save(self):
+        """
+        이번 실행에서 기록한 항목만 기존 파일에 병합해서 저장
+
+        다른 프로세스가 그사이 저장한 항목을 덮어쓰지 않도록 잠금 파일을 잡고 다시 읽어서 병합합니다.
+        """
+        with self._lock:
+            updates = self._updates
+            self._updates = {}
+        if not updates:
+            return
+        with file_lock(self.lock_file):
+            entries = self._load_entries()
+            entries.update(updates)
+            atomic_write(self.cache_file, json.dumps(entries, ensure_ascii=False, indent=2))
+        with self._lock:
+            self.entries = {**entries, **self._updates}
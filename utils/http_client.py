@@ -0,0 +1,43 @@
+"""공유 HTTP 클라이언트"""
+import importlib.util
+
+import httpx
+
+DEFAULT_USER_AGENT = 'rss-feeds-generator (+https://github.com/choinashil/rss-feeds-generator)'
+
+
+def create_http_client(http_config=None, recorder=None):
+    """
+    keep-alive 연결 풀을 쓰는 httpx 클라이언트 생성
+
+    h2 패키지가 설치되어 있으면 HTTP/2로 한 연결에서 여러 요청을 동시에 보냅니다.
+    httpx.Client는 스레드 안전하므로 여러 크롤러 스레드가 함께 써도 됩니다.
+
+    Args:
+        http_config: config.json의 http 항목 (http2, max_connections, timeout)
+        recorder: 요청을 녹화/재생할 TrafficRecorder (없으면 그대로 네트워크 사용)
+
+    Returns:
+        httpx.Client
+    """
+    http_config = http_config or {}
+    http2 = http_config.get('http2', True) and importlib.util.find_spec('h2') is not None
+    max_connections = http_config.get('max_connections', 20)
+    limits = httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=max_connections
+    )
+
+    # transport를 직접 넘기면 http2/limits 인자는 무시되므로 안쪽 transport에 설정
+    transport = None
+    if recorder is not None:
+        transport = recorder.transport(httpx.HTTPTransport(http2=http2, limits=limits))
+
+    return httpx.Client(
+        http2=http2,
+        limits=limits,
+        transport=transport,
+        timeout=http_config.get('timeout', 20),
+        follow_redirects=True,
+        headers={'User-Agent': DEFAULT_USER_AGENT}
+    )
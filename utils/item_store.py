@@ -0,0 +1,321 @@
+"""피드 항목 이력 저장소 (SQLite)"""
+import os
+import sqlite3
+from datetime import datetime, timezone
+from urllib.parse import urlsplit, urlunsplit, unquote
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS items (
+    feed_id    TEXT NOT NULL,
+    link       TEXT NOT NULL,
+    url        TEXT,
+    title      TEXT,
+    summary    TEXT,
+    author     TEXT,
+    published  TEXT,
+    first_seen TEXT NOT NULL,
+    last_seen  TEXT NOT NULL,
+    PRIMARY KEY (feed_id, link)
+);
+CREATE INDEX IF NOT EXISTS items_by_first_seen ON items (feed_id, first_seen);
+"""
+
+# 기존 DB에 없을 수 있는 컬럼 (이름, 타입)
+MIGRATIONS = [
+    ('archive_page', 'INTEGER'),
+]
+
+
+def canonical_link(link):
+    """
+    같은 글을 가리키는 링크를 하나의 키로 정규화
+
+    스킴/호스트 소문자화, 기본 포트와 fragment 제거, 퍼센트 인코딩 해제,
+    끝 슬래시 제거를 적용합니다.
+
+    Args:
+        link: 원본 링크
+
+    Returns:
+        str: 정규화된 링크
+    """
+    parts = urlsplit(link.strip())
+    scheme = parts.scheme.lower()
+    netloc = parts.netloc.lower()
+    if (scheme, netloc.rsplit(':', 1)[-1]) in (('http', '80'), ('https', '443')):
+        netloc = netloc.rsplit(':', 1)[0]
+    path = unquote(parts.path)
+    if len(path) > 1:
+        path = path.rstrip('/')
+    return urlunsplit((scheme, netloc, path, parts.query, ''))
+
+
+def _to_iso(value):
+    if value is None:
+        return None
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).isoformat()
+
+
+def _from_iso(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+class ItemStore:
+    """
+    피드별로 지금까지 본 항목을 기록하는 저장소
+
+    (feed_id, 정규화된 링크)를 키로 처음 본 시각, 마지막으로 본 시각,
+    최신 필드 값을 보관합니다. 크롤링 창에서 빠진 글도 이력이 남습니다.
+    """
+
+    def __init__(self, db_path='state/items.db'):
+        self.db_path = db_path
+        os.makedirs(os.path.dirname(db_path) or '.', exist_ok=True)
+        # 여러 크롤러가 동시에 쓰면 잠금이 풀릴 때까지 대기
+        self.conn = sqlite3.connect(db_path, timeout=30)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        self._migrate()
+
+    def _missing_columns(self):
+        columns = {row['name'] for row in self.conn.execute('PRAGMA table_info(items)')}
+        return [(name, column_type) for name, column_type in MIGRATIONS if name not in columns]
+
+    def _migrate(self):
+        """
+        예전 스키마로 만든 DB에 새 컬럼 추가
+
+        여러 크롤러가 같은 DB를 동시에 열 수 있으므로 쓰기 잠금(BEGIN IMMEDIATE)을 잡은 뒤
+        컬럼 목록을 다시 읽어, 다른 연결이 먼저 추가한 컬럼은 건너뜁니다.
+        """
+        if not self._missing_columns():
+            return
+        self.conn.execute('BEGIN IMMEDIATE')
+        try:
+            for name, column_type in self._missing_columns():
+                self.conn.execute(f'ALTER TABLE items ADD COLUMN {name} {column_type}')
+        except BaseException:
+            self.conn.rollback()
+            raise
+        self.conn.commit()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """연결 종료"""
+        self.conn.close()
+
+    def count(self, feed_id):
+        """피드에 기록된 항목 수"""
+        row = self.conn.execute('SELECT COUNT(*) FROM items WHERE feed_id = ?', (feed_id,)).fetchone()
+        return row[0]
+
+    def seed(self, feed_id, first_seen_by_link):
+        """
+        기존 이력 가져오기 (이미 있는 항목은 건드리지 않음)
+
+        Args:
+            feed_id: 피드 ID
+            first_seen_by_link: {link: 처음 본 시각(datetime)} 딕셔너리
+        """
+        with self.conn:
+            self.conn.executemany(
+                'INSERT OR IGNORE INTO items (feed_id, link, url, first_seen, last_seen) VALUES (?, ?, ?, ?, ?)',
+                [
+                    (feed_id, canonical_link(link), link, _to_iso(seen), _to_iso(seen))
+                    for link, seen in first_seen_by_link.items()
+                ]
+            )
+
+    def observe(self, feed_id, posts, seen_at=None):
+        """
+        이번 크롤링에서 본 항목 기록
+
+        새 항목은 seen_at을 처음 본 시각으로 저장하고, 기존 항목은
+        마지막으로 본 시각과 필드 값만 갱신합니다.
+
+        Args:
+            feed_id: 피드 ID
+            posts: 게시글 리스트 (title, link, summary, author, date)
+            seen_at: 관측 시각 (기본값: 현재 시각)
+
+        Returns:
+            dict: {원본 link: 처음 본 시각(datetime)}
+        """
+        seen_at = _to_iso(seen_at or datetime.now(timezone.utc))
+        with self.conn:
+            self.conn.executemany(
+                """
+                INSERT INTO items (feed_id, link, url, title, summary, author, published, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (feed_id, link) DO UPDATE SET
+                    url = excluded.url,
+                    title = excluded.title,
+                    summary = excluded.summary,
+                    author = excluded.author,
+                    published = excluded.published,
+                    last_seen = excluded.last_seen
+                """,
+                [
+                    (
+                        feed_id,
+                        canonical_link(post['link']),
+                        post['link'],
+                        post.get('title'),
+                        post.get('summary'),
+                        post.get('author'),
+                        _to_iso(post.get('date')),
+                        seen_at,
+                        seen_at
+                    )
+                    for post in posts
+                ]
+            )
+        return self.first_seen(feed_id, [post['link'] for post in posts])
+
+    def first_seen(self, feed_id, links):
+        """
+        링크들의 처음 본 시각 조회
+
+        Args:
+            feed_id: 피드 ID
+            links: 원본 링크 리스트
+
+        Returns:
+            dict: {원본 link: 처음 본 시각(datetime)} (기록이 없는 링크는 제외,
+                  같은 글의 다른 표기는 모두 같은 시각으로 들어감)
+        """
+        keys = {}
+        for link in links:
+            keys.setdefault(canonical_link(link), []).append(link)
+        result = {}
+        # SQLite 변수 개수 제한을 넘지 않도록 나눠서 조회
+        key_list = list(keys)
+        for i in range(0, len(key_list), 500):
+            chunk = key_list[i:i + 500]
+            rows = self.conn.execute(
+                f"SELECT link, first_seen FROM items WHERE feed_id = ? AND link IN ({','.join('?' * len(chunk))})",
+                [feed_id, *chunk]
+            )
+            for row in rows:
+                seen = _from_iso(row['first_seen'])
+                for link in keys[row['link']]:
+                    result[link] = seen
+        return result
+
+    def get(self, feed_id, link):
+        """
+        항목 하나 조회
+
+        Returns:
+            dict: 저장된 필드 (없으면 None)
+        """
+        row = self.conn.execute(
+            'SELECT * FROM items WHERE feed_id = ? AND link = ?',
+            (feed_id, canonical_link(link))
+        ).fetchone()
+        return self._row_to_item(row) if row else None
+
+    def items(self, feed_id, seen_before=None):
+        """
+        피드의 항목을 처음 본 시각 내림차순으로 순회
+
+        Args:
+            feed_id: 피드 ID
+            seen_before: 이 시각보다 마지막으로 본 시각이 이른 항목만 (크롤링 창에서 빠진 글)
+
+        Yields:
+            dict: 저장된 필드
+        """
+        query = 'SELECT * FROM items WHERE feed_id = ?'
+        params = [feed_id]
+        if seen_before is not None:
+            query += ' AND last_seen < ?'
+            params.append(_to_iso(seen_before))
+        query += ' ORDER BY first_seen DESC, link'
+        for row in self.conn.execute(query, params):
+            yield self._row_to_item(row)
+
+    def pending_archive(self, feed_id, seen_before):
+        """
+        크롤링 창에서 빠졌지만 아직 아카이브 페이지에 들어가지 않은 항목
+
+        Args:
+            feed_id: 피드 ID
+            seen_before: 이번 크롤링 시각 (이보다 마지막으로 본 시각이 이른 항목)
+
+        Returns:
+            list: 처음 본 시각 오름차순 항목 리스트
+        """
+        rows = self.conn.execute(
+            """
+            SELECT * FROM items
+            WHERE feed_id = ? AND archive_page IS NULL AND last_seen < ?
+            ORDER BY first_seen, link
+            """,
+            (feed_id, _to_iso(seen_before))
+        )
+        return [self._row_to_item(row) for row in rows]
+
+    def assign_archive_page(self, feed_id, links, page):
+        """
+        항목들을 아카이브 페이지 번호에 배정 (한 번 배정하면 바뀌지 않음)
+
+        Args:
+            feed_id: 피드 ID
+            links: 원본 링크 리스트
+            page: 아카이브 페이지 번호 (1부터)
+        """
+        with self.conn:
+            self.conn.executemany(
+                'UPDATE items SET archive_page = ? WHERE feed_id = ? AND link = ? AND archive_page IS NULL',
+                [(page, feed_id, canonical_link(link)) for link in links]
+            )
+
+    def archive_pages(self, feed_id):
+        """
+        피드의 아카이브 페이지 목록
+
+        Returns:
+            list: (페이지 번호, 항목 수, 가장 최근에 처음 본 시각) 튜플 리스트, 번호 오름차순
+        """
+        rows = self.conn.execute(
+            """
+            SELECT archive_page, COUNT(*), MAX(first_seen) FROM items
+            WHERE feed_id = ? AND archive_page IS NOT NULL
+            GROUP BY archive_page ORDER BY archive_page
+            """,
+            (feed_id,)
+        )
+        return [(row[0], row[1], _from_iso(row[2])) for row in rows]
+
+    def archive_page_items(self, feed_id, page):
+        """
+        아카이브 페이지 하나의 항목
+
+        Returns:
+            list: 처음 본 시각 오름차순 항목 리스트
+        """
+        rows = self.conn.execute(
+            'SELECT * FROM items WHERE feed_id = ? AND archive_page = ? ORDER BY first_seen, link',
+            (feed_id, page)
+        )
+        return [self._row_to_item(row) for row in rows]
+
+    @staticmethod
+    def _row_to_item(row):
+        return {
+            'title': row['title'],
+            'link': row['url'] or row['link'],
+            'summary': row['summary'] or '',
+            'author': row['author'],
+            'date': _from_iso(row['published']),
+            'first_seen': _from_iso(row['first_seen']),
+            'last_seen': _from_iso(row['last_seen'])
+        }
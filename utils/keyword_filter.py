@@ -0,0 +1,166 @@
+"""키워드 필터 (포함/제외, 정규식, 필드 지정)"""
+import re
+
+# 필터 규칙에서 쓸 수 있는 필드 이름 -> 게시글 딕셔너리 키
+FIELD_ALIASES = {
+    'title': 'title',
+    'summary': 'summary',
+    'description': 'summary',
+}
+DEFAULT_FIELDS = ['title']
+
+
+def _trie_pattern(keywords):
+    """
+    키워드 목록을 접두사 트리 형태의 정규식 하나로 변환
+
+    'abc', 'abd'는 'ab(?:c|d)'가 되어 위치마다 키워드 수만큼 비교하지 않습니다.
+    부분 문자열 검색이므로 더 짧은 키워드가 끝나는 곳에서 가지를 잘라냅니다.
+    """
+    trie = {}
+    for keyword in keywords:
+        node = trie
+        for ch in keyword:
+            node = node.setdefault(ch, {})
+        node[''] = True
+
+    def build(node):
+        if '' in node:
+            return ''
+        branches = [re.escape(ch) + build(child) for ch, child in sorted(node.items())]
+        if len(branches) == 1:
+            return branches[0]
+        return '(?:' + '|'.join(branches) + ')'
+
+    return build(trie) if trie else None
+
+
+def _compile(literals, patterns):
+    """
+    리터럴 키워드(대소문자 접기 완료)와 정규식 규칙을 컴파일
+
+    리터럴은 접은 텍스트에, 정규식 규칙은 원래 텍스트에 검색하므로 따로 컴파일합니다.
+    정규식 규칙은 (?i) 같은 전역 플래그를 쓸 수 있도록 하나씩 컴파일합니다.
+
+    Returns:
+        tuple: (리터럴 정규식 또는 None, 정규식 규칙 리스트)
+    """
+    trie = _trie_pattern(literals)
+    return (re.compile(trie) if trie else None), [re.compile(pattern) for pattern in patterns]
+
+
+class KeywordFilter:
+    """
+    피드 하나의 필터 규칙을 한 번만 컴파일해 두고 항목마다 검사
+
+    규칙은 필드별로 묶어 포함용/제외용 정규식 하나씩으로 컴파일하므로,
+    항목당 비용이 키워드 수가 아닌 텍스트 길이에 비례합니다.
+    리터럴 키워드와 텍스트는 모두 str.casefold()로 유니코드 대소문자를 접어서 비교하고,
+    정규식 규칙은 원래 텍스트에 그대로 적용합니다 (대소문자를 무시하려면 패턴에 (?i)를 붙임).
+
+    규칙 형식 (config.json):
+        "filter_keywords": ["키워드", ...]          # 기존 형식, 제목 포함 규칙
+        "filters": {
+            "fields": ["title"],                    # 기본 검사 필드 (title, summary/description)
+            "include": ["키워드", {"regex": "(?i)DAN\\\\s?2[45]", "fields": ["title", "summary"]}],
+            "exclude": ["shorts", {"keyword": "예고", "fields": ["summary"]}]
+        }
+
+    포함 규칙이 하나도 없으면 제외 규칙에 걸리지 않은 항목은 모두 통과합니다.
+    """
+
+    def __init__(self, include=None, exclude=None, fields=None):
+        """
+        Args:
+            include: 포함 규칙 리스트 (문자열 또는 {keyword|regex, fields} 딕셔너리)
+            exclude: 제외 규칙 리스트 (형식 동일)
+            fields: 규칙에 fields가 없을 때 검사할 필드 리스트
+        """
+        default_fields = fields or DEFAULT_FIELDS
+        self.include = self._compile_rules(include or [], default_fields)
+        self.exclude = self._compile_rules(exclude or [], default_fields)
+
+    @classmethod
+    def from_config(cls, feed_config):
+        """
+        피드 설정으로 필터 생성
+
+        Args:
+            feed_config: filter_keywords 또는 filters 항목이 있는 피드 설정
+
+        Returns:
+            KeywordFilter
+        """
+        filters = feed_config.get('filters', {})
+        include = list(feed_config.get('filter_keywords', [])) + list(filters.get('include', []))
+        return cls(include=include, exclude=filters.get('exclude', []), fields=filters.get('fields'))
+
+    @staticmethod
+    def _compile_rules(rules, default_fields):
+        """규칙을 필드별로 모아서 {게시글 키: (리터럴 정규식, 정규식 규칙 리스트)} 딕셔너리로 컴파일"""
+        by_field = {}
+        for rule in rules:
+            if isinstance(rule, str):
+                rule = {'keyword': rule}
+            for field in rule.get('fields', default_fields):
+                key = FIELD_ALIASES.get(field)
+                if key is None:
+                    raise ValueError(f"지원하지 않는 필터 필드입니다: {field}")
+                literals, patterns = by_field.setdefault(key, ([], []))
+                if 'regex' in rule:
+                    patterns.append(rule['regex'])
+                elif rule.get('keyword'):
+                    literals.append(rule['keyword'].casefold())
+
+        compiled = {}
+        for key, (literals, patterns) in by_field.items():
+            regexes = _compile(literals, patterns)
+            if regexes[0] is not None or regexes[1]:
+                compiled[key] = regexes
+        return compiled
+
+    @staticmethod
+    def _search(regexes, text):
+        """리터럴은 접은 텍스트에서, 정규식 규칙은 원래 텍스트에서 검색"""
+        literal_regex, pattern_regexes = regexes
+        if literal_regex is not None:
+            found = literal_regex.search(text.casefold())
+            if found:
+                return found
+        for pattern_regex in pattern_regexes:
+            found = pattern_regex.search(text)
+            if found:
+                return found
+        return None
+
+    @property
+    def active(self):
+        """규칙이 하나라도 있는지 여부"""
+        return bool(self.include or self.exclude)
+
+    def match(self, item):
+        """
+        항목이 필터를 통과하는지 검사
+
+        Args:
+            item: 게시글 딕셔너리 (title, summary 등)
+
+        Returns:
+            re.Match: 포함 규칙에 걸린 매치 (포함 규칙이 없으면 True), 통과하지 못하면 None
+        """
+        for key, regexes in self.exclude.items():
+            if self._search(regexes, item.get(key) or ''):
+                return None
+
+        if not self.include:
+            return True
+
+        for key, regexes in self.include.items():
+            found = self._search(regexes, item.get(key) or '')
+            if found:
+                return found
+        return None
+
+    def apply(self, items):
+        """필터를 통과한 항목만 리스트로 반환"""
+        return [item for item in items if self.match(item)]
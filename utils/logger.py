@@ -1,28 +1,165 @@
 """로깅 유틸리티"""
+import glob
 import json
 import os
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+
+from utils.atomic_file import atomic_write
+from utils.file_lock import file_lock
+from utils.resilience import RETRY_LOG
+
+# 회전 기준 기본값
+DEFAULT_MAX_BYTES = 1024 * 1024
+DEFAULT_MAX_AGE_DAYS = 30
+DEFAULT_KEEP_ROTATED = 5
+
+# docs/crawl_log.json에 보여 줄 최근 항목 수
+VIEW_SIZE = 100
+
+
+def _read_tail(path, count, block_size=8192):
+    """
+    JSON Lines 파일의 마지막 count개 항목을 끝에서부터 읽기
+
+    Returns:
+        list: 오래된 순 항목 리스트
+    """
+    if count <= 0 or not os.path.exists(path):
+        return []
+    with open(path, 'rb') as f:
+        f.seek(0, os.SEEK_END)
+        position = f.tell()
+        data = b''
+        while position > 0 and data.count(b'\n') <= count:
+            step = min(block_size, position)
+            position -= step
+            f.seek(position)
+            data = f.read(step) + data
+
+    entries = []
+    for line in data.splitlines()[-count:]:
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue  # 잘린 줄(끝에서 읽기 시작한 조각)은 건너뜀
+    return entries
+
+
+def _read_first(path):
+    """JSON Lines 파일의 첫 항목 (없으면 None)"""
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.loads(f.readline())
+    except (OSError, ValueError):
+        return None
+
+
+def _apply_status(status, entry):
+    """피드 상태 인덱스에 로그 항목 하나 반영"""
+    feed = status.setdefault(entry.get('feed'), {
+        'last_run': None,
+        'last_status': None,
+        'last_success': None,
+        'last_failure': None,
+        'last_error': None,
+        'consecutive_failures': 0,
+        'runs': 0,
+        'successes': 0,
+        'success_rate': 0.0
+    })
+    timestamp = entry.get('timestamp')
+    if entry.get('status') == 'breaker':
+        # 서킷 브레이커 상태 변화는 실행으로 세지 않음
+        feed['breaker'] = entry.get('breaker')
+        return
+    feed['last_run'] = timestamp
+    feed['last_status'] = entry.get('status')
+    if entry.get('status') == 'skipped':
+        # 건너뛴 실행은 성공/실패 통계와 연속 실패 횟수를 바꾸지 않음
+        feed['last_skip_reason'] = entry.get('reason')
+        return
+    feed['runs'] += 1
+    if entry.get('status') == 'success':
+        feed['last_success'] = timestamp
+        feed['consecutive_failures'] = 0
+        feed['successes'] += 1
+    else:
+        feed['last_failure'] = timestamp
+        feed['last_error'] = entry.get('error')
+        feed['consecutive_failures'] += 1
+    feed['success_rate'] = round(feed['successes'] / feed['runs'], 4)
+
+
+def load_feed_status(status_file='state/feed_status.json'):
+    """
+    피드별 상태 인덱스 읽기
+
+    Args:
+        status_file: 상태 인덱스 경로
+
+    Returns:
+        dict: {feed_id: {last_run, last_status, last_success, last_failure, last_error,
+               consecutive_failures, runs, successes, success_rate
+               (+ 있으면 last_skip_reason, breaker)}} (파일이 없으면 None)
+    """
+    try:
+        with open(status_file, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
 
 
 class CrawlLogger:
-    """크롤링 결과 로거"""
-    
-    def __init__(self, log_file='docs/crawl_log.json'):
+    """
+    크롤링 결과 로거
+
+    항목은 state/crawl_log.jsonl에 한 줄씩 덧붙이기만 하므로 저장 비용이
+    이력 길이와 상관없고, 잠금 파일로 여러 스레드/프로세스의 저장을 직렬화합니다.
+    파일이 max_bytes를 넘거나 첫 항목이 max_age_days보다 오래되면
+    crawl_log.<시각>.jsonl로 회전하고, keep_rotated개를 넘는 오래된 회전 파일은
+    피드별 집계(state/crawl_log_summary.json)에 합친 뒤 지웁니다.
+    docs/crawl_log.json은 최근 VIEW_SIZE개 항목을 보여 주는 읽기용 뷰로 계속 생성합니다.
+
+    저장할 때마다 피드별 상태 인덱스(state/feed_status.json)도 새 항목만큼 갱신하므로
+    README 같은 상태 조회는 이력을 훑지 않고 피드 수만큼만 읽으면 됩니다.
+    """
+
+    def __init__(self, log_file='docs/crawl_log.json', journal_file='state/crawl_log.jsonl',
+                 max_bytes=DEFAULT_MAX_BYTES, max_age_days=DEFAULT_MAX_AGE_DAYS,
+                 keep_rotated=DEFAULT_KEEP_ROTATED, status_file='state/feed_status.json'):
+        """
+        Args:
+            log_file: 최근 항목 뷰 (JSON)
+            journal_file: 덧붙이기 전용 로그 (JSON Lines)
+            max_bytes: 이 크기를 넘으면 회전
+            max_age_days: 첫 항목이 이보다 오래되면 회전
+            keep_rotated: 남겨 둘 회전 파일 수
+            status_file: 피드별 상태 인덱스 (JSON)
+        """
         self.log_file = log_file
-        self.logs = self._load_logs()
-        
-    def _load_logs(self):
-        """기존 로그 불러오기"""
-        if os.path.exists(self.log_file):
-            try:
-                with open(self.log_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except:
-                return {'history': []}
-        return {'history': []}
-    
-    def log_success(self, feed_name, count, message=''):
-        """성공 로그 기록"""
+        self.journal_file = journal_file
+        self.lock_file = journal_file + '.lock'
+        self.summary_file = os.path.splitext(journal_file)[0] + '_summary.json'
+        self.max_bytes = max_bytes
+        self.max_age = timedelta(days=max_age_days)
+        self.keep_rotated = keep_rotated
+        self.status_file = status_file
+        self._new_entries = []
+
+    def _append(self, entry):
+        """저장 대기 목록에 항목 추가"""
+        self._new_entries.append(entry)
+
+    def log_success(self, feed_name, count, message='', details=None):
+        """
+        성공 로그 기록
+
+        Args:
+            feed_name: 피드 ID
+            count: 생성된 항목 수
+            message: 로그 메시지
+            details: 함께 남길 부가 정보 딕셔너리 (예: 로딩 통계)
+        """
         entry = {
             'timestamp': datetime.now(timezone.utc).isoformat(),
             'feed': feed_name,
@@ -30,9 +167,12 @@ class CrawlLogger:
             'count': count,
             'message': message
         }
-        self.logs['history'].append(entry)
+        if details:
+            entry['details'] = details
+        self._attach_retries(entry)
+        self._append(entry)
         print(f"✅ [{feed_name}] 성공: {count}개 항목 생성")
-        
+
     def log_failure(self, feed_name, error):
         """실패 로그 기록"""
         entry = {
@@ -41,26 +181,246 @@ class CrawlLogger:
             'status': 'failure',
             'error': str(error)
         }
-        self.logs['history'].append(entry)
+        self._attach_retries(entry)
+        self._append(entry)
         print(f"❌ [{feed_name}] 실패: {error}")
-        
+
+    def log_skipped(self, feed_name, reason, details=None):
+        """
+        건너뛴 실행 기록 (기존 RSS 파일은 그대로 유지됨)
+
+        Args:
+            feed_name: 피드 ID
+            reason: 건너뛴 이유
+            details: 부가 정보 (예: 서킷 브레이커 상태)
+        """
+        entry = {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'feed': feed_name,
+            'status': 'skipped',
+            'reason': reason
+        }
+        if details:
+            entry['details'] = details
+        self._append(entry)
+        print(f"⏭️  [{feed_name}] 건너뜀: {reason}")
+
+    def log_breaker(self, feed_name, breaker):
+        """
+        서킷 브레이커 상태 변화 기록
+
+        Args:
+            feed_name: 피드 ID
+            breaker: CircuitBreakers.record_*()가 돌려준 상태
+        """
+        self._append({
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'feed': feed_name,
+            'status': 'breaker',
+            'breaker': breaker
+        })
+
+    @staticmethod
+    def _attach_retries(entry):
+        """이 피드에서 일어난 재시도 기록을 항목에 붙이기"""
+        retries = RETRY_LOG.pop(entry['feed'])
+        if retries:
+            entry['retries'] = retries
+
+    def _rotated_files(self):
+        """회전된 로그 파일 목록 (오래된 순)"""
+        base = os.path.splitext(self.journal_file)[0]
+        return sorted(glob.glob(f'{glob.escape(base)}.*.jsonl'))
+
+    def _migrate_view(self):
+        """JSON Lines 로그가 아직 없으면 기존 crawl_log.json 이력으로 시작"""
+        if os.path.exists(self.journal_file) or self._rotated_files() or not os.path.exists(self.log_file):
+            return
+        try:
+            with open(self.log_file, 'r', encoding='utf-8') as f:
+                history = json.load(f).get('history', [])
+        except (OSError, ValueError, AttributeError):
+            return
+        with open(self.journal_file, 'a', encoding='utf-8') as f:
+            for entry in history:
+                f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    def _needs_rotation(self):
+        try:
+            size = os.path.getsize(self.journal_file)
+        except OSError:
+            return False
+        if size == 0:
+            return False
+        if size >= self.max_bytes:
+            return True
+        first = _read_first(self.journal_file)
+        if not first:
+            return False
+        try:
+            started = datetime.fromisoformat(first['timestamp'])
+        except (KeyError, ValueError):
+            return False
+        if started.tzinfo is None:
+            started = started.replace(tzinfo=timezone.utc)
+        return datetime.now(timezone.utc) - started >= self.max_age
+
+    def _rotate(self):
+        """현재 로그를 회전하고, 보관 개수를 넘는 회전 파일은 집계에 합친 뒤 삭제"""
+        base = os.path.splitext(self.journal_file)[0]
+        stamp = datetime.now(timezone.utc).strftime('%Y%m%dT%H%M%S%f')
+        os.replace(self.journal_file, f'{base}.{stamp}.jsonl')
+
+        rotated = self._rotated_files()
+        expired = rotated[:max(0, len(rotated) - self.keep_rotated)]
+        if not expired:
+            return
+
+        summary = self.load_summary()
+        feeds = summary.setdefault('feeds', {})
+        for path in expired:
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if entry.get('status') == 'breaker':
+                        continue
+                    stats = feeds.setdefault(entry.get('feed'), {
+                        'runs': 0, 'successes': 0, 'failures': 0,
+                        'first_timestamp': entry.get('timestamp'), 'last_timestamp': None
+                    })
+                    timestamp = entry.get('timestamp')
+                    stats['last_timestamp'] = timestamp
+                    stats['last_status'] = entry.get('status')
+                    if entry.get('status') == 'skipped':
+                        stats['skipped'] = stats.get('skipped', 0) + 1
+                        continue
+                    stats['runs'] += 1
+                    # 상태 인덱스를 다시 만들 때 마지막 성공/실패 시각과 연속 실패 횟수를 잃지 않도록 함께 보관
+                    if entry.get('status') == 'success':
+                        stats['successes'] += 1
+                        stats['last_success'] = timestamp
+                        stats['consecutive_failures'] = 0
+                    else:
+                        stats['failures'] += 1
+                        stats['last_failure'] = timestamp
+                        stats['last_error'] = entry.get('error')
+                        stats['consecutive_failures'] = stats.get('consecutive_failures', 0) + 1
+        summary['compacted_files'] = summary.get('compacted_files', 0) + len(expired)
+        atomic_write(self.summary_file, json.dumps(summary, ensure_ascii=False, indent=2))
+        for path in expired:
+            os.remove(path)
+
+    def load_summary(self):
+        """
+        회전 후 삭제된 오래된 로그의 피드별 집계
+
+        Returns:
+            dict: {'feeds': {feed_id: {runs, successes, failures, skipped, first_timestamp, last_timestamp,
+                   last_status, last_success, last_failure, last_error, consecutive_failures}},
+                   'compacted_files': 합친 파일 수}
+        """
+        try:
+            with open(self.summary_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {'feeds': {}, 'compacted_files': 0}
+
+    def recent(self, count=VIEW_SIZE):
+        """
+        최근 항목 (현재 로그가 모자라면 회전 파일에서 채움)
+
+        Returns:
+            list: 오래된 순 항목 리스트
+        """
+        entries = _read_tail(self.journal_file, count)
+        for path in reversed(self._rotated_files()):
+            if len(entries) >= count:
+                break
+            entries = _read_tail(path, count - len(entries)) + entries
+        return entries
+
+    def _rebuild_status(self):
+        """
+        상태 인덱스가 없을 때 남아 있는 로그 전체로 한 번 만들기
+
+        회전 후 삭제된 로그는 집계에 남은 횟수와 마지막 성공/실패 기록으로 시작합니다.
+        """
+        status = {}
+        for feed_id, totals in self.load_summary().get('feeds', {}).items():
+            status[feed_id] = {
+                'last_run': totals.get('last_timestamp'),
+                'last_status': totals.get('last_status'),
+                'last_success': totals.get('last_success'),
+                'last_failure': totals.get('last_failure'),
+                'last_error': totals.get('last_error'),
+                'consecutive_failures': totals.get('consecutive_failures', 0),
+                'runs': totals.get('runs', 0),
+                'successes': totals.get('successes', 0),
+                'success_rate': round(totals['successes'] / totals['runs'], 4) if totals.get('runs') else 0.0
+            }
+        for path in self._rotated_files() + [self.journal_file]:
+            if not os.path.exists(path):
+                continue
+            with open(path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        _apply_status(status, json.loads(line))
+                    except ValueError:
+                        continue
+        return status
+
+    def _update_status(self, entries):
+        """새 항목만큼 상태 인덱스 갱신"""
+        status = load_feed_status(self.status_file)
+        if status is None:
+            # 인덱스가 없으면 방금 덧붙인 항목까지 포함해 로그에서 다시 만들기
+            status = self._rebuild_status()
+        else:
+            for entry in entries:
+                _apply_status(status, entry)
+        atomic_write(self.status_file, json.dumps(status, ensure_ascii=False, indent=2))
+
+    def _write_view(self):
+        """최근 항목으로 docs/crawl_log.json 뷰 갱신"""
+        atomic_write(self.log_file, json.dumps({'history': self.recent()}, ensure_ascii=False, indent=2))
+
     def save(self):
-        """로그 저장"""
-        # 최근 100개만 유지
-        self.logs['history'] = self.logs['history'][-100:]
-        
-        os.makedirs(os.path.dirname(self.log_file), exist_ok=True)
-        with open(self.log_file, 'w', encoding='utf-8') as f:
-            json.dump(self.logs, f, ensure_ascii=False, indent=2)
-    
+        """
+        로그 저장
+
+        새 항목만 JSON Lines 파일 끝에 덧붙이고 피드 상태 인덱스와
+        crawl_log.json 뷰를 갱신합니다.
+        """
+        with file_lock(self.lock_file):
+            self._migrate_view()
+            if self._needs_rotation():
+                self._rotate()
+
+            if self._new_entries:
+                data = ''.join(json.dumps(entry, ensure_ascii=False) + '\n' for entry in self._new_entries)
+                with open(self.journal_file, 'a', encoding='utf-8') as f:
+                    f.write(data)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._update_status(self._new_entries)
+                self._new_entries = []
+
+            self._write_view()
+
     def get_recent_failures(self, hours=24):
         """최근 실패 목록 가져오기"""
-        from datetime import timedelta
-        cutoff = datetime.now() - timedelta(hours=hours)
-
-        failures = [
-            log for log in self.logs['history']
-            if log['status'] == 'failure'
-            and datetime.fromisoformat(log['timestamp']) > cutoff
-        ]
+        cutoff = datetime.now(timezone.utc) - timedelta(hours=hours)
+
+        failures = []
+        for log in self.recent():
+            if log['status'] != 'failure':
+                continue
+            timestamp = datetime.fromisoformat(log['timestamp'])
+            if timestamp.tzinfo is None:
+                timestamp = timestamp.replace(tzinfo=timezone.utc)
+            if timestamp > cutoff:
+                failures.append(log)
         return failures
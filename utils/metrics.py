@@ -0,0 +1,249 @@
+"""실행 단계별 시간/자원 계측"""
+import contextvars
+import json
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from utils.atomic_file import atomic_write
+from utils.file_lock import file_lock
+
+try:
+    import resource
+except ImportError:  # Windows에는 없음 (최대 메모리는 기록하지 않음)
+    resource = None
+
+# 실행별 계측 이력(state/metrics.jsonl)이 이 크기를 넘으면 오래된 실행부터 지워 절반으로 줄임
+DEFAULT_HISTORY_MAX_BYTES = 512 * 1024
+
+# 피드에 속하지 않는 작업(예: 공유 브라우저 실행)을 모으는 이름
+RUN_SCOPE = '_run'
+
+# 지금 실행 중인 피드 (스레드와 asyncio task마다 따로 유지됨)
+_current_feed = contextvars.ContextVar('current_feed', default=RUN_SCOPE)
+
+
+class Metrics:
+    """
+    피드별 단계 시간(횟수, 합계, 최대)과 카운터(바이트, 항목 수 등)를 모으는 저장소
+
+    여러 워커 스레드와 브라우저 풀 이벤트 루프에서 동시에 기록하므로 잠금으로 보호합니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        """새 실행을 위해 모든 값 초기화"""
+        with self._lock:
+            self.started_at = datetime.now(timezone.utc)
+            self._started = time.perf_counter()
+            self._stages = {}
+            self._counters = {}
+
+    def record_stage(self, feed, name, seconds):
+        """단계 하나의 소요 시간 기록"""
+        with self._lock:
+            stats = self._stages.setdefault(feed, {}).setdefault(name, {'count': 0, 'seconds': 0.0, 'max_seconds': 0.0})
+            stats['count'] += 1
+            stats['seconds'] += seconds
+            stats['max_seconds'] = max(stats['max_seconds'], seconds)
+
+    def add(self, feed, name, value):
+        """카운터 값 더하기"""
+        with self._lock:
+            counters = self._counters.setdefault(feed, {})
+            counters[name] = counters.get(name, 0) + value
+
+    def snapshot(self):
+        """
+        지금까지 모은 값
+
+        Returns:
+            dict: {started_at, duration_seconds, max_rss_kb (알 수 없으면 None), feeds: {feed: {stages, counters}}}
+        """
+        with self._lock:
+            feeds = {}
+            for feed in sorted(set(self._stages) | set(self._counters)):
+                feeds[feed] = {
+                    'stages': {
+                        name: {
+                            'count': stats['count'],
+                            'seconds': round(stats['seconds'], 6),
+                            'max_seconds': round(stats['max_seconds'], 6)
+                        }
+                        for name, stats in sorted(self._stages.get(feed, {}).items())
+                    },
+                    'counters': dict(sorted(self._counters.get(feed, {}).items()))
+                }
+            return {
+                'started_at': self.started_at.isoformat(),
+                'duration_seconds': round(time.perf_counter() - self._started, 6),
+                'max_rss_kb': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+                'feeds': feeds
+            }
+
+
+# 프로세스 전체에서 공유하는 계측 저장소
+METRICS = Metrics()
+
+
+def current_feed():
+    """지금 기록 대상인 피드 ID"""
+    return _current_feed.get()
+
+
+@contextmanager
+def feed_scope(feed_id):
+    """
+    블록 안에서 기록하는 단계/카운터를 feed_id에 귀속
+
+    Args:
+        feed_id: 피드 ID
+    """
+    token = _current_feed.set(feed_id)
+    try:
+        yield
+    finally:
+        _current_feed.reset(token)
+
+
+@contextmanager
+def stage(name):
+    """
+    블록 실행 시간을 현재 피드의 단계 시간으로 기록 (예외가 나도 기록)
+
+    Args:
+        name: 단계 이름 (browser_launch, navigation, selector_wait, extraction,
+              fetch, parse, filter, write 등)
+    """
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        METRICS.record_stage(current_feed(), name, time.perf_counter() - started)
+
+
+def count(name, value=1):
+    """
+    현재 피드의 카운터 증가
+
+    Args:
+        name: 카운터 이름 (bytes_fetched, items_fetched, items_written 등)
+        value: 더할 값
+    """
+    METRICS.add(current_feed(), name, value)
+
+
+def _label(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _metric_name(name):
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
+
+
+def to_prometheus(snapshot):
+    """
+    계측 값을 Prometheus 텍스트 형식으로 변환
+
+    Args:
+        snapshot: Metrics.snapshot() 결과
+
+    Returns:
+        str: text/plain; version=0.0.4 형식 문자열
+    """
+    lines = [
+        '# HELP rss_run_duration_seconds 전체 실행 시간',
+        '# TYPE rss_run_duration_seconds gauge',
+        f"rss_run_duration_seconds {snapshot['duration_seconds']}",
+        '# HELP rss_run_timestamp_seconds 실행 시작 시각 (Unix time)',
+        '# TYPE rss_run_timestamp_seconds gauge',
+        f"rss_run_timestamp_seconds {datetime.fromisoformat(snapshot['started_at']).timestamp():.3f}",
+    ]
+    if snapshot['max_rss_kb'] is not None:
+        lines += [
+            '# HELP rss_process_max_rss_bytes 프로세스 최대 상주 메모리',
+            '# TYPE rss_process_max_rss_bytes gauge',
+            f"rss_process_max_rss_bytes {snapshot['max_rss_kb'] * 1024}",
+        ]
+
+    stage_metrics = (
+        ('rss_stage_seconds_total', 'counter', '단계별 소요 시간 합계', 'seconds'),
+        ('rss_stage_calls_total', 'counter', '단계별 실행 횟수', 'count'),
+        ('rss_stage_max_seconds', 'gauge', '단계별 최대 소요 시간', 'max_seconds'),
+    )
+    for metric, metric_type, help_text, key in stage_metrics:
+        lines += [f'# HELP {metric} {help_text}', f'# TYPE {metric} {metric_type}']
+        for feed, data in snapshot['feeds'].items():
+            for name, stats in data['stages'].items():
+                lines.append(f'{metric}{{feed="{_label(feed)}",stage="{_label(name)}"}} {stats[key]}')
+
+    counter_names = sorted({name for data in snapshot['feeds'].values() for name in data['counters']})
+    for name in counter_names:
+        metric = f'rss_{_metric_name(name)}_total'
+        lines += [f'# HELP {metric} {name}', f'# TYPE {metric} counter']
+        for feed, data in snapshot['feeds'].items():
+            if name in data['counters']:
+                lines.append(f'{metric}{{feed="{_label(feed)}"}} {data["counters"][name]}')
+
+    return '\n'.join(lines) + '\n'
+
+
+def append_history(snapshot, history_path='state/metrics.jsonl', max_bytes=DEFAULT_HISTORY_MAX_BYTES):
+    """
+    계측 이력 파일 끝에 이번 실행의 snapshot을 한 줄로 덧붙이기
+
+    실행 사이에 단계 시간이 어떻게 변하는지 볼 수 있도록 커밋되는 파일이므로,
+    max_bytes를 넘으면 오래된 실행부터 지워 max_bytes의 절반 아래로 줄입니다.
+
+    Args:
+        snapshot: Metrics.snapshot() 결과
+        history_path: JSON Lines 이력 파일 경로
+        max_bytes: 이력 파일 최대 크기
+    """
+    line = json.dumps(snapshot, ensure_ascii=False, separators=(',', ':')) + '\n'
+    os.makedirs(os.path.dirname(history_path) or '.', exist_ok=True)
+    with file_lock(history_path + '.lock'):
+        with open(history_path, 'a', encoding='utf-8') as f:
+            f.write(line)
+        if os.path.getsize(history_path) <= max_bytes:
+            return
+
+        with open(history_path, 'r', encoding='utf-8') as f:
+            lines = f.readlines()
+        kept, size = [], 0
+        for entry in reversed(lines):
+            size += len(entry.encode('utf-8'))
+            if kept and size > max_bytes // 2:
+                break
+            kept.append(entry)
+        atomic_write(history_path, ''.join(reversed(kept)))
+
+
+def write_metrics(json_path='state/metrics.json', prom_path='state/metrics.prom',
+                  history_path='state/metrics.jsonl'):
+    """
+    이번 실행의 계측 값을 JSON과 Prometheus 텍스트 파일로 저장하고 이력에 덧붙이기
+
+    metrics.json/metrics.prom은 마지막 실행만 담으므로 커밋하지 않고(.gitignore),
+    실행 사이의 추이는 크기를 제한한 이력 파일(metrics.jsonl)에 남깁니다.
+
+    Args:
+        json_path: JSON 파일 경로
+        prom_path: Prometheus 텍스트 형식 파일 경로
+        history_path: 실행별 이력 파일 경로 (None이면 남기지 않음)
+
+    Returns:
+        dict: 저장한 snapshot
+    """
+    snapshot = METRICS.snapshot()
+    atomic_write(json_path, json.dumps(snapshot, ensure_ascii=False, indent=2))
+    atomic_write(prom_path, to_prometheus(snapshot))
+    if history_path:
+        append_history(snapshot, history_path)
+    return snapshot
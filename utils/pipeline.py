@@ -0,0 +1,269 @@
+"""피드 항목 모델과 스트리밍 처리 파이프라인
+
+크롤러는 항목을 FeedItem으로 만들고 source → normalize → filter → dedupe → enrich → sink
+단계를 제너레이터로 이어 붙입니다. 항목은 단계마다 리스트로 모이지 않고 하나씩 흘러가며,
+정렬이 필요한 출력 단계(create_feeds)에서만 한 번 모입니다.
+
+    items = Pipeline(posts, filter_items(keyword_filter.match), ObserveItems(store, feed_id, now))
+    create_feeds(feed_info, items, output_path)
+    print(items.count)
+"""
+import time
+from collections.abc import Mapping
+
+from utils.item_store import canonical_link
+from utils.metrics import METRICS, current_feed
+
+# FeedItem 필드 (RSS item 하나에 필요한 값)
+FIELDS = ('title', 'link', 'summary', 'author', 'date')
+
+
+class FeedItem(Mapping):
+    """
+    피드 항목 하나 (title, link, summary, author, date)
+
+    __slots__로 필드만 저장하므로 같은 항목을 딕셔너리로 들고 있을 때보다 훨씬 작습니다.
+    item.title처럼 속성으로 읽는 것이 기본이지만, 기존 코드(ItemStore, KeywordFilter 등)가
+    쓰던 item['link'], item.get('summary') 형태도 그대로 동작합니다.
+    값이 None인 필드는 매핑에 없는 키로 취급합니다 ('author' in item, dict(item)).
+    """
+
+    __slots__ = FIELDS
+
+    def __init__(self, title='', link='', summary='', author=None, date=None):
+        self.title = title
+        self.link = link
+        self.summary = summary
+        self.author = author
+        self.date = date
+
+    @classmethod
+    def from_mapping(cls, data):
+        """
+        딕셔너리(또는 FeedItem)를 FeedItem으로 변환 (모르는 키는 무시)
+
+        Args:
+            data: title, link, summary, author, date 키를 가진 매핑
+
+        Returns:
+            FeedItem: data가 이미 FeedItem이면 그대로 반환
+        """
+        if isinstance(data, FeedItem):
+            return data
+        return cls(
+            data.get('title') or '',
+            data.get('link') or '',
+            data.get('summary') or '',
+            data.get('author'),
+            data.get('date')
+        )
+
+    def __getitem__(self, key):
+        if key not in FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key, value):
+        if key not in FIELDS:
+            raise KeyError(key)
+        setattr(self, key, value)
+
+    def __iter__(self):
+        return (field for field in FIELDS if getattr(self, field) is not None)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __contains__(self, key):
+        return key in FIELDS and getattr(self, key) is not None
+
+    def get(self, key, default=None):
+        value = getattr(self, key, None) if key in FIELDS else None
+        return default if value is None else value
+
+    def to_dict(self):
+        """모든 필드를 담은 딕셔너리"""
+        return {field: getattr(self, field) for field in FIELDS}
+
+    def __repr__(self):
+        return f"FeedItem(title={self.title!r}, link={self.link!r})"
+
+
+class Pipeline:
+    """
+    source에 단계(items → items 제너레이터 함수)를 차례로 이어 붙인 반복 가능 객체
+
+    한 번만 돌 수 있고, 다 돌고 나면 count에 끝까지 나온 항목 수가 남습니다.
+    on_done()으로 등록한 함수는 끝까지 돌았을 때(중간에 예외가 나지 않았을 때) 호출됩니다.
+    """
+
+    def __init__(self, source, *stages):
+        """
+        Args:
+            source: 항목 이터러블 (딕셔너리나 FeedItem)
+            stages: 단계 함수들 (None은 건너뜀, 설정에 따라 단계를 빼고 싶을 때)
+        """
+        self.source = source
+        self.stages = [stage for stage in stages if stage is not None]
+        self.count = 0
+        self._callbacks = []
+        self._started = False
+
+    def pipe(self, *stages):
+        """
+        단계 추가 (돌기 시작하기 전에만 가능)
+
+        Returns:
+            Pipeline: self
+        """
+        if self._started:
+            raise RuntimeError("이미 소비 중인 파이프라인에는 단계를 추가할 수 없습니다")
+        self.stages.extend(stage for stage in stages if stage is not None)
+        return self
+
+    def on_done(self, callback):
+        """
+        끝까지 돌았을 때 callback(count) 호출 등록
+
+        Returns:
+            Pipeline: self
+        """
+        self._callbacks.append(callback)
+        return self
+
+    def __iter__(self):
+        if self._started:
+            raise RuntimeError("파이프라인은 한 번만 돌 수 있습니다")
+        self._started = True
+
+        items = iter(self.source)
+        for stage in self.stages:
+            items = stage(items)
+        for item in items:
+            self.count += 1
+            yield item
+        for callback in self._callbacks:
+            callback(self.count)
+
+
+def normalize(items):
+    """딕셔너리 항목을 FeedItem으로 변환하는 단계"""
+    for item in items:
+        yield FeedItem.from_mapping(item)
+
+
+def filter_items(predicate, stage_name='filter'):
+    """
+    predicate(item)이 참인 항목만 통과시키는 단계
+
+    항목이 단계 사이를 하나씩 오가므로 stage() 블록으로 감쌀 수 없어서,
+    predicate에 쓴 시간만 모아 현재 피드의 stage_name 단계 시간으로 기록합니다.
+
+    Args:
+        predicate: 항목을 받아 통과 여부를 돌려주는 함수 (예: KeywordFilter.match)
+        stage_name: 계측 단계 이름 (None이면 기록하지 않음)
+
+    Returns:
+        function: 단계 함수
+    """
+    def stage(items):
+        spent = 0.0
+        try:
+            for item in items:
+                started = time.perf_counter()
+                keep = predicate(item)
+                spent += time.perf_counter() - started
+                if keep:
+                    yield item
+        finally:
+            if stage_name:
+                METRICS.record_stage(current_feed(), stage_name, spent)
+    return stage
+
+
+def dedupe(key=canonical_link):
+    """
+    같은 링크의 항목은 처음 것만 통과시키는 단계
+
+    Args:
+        key: 링크를 비교용 키로 바꾸는 함수 (기본값: ItemStore와 같은 canonical_link)
+
+    Returns:
+        function: 단계 함수
+    """
+    def stage(items):
+        seen = set()
+        for item in items:
+            link_key = key(item.link)
+            if link_key in seen:
+                continue
+            seen.add(link_key)
+            yield item
+    return stage
+
+
+def enrich(function):
+    """
+    항목마다 function(item)을 호출해 값을 채우는 단계 (function은 항목을 직접 고침)
+
+    Returns:
+        function: 단계 함수
+    """
+    def stage(items):
+        for item in items:
+            function(item)
+            yield item
+    return stage
+
+
+class ObserveItems:
+    """
+    항목을 batch_size개씩 ItemStore에 기록하는 단계
+
+    ItemStore.observe는 한 번에 여러 항목을 쓰는 편이 빠르므로 조금씩 모아서 기록하고,
+    모은 항목은 바로 다음 단계로 넘깁니다. new_items에는 이번에 처음 본 항목 수가 남습니다.
+    """
+
+    def __init__(self, store, feed_id, seen_at, first_seen_as_date=False, batch_size=500):
+        """
+        Args:
+            store: ItemStore
+            feed_id: 피드 ID
+            seen_at: 관측 시각
+            first_seen_as_date: 항목의 date를 처음 본 시각으로 바꿀지 (발행 시각이 없는 소스용)
+            batch_size: 한 번에 기록할 항목 수
+        """
+        self.store = store
+        self.feed_id = feed_id
+        self.seen_at = seen_at
+        self.first_seen_as_date = first_seen_as_date
+        self.batch_size = max(1, batch_size)
+        self.new_items = 0
+
+    def _flush(self, batch):
+        # 저장소는 정규화된 링크로 기록하므로 한 배치에 같은 글의 다른 표기(끝 슬래시 등)가
+        # 섞여 있으면 돌려받는 원본 링크는 그중 하나뿐임 → 정규화된 링크로 찾기
+        first_seen = {
+            canonical_link(link): seen
+            for link, seen in self.store.observe(self.feed_id, batch, seen_at=self.seen_at).items()
+        }
+        new_keys = set()
+        for item in batch:
+            key = canonical_link(item.link)
+            seen = first_seen[key]
+            if seen == self.seen_at:
+                new_keys.add(key)
+            if self.first_seen_as_date:
+                item.date = seen
+        self.new_items += len(new_keys)
+        return batch
+
+    def __call__(self, items):
+        batch = []
+        for item in items:
+            batch.append(item)
+            if len(batch) >= self.batch_size:
+                yield from self._flush(batch)
+                batch = []
+        if batch:
+            yield from self._flush(batch)
@@ -1,42 +1,51 @@
 """README.md 피드 상태 테이블 업데이트 유틸리티"""
 import os
+import sys
 import json
 from datetime import datetime, timezone, timedelta
 
+# 단독 실행(make update-readme) 시 상위 디렉토리 모듈 import를 위한 경로 추가
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.feed_formats import format_path
+from utils.logger import load_feed_status
+
+# RSS 외 출력 형식의 링크 이름
+FORMAT_LABELS = {'atom': 'Atom', 'json': 'JSON'}
+
+
+def _format_kst(timestamp):
+    """ISO 시각 문자열을 KST 'YYYY-MM-DD HH:MM'로 변환"""
+    timestamp = datetime.fromisoformat(timestamp)
+    # UTC -> KST 변환 (timezone aware한 경우만)
+    if timestamp.tzinfo is not None:
+        kst = timezone(timedelta(hours=9))
+        timestamp = timestamp.astimezone(kst)
+    return timestamp.strftime('%Y-%m-%d %H:%M')
+
 
 def update_readme_feed_status():
     """
     README.md의 피드 상태 테이블을 업데이트합니다.
-    crawl_log.json의 최신 실행 결과를 기반으로 테이블을 생성합니다.
+    피드별 상태 인덱스(state/feed_status.json)를 기반으로 테이블을 생성하므로
+    로그 이력 길이와 상관없이 피드 수만큼만 읽습니다.
     """
     # 경로 설정
     base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     readme_path = os.path.join(base_dir, 'README.md')
-    log_path = os.path.join(base_dir, 'docs', 'crawl_log.json')
+    status_path = os.path.join(base_dir, 'state', 'feed_status.json')
     config_path = os.path.join(base_dir, 'config.json')
 
-    # 로그 파일 읽기
-    if not os.path.exists(log_path):
-        print("⚠️  crawl_log.json 파일이 없습니다. 테이블을 생성할 수 없습니다.")
+    # 피드별 상태 인덱스 읽기 (로그를 저장할 때마다 CrawlLogger가 갱신)
+    feed_status = load_feed_status(status_path)
+    if feed_status is None:
+        print("⚠️  feed_status.json 파일이 없습니다. 테이블을 생성할 수 없습니다.")
         return
 
-    with open(log_path, 'r', encoding='utf-8') as f:
-        log_data = json.load(f)
-
-    # history 배열에서 로그 가져오기
-    logs = log_data.get('history', [])
-
     # config 파일 읽기
     with open(config_path, 'r', encoding='utf-8') as f:
         config = json.load(f)
 
-    # 최신 로그만 추출 (각 피드별로 최신 것)
-    latest_logs = {}
-    for log in reversed(logs):  # 최신 것부터
-        feed_id = log['feed']
-        if feed_id not in latest_logs:
-            latest_logs[feed_id] = log
-
     # 테이블 생성
     table_lines = [
         "## 피드 상태",
@@ -46,7 +55,7 @@ def update_readme_feed_status():
     ]
 
     # GitHub Pages base URL
-    base_url = "https://choinashil.github.io/rss-feeds-generator"
+    base_url = config.get('site', {}).get('base_url', "https://choinashil.github.io/rss-feeds-generator")
 
     for feed_id, feed_config in config['feeds'].items():
         if not feed_config.get('enabled', True):
@@ -55,41 +64,31 @@ def update_readme_feed_status():
         feed_name = feed_config['name']
         output_file = feed_config['output']
         rss_url = f"{base_url}/{output_file}"
-
-        if feed_id in latest_logs:
-            log = latest_logs[feed_id]
-            status = "✅" if log['status'] == 'success' else "❌"
-
-            # 마지막 성공 시간 표시
-            if log['status'] == 'success':
-                # 성공 상태면 그 시간 표시
-                timestamp = datetime.fromisoformat(log['timestamp'])
-                # UTC -> KST 변환 (timezone aware한 경우만)
-                if timestamp.tzinfo is not None:
-                    kst = timezone(timedelta(hours=9))
-                    timestamp = timestamp.astimezone(kst)
-                time_str = timestamp.strftime('%Y-%m-%d %H:%M')
+        links = [f"[URL]({rss_url})"] + [
+            f"[{FORMAT_LABELS[name]}]({base_url}/{format_path(output_file, name)})"
+            for name in feed_config.get('formats', []) if name in FORMAT_LABELS
+        ]
+
+        status_entry = feed_status.get(feed_id)
+        if status_entry and status_entry['last_status']:
+            if status_entry['last_status'] == 'success':
+                status = "✅"
+            elif status_entry['last_status'] == 'skipped':
+                # 건너뛴 피드는 마지막으로 성공한 RSS를 그대로 제공
+                status = "⏸️ (건너뜀)"
+                if status_entry['consecutive_failures']:
+                    status = f"⏸️ ({status_entry['consecutive_failures']}회 연속 실패 후 건너뜀)"
             else:
-                # 실패 상태면 마지막 성공한 로그 찾기
-                last_success = next(
-                    (l for l in reversed(logs) if l['feed'] == feed_id and l['status'] == 'success'),
-                    None
-                )
-                if last_success:
-                    timestamp = datetime.fromisoformat(last_success['timestamp'])
-                    # UTC -> KST 변환 (timezone aware한 경우만)
-                    if timestamp.tzinfo is not None:
-                        kst = timezone(timedelta(hours=9))
-                        timestamp = timestamp.astimezone(kst)
-                    time_str = timestamp.strftime('%Y-%m-%d %H:%M')
-                else:
-                    time_str = "-"  # 한 번도 성공한 적 없음
+                status = f"❌ ({status_entry['consecutive_failures']}회 연속 실패)"
+
+            # 마지막 성공 시간 표시 (한 번도 성공한 적 없으면 -)
+            time_str = _format_kst(status_entry['last_success']) if status_entry['last_success'] else "-"
         else:
             status = "⚪"
             time_str = "-"
 
         table_lines.append(
-            f"| {feed_name} | [URL]({rss_url}) | {status} | {time_str} |"
+            f"| {feed_name} | {' · '.join(links)} | {status} | {time_str} |"
         )
 
     table_lines.append("")
@@ -0,0 +1,199 @@
+"""크롤러 네트워크 트래픽 녹화/재생"""
+import base64
+import json
+import os
+import shutil
+import threading
+from datetime import datetime, timezone
+
+import httpx
+
+from utils.atomic_file import atomic_write
+from utils.config import DEFAULT_RECORDING_DIR
+
+# 재생 결과(docs/, state/)를 쓰는 녹화 디렉토리 아래 작업 디렉토리
+REPLAY_WORKDIR = 'replay'
+
+# 녹화/재생 시 빼는 요청 헤더 (녹화할 때 조건부 요청이면 304만 남아 재생할 본문이 없어지고,
+# 재생할 때 HTTP 캐시의 검증자를 보내면 304가 되어 파싱~쓰기 단계를 건너뜀)
+CONDITIONAL_HEADERS = ('If-None-Match', 'If-Modified-Since')
+
+# 저장한 본문은 이미 디코딩된 값이므로 인코딩/길이 헤더는 버림
+DROPPED_RESPONSE_HEADERS = {'content-encoding', 'transfer-encoding', 'content-length', 'connection'}
+
+
+class TrafficRecorder:
+    """
+    크롤러의 HTTP 교환을 디렉토리에 녹화하거나, 녹화한 내용을 네트워크 없이 재생
+
+    - httpx 요청(유튜브 피드 등): recordings/http.json에 (메서드, URL)별 마지막 응답 저장
+    - Playwright 페이지(Velog 등): 피드별 HAR 파일 recordings/<feed_id>.har
+
+    재생 모드에서 녹화되지 않은 요청은 네트워크로 나가지 않고 실패합니다.
+    재생은 조건부 요청 헤더를 떼고 항상 녹화된 본문을 돌려주므로, 필터나 출력 형식을 바꾸고
+    다시 재생하면 매번 파싱부터 다시 탑니다.
+    """
+
+    def __init__(self, mode, directory=DEFAULT_RECORDING_DIR):
+        """
+        Args:
+            mode: 'record' 또는 'replay'
+            directory: 녹화 파일 디렉토리
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError(f"지원하지 않는 모드입니다: {mode}")
+        self.mode = mode
+        self.directory = directory
+        self.http_file = os.path.join(directory, 'http.json')
+        self._lock = threading.Lock()
+        self.exchanges = {}
+        self.hits = 0
+        self.misses = 0
+
+        if mode == 'replay':
+            if not os.path.isdir(directory):
+                raise FileNotFoundError(f"녹화 디렉토리가 없습니다: {directory}")
+            if os.path.exists(self.http_file):
+                with open(self.http_file, 'r', encoding='utf-8') as f:
+                    self.exchanges = json.load(f)
+
+    @property
+    def recording(self):
+        return self.mode == 'record'
+
+    @staticmethod
+    def _key(method, url):
+        return f'{method} {url}'
+
+    def transport(self, inner):
+        """
+        httpx 클라이언트에 넣을 transport
+
+        Args:
+            inner: 녹화 모드에서 실제로 요청을 보낼 transport
+
+        Returns:
+            httpx.BaseTransport
+        """
+        return _RecordingTransport(self, inner)
+
+    def har_path(self, name):
+        """피드 하나의 HAR 파일 경로"""
+        return os.path.join(self.directory, f'{name}.har')
+
+    async def attach(self, context, name):
+        """
+        Playwright context에 HAR 녹화/재생 연결
+
+        Args:
+            context: BrowserContext (async API)
+            name: HAR 파일 이름 (보통 피드 ID)
+        """
+        path = self.har_path(name)
+        if self.recording:
+            os.makedirs(self.directory, exist_ok=True)
+            # context를 닫을 때 HAR 파일이 저장됨
+            await context.route_from_har(path, update=True, update_content='embed', update_mode='full')
+        else:
+            if not os.path.exists(path):
+                raise FileNotFoundError(f"HAR 녹화가 없습니다: {path}")
+            await context.route_from_har(path, not_found='abort')
+
+    def record(self, request, response):
+        """httpx 교환 하나 저장"""
+        headers = [
+            [name, value] for name, value in response.headers.multi_items()
+            if name.lower() not in DROPPED_RESPONSE_HEADERS
+        ]
+        with self._lock:
+            self.exchanges[self._key(request.method, str(request.url))] = {
+                'status': response.status_code,
+                'headers': headers,
+                'body': base64.b64encode(response.content).decode('ascii'),
+                'recorded_at': datetime.now(timezone.utc).isoformat()
+            }
+
+    def replay(self, request):
+        """
+        녹화된 응답으로 httpx.Response 생성
+
+        Raises:
+            httpx.ConnectError: 녹화되지 않은 요청
+        """
+        exchange = self.exchanges.get(self._key(request.method, str(request.url)))
+        with self._lock:
+            if exchange is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        if exchange is None:
+            raise httpx.ConnectError(f"녹화되지 않은 요청입니다: {request.method} {request.url}", request=request)
+
+        return httpx.Response(
+            exchange['status'],
+            headers=exchange['headers'],
+            content=base64.b64decode(exchange['body']),
+            request=request
+        )
+
+    def save(self):
+        """녹화 모드에서 httpx 교환을 파일로 저장 (기존 녹화와 병합)"""
+        if not self.recording:
+            return
+        with self._lock:
+            exchanges = {}
+            if os.path.exists(self.http_file):
+                with open(self.http_file, 'r', encoding='utf-8') as f:
+                    exchanges = json.load(f)
+            exchanges.update(self.exchanges)
+            atomic_write(self.http_file, json.dumps(exchanges, ensure_ascii=False, indent=2))
+
+    def summary(self):
+        """녹화/재생 결과 한 줄 요약"""
+        if self.recording:
+            return f"🎙️  녹화 완료: HTTP 교환 {len(self.exchanges)}개 → {self.directory}/"
+        return f"▶️  재생: HTTP 교환 {self.hits}개 재생, 녹화 없음 {self.misses}개 ({self.directory}/)"
+
+
+def enter_replay_workdir(directory):
+    """
+    재생 결과를 쓸 작업 디렉토리를 비우고 그곳으로 이동
+
+    크롤러는 출력과 상태(항목 저장소, HTTP 캐시, 서킷 브레이커, 로그)를 작업 디렉토리 기준
+    docs/, state/에 쓰므로, 재생이 실제 피드와 상태를 바꾸지 않도록 <directory>/replay/에서
+    실행합니다. 매번 비우고 시작하므로 같은 녹화는 항상 같은 결과를 냅니다.
+
+    Args:
+        directory: 녹화 디렉토리 (이동하기 전에 절대 경로로 바꿔 둘 것)
+
+    Returns:
+        str: 작업 디렉토리 경로
+    """
+    workdir = os.path.join(os.path.abspath(directory), REPLAY_WORKDIR)
+    shutil.rmtree(workdir, ignore_errors=True)
+    os.makedirs(workdir)
+    os.chdir(workdir)
+    return workdir
+
+
+class _RecordingTransport(httpx.BaseTransport):
+    """녹화 모드에서는 실제 요청 후 저장, 재생 모드에서는 저장된 응답 반환"""
+
+    def __init__(self, recorder, inner):
+        self.recorder = recorder
+        self.inner = inner
+
+    def handle_request(self, request):
+        for name in CONDITIONAL_HEADERS:
+            if name in request.headers:
+                del request.headers[name]
+        if not self.recorder.recording:
+            return self.recorder.replay(request)
+
+        response = self.inner.handle_request(request)
+        response.read()
+        self.recorder.record(request, response)
+        return response
+
+    def close(self):
+        self.inner.close()
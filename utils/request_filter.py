@@ -0,0 +1,109 @@
+"""Playwright 요청 가로채기 및 페이지 로딩 통계"""
+from urllib.parse import urlsplit
+
+# 렌더링된 DOM에서 텍스트만 읽는 크롤러에는 필요 없는 리소스 타입
+DEFAULT_BLOCKED_RESOURCE_TYPES = ['image', 'media', 'font']
+
+# 알려진 서드파티 트래커/광고 도메인 (하위 도메인 포함)
+KNOWN_TRACKER_HOSTS = [
+    'google-analytics.com',
+    'analytics.google.com',
+    'googletagmanager.com',
+    'doubleclick.net',
+    'googlesyndication.com',
+    'googleadservices.com',
+    'adservice.google.com',
+    'facebook.net',
+    'connect.facebook.com',
+    'hotjar.com',
+    'clarity.ms',
+    'amplitude.com',
+    'mixpanel.com',
+    'segment.io',
+    'segment.com',
+    'scorecardresearch.com',
+]
+
+
+class RequestFilter:
+    """
+    page의 요청을 가로채 불필요한 리소스를 차단하고 로딩 통계를 수집
+
+    차단 목록을 모두 비워 두면 아무것도 막지 않고 통계만 모으므로
+    필터를 켠 경우와 끈 경우의 바이트/요청 수를 같은 방식으로 비교할 수 있습니다.
+    """
+
+    def __init__(self, block_resource_types=None, block_hosts=None):
+        """
+        Args:
+            block_resource_types: 차단할 Playwright resource_type 리스트 (예: ['image', 'font'])
+            block_hosts: 차단할 호스트 리스트 (하위 도메인 포함)
+        """
+        self.block_resource_types = set(block_resource_types or [])
+        self.block_hosts = tuple(host.lower() for host in (block_hosts or []))
+        self.requests = 0
+        self.blocked = 0
+        self.blocked_by_type = {}
+        self.bytes_received = 0
+
+    @classmethod
+    def from_config(cls, page_load_config):
+        """
+        피드 설정의 page_load 항목으로 필터 생성
+
+        Args:
+            page_load_config: {block_resource_types, block_trackers, block_hosts} 딕셔너리
+
+        Returns:
+            RequestFilter
+        """
+        block_hosts = list(page_load_config.get('block_hosts', []))
+        if page_load_config.get('block_trackers', True):
+            block_hosts += KNOWN_TRACKER_HOSTS
+        return cls(
+            block_resource_types=page_load_config.get('block_resource_types', DEFAULT_BLOCKED_RESOURCE_TYPES),
+            block_hosts=block_hosts
+        )
+
+    def should_block(self, resource_type, url):
+        """요청 차단 여부 판단"""
+        if resource_type in self.block_resource_types:
+            return True
+        host = (urlsplit(url).hostname or '').lower()
+        return any(host == blocked or host.endswith('.' + blocked) for blocked in self.block_hosts)
+
+    async def install(self, page):
+        """page에 라우팅 핸들러와 응답 크기 수집기 등록"""
+        page.on('request', self._on_request)
+        page.on('requestfinished', self._on_request_finished)
+        if self.block_resource_types or self.block_hosts:
+            await page.route('**/*', self._handle_route)
+
+    async def _handle_route(self, route):
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked += 1
+            self.blocked_by_type[request.resource_type] = self.blocked_by_type.get(request.resource_type, 0) + 1
+            await route.abort()
+        else:
+            # 다른 라우팅(예: HAR 재생)이 있으면 그쪽으로 넘기고, 없으면 네트워크로 진행
+            await route.fallback()
+
+    def _on_request(self, request):
+        self.requests += 1
+
+    async def _on_request_finished(self, request):
+        try:
+            sizes = await request.sizes()
+        except Exception:
+            return
+        self.bytes_received += sizes.get('responseHeadersSize', 0) + sizes.get('responseBodySize', 0)
+
+    def stats(self):
+        """수집한 통계 딕셔너리 반환"""
+        return {
+            'requests': self.requests,
+            'blocked': self.blocked,
+            'blocked_by_type': dict(self.blocked_by_type),
+            'bytes_received': self.bytes_received
+        }
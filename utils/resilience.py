@@ -0,0 +1,336 @@
+"""재시도, 서킷 브레이커, 실행 마감 시간"""
+import json
+import random
+import sys
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+
+from utils.atomic_file import atomic_write
+from utils.file_lock import file_lock
+from utils.metrics import count, current_feed
+
+# 다시 시도할 만한 HTTP 상태 코드
+TRANSIENT_STATUS_CODES = {408, 425, 429, 500, 502, 503, 504}
+
+# 서킷 브레이커 기본값 (하루 한 번 실행 기준: 세 번 연속 실패하면 다음 실행 한 번은 건너뜀)
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_COOLDOWN_HOURS = 36
+DEFAULT_MAX_COOLDOWN_HOURS = 168
+
+
+def is_transient(error):
+    """
+    다시 시도하면 성공할 수 있는 오류인지 (네트워크 오류, 시간 초과, 429/5xx)
+
+    httpx와 Playwright는 이미 import된 경우에만 확인하므로 이 모듈은 가볍게 유지됩니다.
+
+    Args:
+        error: 예외
+
+    Returns:
+        bool
+    """
+    httpx = sys.modules.get('httpx')
+    if httpx is not None:
+        if isinstance(error, httpx.HTTPStatusError):
+            return error.response.status_code in TRANSIENT_STATUS_CODES
+        if isinstance(error, (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError)):
+            return True
+
+    module = type(error).__module__ or ''
+    if module.startswith('playwright'):
+        return type(error).__name__ == 'TimeoutError' or 'net::ERR_' in str(error)
+
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+class RetryPolicy:
+    """지수 백오프(지터 포함) 재시도 규칙"""
+
+    def __init__(self, attempts=3, base_delay=1.0, max_delay=30.0):
+        """
+        Args:
+            attempts: 첫 시도를 포함한 최대 시도 횟수
+            base_delay: 첫 재시도 전 대기 시간 기준(초), 재시도마다 두 배
+            max_delay: 대기 시간 상한(초)
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    @classmethod
+    def from_config(cls, retry_config):
+        """
+        설정으로 생성
+
+        Args:
+            retry_config: config.json의 resilience.retry 항목 (attempts, base_delay, max_delay)
+
+        Returns:
+            RetryPolicy
+        """
+        retry_config = retry_config or {}
+        return cls(
+            attempts=retry_config.get('attempts', 3),
+            base_delay=retry_config.get('base_delay', 1.0),
+            max_delay=retry_config.get('max_delay', 30.0)
+        )
+
+    def delay(self, attempt):
+        """
+        attempt번째 실패 뒤 대기 시간 (절반은 고정, 절반은 무작위)
+
+        Args:
+            attempt: 실패한 시도 번호 (1부터)
+
+        Returns:
+            float: 초
+        """
+        cap = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return cap / 2 + random.uniform(0, cap / 2)
+
+
+class RetryLog:
+    """피드별 재시도 기록 (크롤링 로그 항목에 함께 남김)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._retries = {}
+
+    def record(self, feed, retry):
+        with self._lock:
+            self._retries.setdefault(feed, []).append(retry)
+
+    def pop(self, feed):
+        """
+        피드의 재시도 기록을 꺼내고 비우기
+
+        Returns:
+            list: [{operation, attempt, error, delay}] (없으면 빈 리스트)
+        """
+        with self._lock:
+            return self._retries.pop(feed, [])
+
+
+class RunDeadline:
+    """실행 전체의 마감 시각 (설정하지 않으면 제한 없음)"""
+
+    def __init__(self):
+        self._expires = None
+
+    def start(self, seconds):
+        """
+        지금부터 seconds초 뒤를 마감으로 설정
+
+        Args:
+            seconds: 실행 예산(초), None이나 0이면 제한 없음
+        """
+        self._expires = time.monotonic() + seconds if seconds else None
+
+    def remaining(self):
+        """남은 시간(초), 제한이 없으면 None"""
+        if self._expires is None:
+            return None
+        return max(0.0, self._expires - time.monotonic())
+
+    def expired(self):
+        return self._expires is not None and time.monotonic() >= self._expires
+
+    def clip(self, seconds):
+        """
+        작업 제한 시간을 남은 시간 안으로 줄이기
+
+        Args:
+            seconds: 원래 제한 시간(초)
+
+        Returns:
+            float: 남은 시간을 넘지 않는 제한 시간 (0이 되지 않도록 최소 1ms)
+        """
+        remaining = self.remaining()
+        if remaining is None:
+            return seconds
+        return max(0.001, min(seconds, remaining))
+
+
+# 프로세스 전체에서 공유하는 재시도 기록과 실행 마감 시각
+RETRY_LOG = RetryLog()
+RUN_DEADLINE = RunDeadline()
+
+
+def retry_call(fn, policy=None, operation='', deadline=RUN_DEADLINE):
+    """
+    일시적인 오류가 나면 백오프하며 fn()을 다시 실행
+
+    재시도는 현재 피드의 retries 카운터와 RETRY_LOG에 기록하고,
+    대기하면 실행 마감을 넘기는 경우에는 기다리지 않고 바로 실패합니다.
+
+    Args:
+        fn: 인자 없는 함수
+        policy: RetryPolicy (없으면 기본값)
+        operation: 로그에 남길 작업 이름 (예: 'fetch', 'api')
+        deadline: 실행 마감 (RunDeadline)
+
+    Returns:
+        fn()의 반환값
+
+    Raises:
+        Exception: 일시적이지 않은 오류이거나 재시도를 모두 쓴 경우 마지막 오류
+    """
+    policy = policy or RetryPolicy()
+    attempt = 1
+    while True:
+        try:
+            return fn()
+        except Exception as e:
+            if attempt >= policy.attempts or not is_transient(e):
+                raise
+            delay = policy.delay(attempt)
+            remaining = deadline.remaining()
+            if remaining is not None and remaining <= delay:
+                raise
+
+            RETRY_LOG.record(current_feed(), {
+                'operation': operation,
+                'attempt': attempt,
+                'error': str(e)[:200],
+                'delay': round(delay, 2)
+            })
+            count('retries')
+            print(f"🔁 {operation or '요청'} 재시도 {attempt}/{policy.attempts - 1} ({delay:.1f}초 후): {e}")
+            time.sleep(delay)
+            attempt += 1
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+class CircuitBreakers:
+    """
+    소스(피드, 또는 피드 안의 가져오기 방식)별 서킷 브레이커
+
+    연속 실패가 failure_threshold번이 되면 열려서 cooldown 동안 그 소스를 건너뜁니다.
+    cooldown이 지나면 한 번 시도해 보고(half_open), 성공하면 닫히고 실패하면
+    cooldown을 두 배로 늘려(max_cooldown까지) 다시 열립니다.
+    상태는 state/circuit_breakers.json에 저장해 실행이 바뀌어도 유지됩니다.
+    """
+
+    def __init__(self, path='state/circuit_breakers.json', failure_threshold=DEFAULT_FAILURE_THRESHOLD,
+                 cooldown_hours=DEFAULT_COOLDOWN_HOURS, max_cooldown_hours=DEFAULT_MAX_COOLDOWN_HOURS):
+        """
+        Args:
+            path: 상태 파일 경로
+            failure_threshold: 열리는 연속 실패 횟수
+            cooldown_hours: 처음 열렸을 때 건너뛰는 시간
+            max_cooldown_hours: 건너뛰는 시간 상한
+        """
+        self.path = path
+        self.lock_file = path + '.lock'
+        self.failure_threshold = max(1, failure_threshold)
+        self.cooldown = timedelta(hours=cooldown_hours)
+        self.max_cooldown = timedelta(hours=max_cooldown_hours)
+
+    @classmethod
+    def from_config(cls, breaker_config, path='state/circuit_breakers.json'):
+        """
+        설정으로 생성
+
+        Args:
+            breaker_config: config.json의 resilience.breaker 항목
+                (failure_threshold, cooldown_hours, max_cooldown_hours)
+            path: 상태 파일 경로
+
+        Returns:
+            CircuitBreakers
+        """
+        breaker_config = breaker_config or {}
+        return cls(
+            path,
+            failure_threshold=breaker_config.get('failure_threshold', DEFAULT_FAILURE_THRESHOLD),
+            cooldown_hours=breaker_config.get('cooldown_hours', DEFAULT_COOLDOWN_HOURS),
+            max_cooldown_hours=breaker_config.get('max_cooldown_hours', DEFAULT_MAX_COOLDOWN_HOURS)
+        )
+
+    def _load(self):
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _describe(self, record, now):
+        """저장된 기록으로 현재 상태 계산"""
+        failures = record.get('consecutive_failures', 0)
+        state = {'state': 'closed', 'consecutive_failures': failures}
+        if failures < self.failure_threshold:
+            return state
+
+        cooldown = min(self.max_cooldown, self.cooldown * 2 ** (failures - self.failure_threshold))
+        retry_after = _parse_time(record['last_failure']) + cooldown
+        state['state'] = 'open' if now < retry_after else 'half_open'
+        state['retry_after'] = retry_after.isoformat()
+        state['last_error'] = record.get('last_error')
+        return state
+
+    def state(self, name, now=None):
+        """
+        소스 하나의 현재 상태
+
+        Args:
+            name: 소스 이름 (예: 'naver_conference', 'velog_trending:api')
+            now: 기준 시각 (기본값: 현재)
+
+        Returns:
+            dict: {state: 'closed'|'open'|'half_open', consecutive_failures, retry_after, last_error}
+        """
+        return self._describe(self._load().get(name, {}), now or datetime.now(timezone.utc))
+
+    def allow(self, name):
+        """이번에 시도해도 되는지 (열려 있으면 False)"""
+        return self.state(name)['state'] != 'open'
+
+    def _update(self, name, change):
+        with file_lock(self.lock_file):
+            records = self._load()
+            record = records.get(name, {})
+            now = datetime.now(timezone.utc)
+            before = self._describe(record, now)['state']
+            change(record, now)
+            if record:
+                records[name] = record
+            else:
+                records.pop(name, None)
+            atomic_write(self.path, json.dumps(records, ensure_ascii=False, indent=2))
+        after = self._describe(record, now)
+        after['previous_state'] = before
+        return after
+
+    def record_success(self, name):
+        """
+        성공 기록 (연속 실패 초기화)
+
+        Returns:
+            dict: 바뀐 상태 (previous_state 포함)
+        """
+        def change(record, now):
+            record.clear()
+        return self._update(name, change)
+
+    def record_failure(self, name, error=None):
+        """
+        실패 기록
+
+        Args:
+            name: 소스 이름
+            error: 오류 메시지
+
+        Returns:
+            dict: 바뀐 상태 (previous_state 포함)
+        """
+        def change(record, now):
+            record['consecutive_failures'] = record.get('consecutive_failures', 0) + 1
+            record['last_failure'] = now.isoformat()
+            if error is not None:
+                record['last_error'] = str(error)[:200]
+        return self._update(name, change)
@@ -1,17 +1,151 @@
-"""RSS 피드 생성 유틸리티"""
-from datetime import datetime
-from feedgen.feed import FeedGenerator
+"""피드 생성 유틸리티 (RSS 2.0, Atom, JSON Feed)"""
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+from contextlib import ExitStack
+from datetime import datetime, timezone
 
+from utils.atomic_file import atomic_open, atomic_write
+from utils.feed_artifacts import SUFFIXES, artifacts_missing, publish_artifacts
+from utils.feed_formats import DEFAULT_FORMATS, format_path, get_format
+from utils.metrics import count, stage
+from utils.pipeline import FeedItem, Pipeline, normalize
 
-def create_rss_feed(feed_info, posts, output_path):
+# 피드별 마지막 출력의 내용 해시, lastBuildDate, 출력 형식 기록
+OUTPUT_STATE_FILE = 'state/feed_outputs.json'
+
+# 여러 크롤러가 동시에 저장할 때 서로의 항목을 덮어쓰지 않도록 직렬화
+_state_lock = threading.Lock()
+
+
+def _load_output_state():
+    """피드 출력 상태 불러오기"""
+    if os.path.exists(OUTPUT_STATE_FILE):
+        try:
+            with open(OUTPUT_STATE_FILE, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    return {}
+
+
+def _save_output_state(output_path, entry):
+    """피드 하나의 출력 상태를 기존 파일에 병합해서 저장"""
+    with _state_lock:
+        state = _load_output_state()
+        state[output_path] = entry
+        atomic_write(OUTPUT_STATE_FILE, json.dumps(state, ensure_ascii=False, indent=2))
+
+
+def _sort_key(post):
+    """최신 글이 먼저, 같은 시각이면 링크 순"""
+    date = post.date
+    return (-date.timestamp() if date else 0, post.link)
+
+
+def _hash_item(post):
+    """내용 해시에 들어가는 게시글 필드"""
+    date = post.date
+    return [
+        post.link,
+        post.title,
+        post.summary,
+        post.author,
+        date.isoformat() if date else None
+    ]
+
+
+class ContentHasher:
     """
-    RSS 피드 생성
-    
+    게시글을 하나씩 받아 내용 해시를 점진적으로 계산
+
+    content_hash()와 같은 JSON 직렬화를 조각 단위로 해시에 넣으므로
+    게시글 전체를 리스트로 모으지 않아도 같은 값이 나옵니다.
+    """
+
+    def __init__(self, feed_info):
+        """
+        Args:
+            feed_info: 피드 정보 딕셔너리
+        """
+        self._sha = hashlib.sha256()
+        self._first = True
+        self._update('{"feed": ' + self._dumps(feed_info) + ', "items": [')
+
+    @staticmethod
+    def _dumps(value):
+        return json.dumps(value, sort_keys=True, ensure_ascii=False, default=str)
+
+    def _update(self, text):
+        self._sha.update(text.encode('utf-8'))
+
+    def add(self, post):
+        """게시글(FeedItem) 하나 추가"""
+        self._update(('' if self._first else ', ') + self._dumps(_hash_item(post)))
+        self._first = False
+
+    def hexdigest(self):
+        """
+        Returns:
+            str: sha256 hex 문자열
+        """
+        sha = self._sha.copy()
+        sha.update(b']}')
+        return sha.hexdigest()
+
+
+def content_hash(feed_info, posts):
+    """
+    채널 정보와 게시글 목록의 내용 해시
+
+    lastBuildDate처럼 실행할 때마다 바뀌는 값은 포함하지 않으므로
+    같은 내용이면 항상 같은 해시가 나옵니다.
+
     Args:
-        feed_info: 피드 정보 딕셔너리 (title, link, description 등)
-        posts: 게시글 리스트 (각각 title, link, summary, author, date 포함)
-        output_path: 저장 경로
+        feed_info: 피드 정보 딕셔너리
+        posts: 게시글 리스트 (FeedItem 또는 딕셔너리)
+
+    Returns:
+        str: sha256 hex 문자열
     """
+    hasher = ContentHasher(feed_info)
+    for post in posts:
+        hasher.add(FeedItem.from_mapping(post))
+    return hasher.hexdigest()
+
+
+def _is_unchanged(output_path, digest, formats=DEFAULT_FORMATS):
+    """이전 출력과 내용 해시, 출력 형식이 같고 파일도 모두 남아 있는지"""
+    previous = _load_output_state().get(output_path, {})
+    if (previous.get('content_hash') == digest
+            and previous.get('formats', list(DEFAULT_FORMATS)) == list(formats)
+            and all(os.path.exists(format_path(output_path, name)) for name in formats)):
+        print(f"♻️  내용 변경 없음 - 기존 파일 유지: {output_path}")
+        return True
+    return False
+
+
+def _remove_dropped_formats(output_path, formats):
+    """설정에서 빠진 형식의 이전 출력(과 압축본)을 지워 오래된 파일이 남지 않게 함"""
+    previous = _load_output_state().get(output_path, {})
+    for name in previous.get('formats', []):
+        if name in formats:
+            continue
+        path = format_path(output_path, name)
+        for target in [path] + [path + suffix for suffix in SUFFIXES.values()]:
+            if os.path.exists(target):
+                os.remove(target)
+
+
+def _write_feedgen(feed_info, posts, output_path, build_date):
+    """feedgen으로 전체 문서를 만든 뒤 저장 (기준 구현)"""
+    # feedgen(lxml)은 writer='feedgen'일 때만 필요
+    from feedgen.feed import FeedGenerator
+
     fg = FeedGenerator()
     fg.id(feed_info['link'])
     fg.title(feed_info['title'])
@@ -19,22 +153,180 @@ def create_rss_feed(feed_info, posts, output_path):
     fg.link(href=feed_info['link'], rel='alternate')
     fg.description(feed_info['description'])
     fg.language('ko')
+    fg.lastBuildDate(build_date)
     
     # posts를 역순으로 추가하여 RSS에서 원래 순서 유지
     for post in reversed(posts):
         fe = fg.add_entry()
-        fe.id(post['link'])
-        fe.title(post['title'])
-        fe.link(href=post['link'])
-        fe.description(post.get('summary', ''))
+        fe.id(post.link)
+        fe.title(post.title)
+        fe.link(href=post.link)
+        fe.description(post.summary)
 
-        if 'author' in post:
-            fe.author({'name': post['author']})
+        if post.author is not None:
+            fe.author({'name': post.author})
 
-        # 날짜가 있으면 사용, 없으면 현재 시간
-        pub_date = post.get('date', datetime.now())
+        # 날짜가 있으면 사용, 없으면 빌드 시간
+        pub_date = post.date or build_date
         fe.published(pub_date)
     
-    # RSS 파일 저장
-    fg.rss_file(output_path, pretty=True)
+    # RSS 파일 저장 (임시 파일에 쓴 뒤 교체)
+    atomic_write(output_path, fg.rss_str(pretty=True))
+
+
+def _create_stream(feed_info, posts, output_path, formats, timings):
+    """
+    게시글을 한 번만 돌면서 해시하고 형식별 item을 각각 임시 파일에 쌓은 뒤,
+    내용이 바뀌었을 때만 형식마다 헤더/본문/푸터를 이어 붙여 원자적으로 저장
+
+    Args:
+        timings: 형식별 소요 시간(초)을 더할 딕셔너리
+    """
+    build_date = datetime.now(timezone.utc).replace(microsecond=0)
+    hasher = ContentHasher(feed_info)
+    renderers = [(name, get_format(name)) for name in formats]
+    with ExitStack() as stack:
+        bodies = {name: stack.enter_context(tempfile.TemporaryFile('w+', encoding='utf-8')) for name in formats}
+        rendered = 0
+        for post in posts:
+            hasher.add(post)
+            for name, fmt in renderers:
+                started = time.perf_counter()
+                body = bodies[name]
+                if rendered and fmt['separator']:
+                    body.write(fmt['separator'])
+                body.write(fmt['item'](post, build_date))
+                timings[name] += time.perf_counter() - started
+            rendered += 1
+        count('items_rendered', rendered)
+
+        digest = hasher.hexdigest()
+        if _is_unchanged(output_path, digest, formats):
+            return None
+
+        for name, fmt in renderers:
+            started = time.perf_counter()
+            body = bodies[name]
+            body.seek(0)
+            with atomic_open(format_path(output_path, name), 'w', encoding='utf-8') as f:
+                f.write(fmt['header'](feed_info, build_date))
+                shutil.copyfileobj(body, f)
+                f.write(fmt['footer'])
+            timings[name] += time.perf_counter() - started
+    return digest, build_date
+
+
+def create_rss_feed(feed_info, posts, output_path, writer='stream', presorted=False):
+    """
+    RSS 피드 생성
+
+    게시글은 날짜 내림차순(같으면 링크 순)으로 정렬해서 순위만 바뀐 경우에는
+    출력이 달라지지 않게 합니다. 내용이 이전 출력과 같으면 파일을 다시 쓰지 않고,
+    바뀌었을 때만 새 lastBuildDate로 임시 파일에 쓴 뒤 rename으로 교체하고,
+    옆에 미리 압축한 .gz(.br)를 만들어 docs/manifest.json에 해시와 크기를 기록합니다.
+
+    writer='stream'은 item을 하나씩 문자열로 만들어 바로 파일에 쓰므로
+    presorted=True와 함께 쓰면 이터레이터를 넘겨도 게시글 수와 상관없이
+    메모리 사용량이 일정합니다. writer='feedgen'은 전체 문서를 메모리에
+    만드는 기준 구현이며 두 방식의 출력은 같습니다.
+    
+    Args:
+        feed_info: 피드 정보 딕셔너리 (title, link, description 등)
+        posts: 게시글 리스트 또는 이터레이터 (FeedItem 또는 title, link, summary, author, date 딕셔너리)
+        output_path: 저장 경로
+        writer: 'stream'(기본값) 또는 'feedgen'
+        presorted: posts가 이미 정렬 순서대로인지 (True면 다시 정렬하지 않음)
+
+    Returns:
+        str: 저장 경로
+    """
+    create_feeds(feed_info, posts, output_path, DEFAULT_FORMATS, writer, presorted)
     return output_path
+
+
+def create_feeds(feed_info, posts, output_path, formats=None, writer='stream', presorted=False):
+    """
+    게시글을 한 번만 돌면서 설정한 형식(rss, atom, json)의 피드를 모두 생성
+
+    파이프라인의 마지막(sink) 단계로, posts가 Pipeline이면 여기서 항목이 처음 흘러갑니다.
+    RSS는 output_path에, 나머지는 같은 이름의 .atom.xml / .feed.json에 씁니다.
+    변경 감지, 원자적 교체, 압축본 생성은 create_rss_feed와 같고 형식 전체를 함께 판단합니다
+    (내용 해시가 같아도 형식 구성이 바뀌었거나 파일이 하나라도 없으면 모두 다시 씀).
+
+    Args:
+        feed_info: 피드 정보 딕셔너리
+        posts: 게시글 이터러블 (FeedItem, 딕셔너리 또는 Pipeline)
+        output_path: RSS 출력 경로 (예: 'docs/velog-trending.xml')
+        formats: 출력 형식 목록 (config.json 피드 설정의 formats, 기본값: ['rss'])
+        writer: 'stream'(기본값) 또는 'feedgen' (feedgen은 rss만 지원)
+        presorted: posts가 이미 정렬 순서대로인지
+
+    Returns:
+        dict: 형식별 {path, written, seconds, bytes} (크롤링 로그 details에 그대로 남김)
+    """
+    formats = list(dict.fromkeys(formats or DEFAULT_FORMATS))
+    for name in formats:
+        get_format(name)
+    timings = {name: 0.0 for name in formats}
+
+    with stage('write'):
+        written = _create_feeds(feed_info, posts, output_path, formats, writer, presorted, timings)
+
+    results = {}
+    for name in formats:
+        path = format_path(output_path, name)
+        # 압축본이 생기기 전에 만든 출력이면 내용이 같아도 한 번 만들어 둠
+        if written or artifacts_missing(path):
+            with stage('compress'):
+                publish_artifacts(path)
+        results[name] = {
+            'path': path,
+            'written': written,
+            'seconds': round(timings[name], 4),
+            'bytes': os.path.getsize(path)
+        }
+    return results
+
+
+def _create_feeds(feed_info, posts, output_path, formats, writer, presorted, timings):
+    """
+    create_feeds 본체 (계측 블록 안에서 실행)
+
+    Returns:
+        bool: 파일을 새로 썼는지 (내용이 같아 건너뛰었으면 False)
+    """
+    # 딕셔너리로 넘어온 항목도 FeedItem으로 맞춘 뒤, 정렬이 필요하면 여기서 한 번만 모음
+    posts = Pipeline(posts, normalize)
+    if not presorted:
+        posts = sorted(posts, key=_sort_key)
+
+    if writer == 'stream':
+        result = _create_stream(feed_info, posts, output_path, formats, timings)
+        if result is None:
+            return False
+        digest, build_date = result
+    elif writer == 'feedgen':
+        if formats != ['rss']:
+            raise ValueError("feedgen writer는 rss 형식만 지원합니다")
+        if feed_info.get('links') or feed_info.get('archive'):
+            raise ValueError("feedgen writer는 atom:link/아카이브 표시를 지원하지 않습니다")
+        posts = list(posts)
+        count('items_rendered', len(posts))
+        digest = content_hash(feed_info, posts)
+        if _is_unchanged(output_path, digest):
+            return False
+        build_date = datetime.now(timezone.utc).replace(microsecond=0)
+        started = time.perf_counter()
+        _write_feedgen(feed_info, posts, output_path, build_date)
+        timings['rss'] += time.perf_counter() - started
+    else:
+        raise ValueError(f"지원하지 않는 writer입니다: {writer}")
+
+    _remove_dropped_formats(output_path, formats)
+    _save_output_state(output_path, {
+        'content_hash': digest,
+        'last_build_date': build_date.isoformat(),
+        'formats': formats
+    })
+    count('bytes_written', sum(os.path.getsize(format_path(output_path, name)) for name in formats))
+    return True
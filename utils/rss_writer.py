@@ -0,0 +1,100 @@
+"""스트리밍 RSS 2.0 조각 렌더러 (헤더/항목, utils.feed_formats에서 사용)"""
+import re
+from xml.sax.saxutils import escape
+
+# XML 1.0에서 허용하지 않는 제어 문자
+_INVALID_XML_CHARS = re.compile('[\\x00-\\x08\\x0b\\x0c\\x0e-\\x1f\\ufffe\\uffff]')
+
+_DAYS = ('Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun')
+_MONTHS = ('Jan', 'Feb', 'Mar', 'Apr', 'May', 'Jun', 'Jul', 'Aug', 'Sep', 'Oct', 'Nov', 'Dec')
+
+# RFC 5005 Feed Paging and Archiving
+FEED_HISTORY_NS = 'http://purl.org/syndication/history/1.0'
+
+RSS_HEADER = """<?xml version='1.0' encoding='UTF-8'?>
+<rss xmlns:atom="http://www.w3.org/2005/Atom" xmlns:content="http://purl.org/rss/1.0/modules/content/" version="2.0">
+  <channel>
+"""
+
+RSS_FOOTER = """  </channel>
+</rss>
+"""
+
+
+def _text(value):
+    """XML 텍스트 노드용 이스케이프 (lxml 출력과 동일하게 \\r도 문자 참조로)"""
+    value = _INVALID_XML_CHARS.sub('', str(value))
+    return escape(value, {'\r': '&#13;'})
+
+
+def _attr(value):
+    """XML 속성 값용 이스케이프"""
+    return escape(_INVALID_XML_CHARS.sub('', str(value)), {'"': '&quot;', '\r': '&#13;', '\n': '&#10;', '\t': '&#9;'})
+
+
+def format_rfc2822(date):
+    """RSS 날짜 형식 (feedgen과 같은 형식, 로케일 영향 없음)"""
+    return (f"{_DAYS[date.weekday()]}, {date.day:02d} {_MONTHS[date.month - 1]} {date.year:04d} "
+            f"{date.strftime('%H:%M:%S %z')}")
+
+
+def render_header(feed_info, build_date):
+    """
+    channel 시작부터 마지막 item 직전까지의 XML
+
+    Args:
+        feed_info: 피드 정보 딕셔너리 (title, link, description, 그리고 선택적으로
+            links=[{href, rel}] → atom:link, archive=True → RFC 5005 fh:archive)
+        build_date: lastBuildDate로 쓸 datetime
+
+    Returns:
+        str: XML 문자열
+    """
+    lines = [
+        RSS_HEADER,
+        f"    <title>{_text(feed_info['title'])}</title>\n",
+        f"    <link>{_text(feed_info['link'])}</link>\n",
+        f"    <description>{_text(feed_info['description'])}</description>\n",
+    ]
+    for link in feed_info.get('links', []):
+        lines.append(f'    <atom:link href="{_attr(link["href"])}" rel="{_attr(link["rel"])}"/>\n')
+    if feed_info.get('archive'):
+        lines.append(f'    <fh:archive xmlns:fh="{FEED_HISTORY_NS}"/>\n')
+    lines += [
+        "    <docs>http://www.rssboard.org/rss-specification</docs>\n",
+        "    <generator>python-feedgen</generator>\n",
+        "    <language>ko</language>\n",
+        f"    <lastBuildDate>{format_rfc2822(build_date)}</lastBuildDate>\n",
+    ]
+    return ''.join(lines)
+
+
+def render_item(post, default_date=None):
+    """
+    게시글 하나의 item XML
+
+    Args:
+        post: FeedItem (title, link, summary, date)
+        default_date: date가 없을 때 쓸 pubDate
+
+    Returns:
+        str: XML 문자열
+    """
+    title = post.title
+    summary = post.summary
+    if not (title or summary):
+        raise ValueError('Required fields not set')
+
+    lines = ["    <item>\n"]
+    if title:
+        lines.append(f"      <title>{_text(title)}</title>\n")
+    lines.append(f"      <link>{_text(post.link)}</link>\n")
+    if summary:
+        lines.append(f"      <description>{_text(summary)}</description>\n")
+    lines.append(f'      <guid isPermaLink="false">{_text(post.link)}</guid>\n')
+    pub_date = post.date or default_date
+    if pub_date:
+        lines.append(f"      <pubDate>{format_rfc2822(pub_date)}</pubDate>\n")
+    lines.append("    </item>\n")
+    return ''.join(lines)
+
@@ -0,0 +1,135 @@
+"""피드별 적응형 갱신 스케줄러 (데몬 모드)"""
+import json
+from datetime import datetime, timedelta, timezone
+
+from utils.atomic_file import atomic_write
+
+# 갱신 주기 기본값 (분)
+DEFAULT_INTERVAL_MINUTES = 60
+DEFAULT_MIN_INTERVAL_MINUTES = 15
+DEFAULT_MAX_INTERVAL_MINUTES = 24 * 60
+
+# 새 항목이 있으면 주기에 곱할 값 / 변화가 없으면 곱할 값
+SPEEDUP_FACTOR = 0.5
+BACKOFF_FACTOR = 1.5
+
+
+def _parse_time(value):
+    return datetime.fromisoformat(value) if value else None
+
+
+class FeedScheduler:
+    """
+    관찰한 변화율로 피드마다 갱신 주기를 조절하는 스케줄러
+
+    실행했더니 새 항목이 있으면 주기를 절반으로 줄이고(min_interval까지),
+    변화가 없으면 1.5배로 늘립니다(max_interval까지). 실패하면 주기는 그대로 두고
+    min_interval 뒤에 다시 시도합니다. 주기와 다음 실행 시각은 state/schedule.json에
+    저장해 데몬을 다시 시작해도 이어서 씁니다.
+    """
+
+    def __init__(self, feeds, schedule_config=None, state_file='state/schedule.json'):
+        """
+        Args:
+            feeds: {feed_id: feed_config} 딕셔너리 (feed_config['schedule']로 피드별 주기 지정 가능)
+            schedule_config: config.json의 daemon 항목
+                (interval_minutes, min_interval_minutes, max_interval_minutes)
+            state_file: 스케줄 상태 파일 경로
+        """
+        schedule_config = schedule_config or {}
+        self.state_file = state_file
+        self.bounds = {}
+        saved = self._load()
+        self.feeds = {}
+
+        for feed_id, feed_config in feeds.items():
+            feed_schedule = {**schedule_config, **feed_config.get('schedule', {})}
+            interval = feed_schedule.get('interval_minutes', DEFAULT_INTERVAL_MINUTES) * 60
+            minimum = feed_schedule.get('min_interval_minutes', DEFAULT_MIN_INTERVAL_MINUTES) * 60
+            maximum = feed_schedule.get('max_interval_minutes', DEFAULT_MAX_INTERVAL_MINUTES) * 60
+            self.bounds[feed_id] = (minimum, maximum)
+
+            state = saved.get(feed_id, {})
+            self.feeds[feed_id] = {
+                'interval_seconds': min(maximum, max(minimum, state.get('interval_seconds', interval))),
+                # 처음 보는 피드는 바로 실행
+                'next_run': state.get('next_run'),
+                'last_run': state.get('last_run'),
+                'last_new_items': state.get('last_new_items'),
+                'runs': state.get('runs', 0)
+            }
+
+    def _load(self):
+        try:
+            with open(self.state_file, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save(self):
+        """스케줄 상태 저장"""
+        atomic_write(self.state_file, json.dumps(self.feeds, ensure_ascii=False, indent=2))
+
+    def due(self, now=None):
+        """
+        지금 실행할 피드
+
+        Args:
+            now: 기준 시각 (기본값: 현재)
+
+        Returns:
+            list: 피드 ID 리스트
+        """
+        now = now or datetime.now(timezone.utc)
+        return [
+            feed_id for feed_id, state in self.feeds.items()
+            if state['next_run'] is None or _parse_time(state['next_run']) <= now
+        ]
+
+    def seconds_until_next(self, now=None):
+        """
+        다음 실행까지 남은 시간
+
+        Returns:
+            float: 초 (이미 실행할 피드가 있으면 0)
+        """
+        now = now or datetime.now(timezone.utc)
+        waits = [
+            0.0 if state['next_run'] is None else (_parse_time(state['next_run']) - now).total_seconds()
+            for state in self.feeds.values()
+        ]
+        return max(0.0, min(waits)) if waits else 0.0
+
+    def record(self, feed_id, success, new_items=0, now=None):
+        """
+        실행 결과로 주기와 다음 실행 시각 갱신
+
+        Args:
+            feed_id: 피드 ID
+            success: 성공 여부 (건너뛰었으면 None)
+            new_items: 이번 실행에서 새로 본 항목 수
+            now: 기준 시각 (기본값: 현재)
+
+        Returns:
+            dict: 갱신된 피드 스케줄 상태
+        """
+        now = now or datetime.now(timezone.utc)
+        state = self.feeds[feed_id]
+        minimum, maximum = self.bounds[feed_id]
+        interval = state['interval_seconds']
+
+        if success:
+            factor = SPEEDUP_FACTOR if new_items else BACKOFF_FACTOR
+            interval = min(maximum, max(minimum, interval * factor))
+            wait = interval
+            state['last_new_items'] = new_items
+        elif success is False:
+            wait = minimum
+        else:
+            wait = interval
+
+        state['interval_seconds'] = round(interval, 1)
+        state['last_run'] = now.isoformat()
+        state['next_run'] = (now + timedelta(seconds=wait)).isoformat()
+        state['runs'] += 1
+        return state
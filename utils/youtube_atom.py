@@ -0,0 +1,68 @@
+"""유튜브 채널 Atom 피드 경량 파서"""
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+
+from utils.pipeline import FeedItem
+
+ATOM = '{http://www.w3.org/2005/Atom}'
+MEDIA = '{http://search.yahoo.com/mrss/}'
+
+
+def _parse_datetime(text):
+    """Atom 날짜(RFC 3339)를 UTC datetime으로 변환"""
+    if not text:
+        return None
+    value = datetime.fromisoformat(text.strip().replace('Z', '+00:00'))
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc).replace(microsecond=0)
+
+
+def parse_youtube_atom(content):
+    """
+    유튜브 채널 Atom 피드에서 크롤러에 필요한 필드만 추출
+
+    iterparse로 entry 하나씩 읽고 바로 버리므로 feedparser처럼 전체 문서를
+    정제하거나 FeedParserDict를 만들지 않습니다. 유튜브의 고정된 스키마
+    (entry > title, link[rel=alternate], author/name, published,
+    media:group/media:description)만 가정합니다.
+
+    Args:
+        content: 피드 본문 (bytes)
+
+    Yields:
+        FeedItem: title, link, summary, author, date(UTC datetime 또는 None)
+
+    Raises:
+        xml.etree.ElementTree.ParseError: XML 형식이 잘못된 경우
+    """
+    root = None
+    for event, elem in ET.iterparse(io.BytesIO(content), events=('start', 'end')):
+        if event == 'start':
+            if root is None:
+                root = elem
+            continue
+        if elem.tag != ATOM + 'entry':
+            continue
+
+        link = ''
+        for link_elem in elem.iterfind(ATOM + 'link'):
+            if link_elem.get('rel', 'alternate') == 'alternate':
+                link = link_elem.get('href', '')
+                break
+
+        yield FeedItem(
+            (elem.findtext(ATOM + 'title') or '').strip(),
+            link,
+            (elem.findtext(f'{MEDIA}group/{MEDIA}description') or '').strip(),
+            (elem.findtext(f'{ATOM}author/{ATOM}name') or 'Unknown').strip(),
+            _parse_datetime(elem.findtext(ATOM + 'published'))
+        )
+
+        # 처리한 entry는 메모리에서 해제
+        elem.clear()
+        try:
+            root.remove(elem)
+        except ValueError:
+            pass